@@ -15,10 +15,12 @@ class Engine:
     def run(self) -> list[Tuple]:
         executor = self.executor_factory.create_executor(self.plan)
 
-        executor.init()
-
         result: list[Tuple] = []
-        while (tup := executor.next()) is not None:
-            result.append(tup)
+        try:
+            executor.init()
+            while batch := executor.next_batch():
+                result.extend(batch)
+        finally:
+            executor.close()
 
         return result
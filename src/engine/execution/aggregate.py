@@ -1,8 +1,19 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from engine.execution.expressions.aggregate_expression import (
+    AggregateExpression,
+    AvgExpression,
+    CountExpression,
+    MaxExpression,
+    MinExpression,
+    NativeAvgExpression,
+    NativeSumExpression,
+    SumExpression,
+)
 from engine.execution.expressions.constant_expression import ConstantExpression
 from engine.execution.expressions.expression import Expression
+from type.type_enum import NUMERIC_TYPES
 from type.value import Value
 
 
@@ -23,3 +34,48 @@ class Aggregate:
 
 def get_start_count_expr() -> Expression:
     return ConstantExpression(Value.create_int(1))
+
+
+def create_aggregate_expressions(
+    aggregates: list[Aggregate],
+) -> list[AggregateExpression]:
+    values: list[AggregateExpression] = []
+    for aggr in aggregates:
+        expr = _create_native_expression(aggr)
+        if expr is not None:
+            values.append(expr)
+            continue
+
+        match aggr.type:
+            case AggregationType.SUM:
+                expr = SumExpression()
+            case AggregationType.COUNT:
+                expr = CountExpression()
+            case AggregationType.AVG:
+                expr = AvgExpression()
+            case AggregationType.MIN:
+                expr = MinExpression()
+            case AggregationType.MAX:
+                expr = MaxExpression()
+            case _:
+                pass
+        if expr is None:
+            raise TypeError(f"Unsupported aggregation operation {aggr.type}")
+        values.append(expr)
+    return values
+
+
+def _create_native_expression(aggr: Aggregate) -> AggregateExpression | None:
+    # Numeric inputs accumulate plain ints and floats, the expression type
+    # is fixed when the plan is built
+    type_id = aggr.expr.get_return_type()
+    if type_id not in NUMERIC_TYPES:
+        return None
+
+    match aggr.type:
+        case AggregationType.SUM:
+            return NativeSumExpression(type_id)
+        case AggregationType.AVG:
+            return NativeAvgExpression()
+        case _:
+            return None
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+
+DEFAULT_SORT_BUFFER_ROWS = 1_000_000
+DEFAULT_PARALLEL_SORT_MIN_ROWS = 100_000
+DEFAULT_AGGREGATE_BUFFER_GROUPS = 1_000_000
+DEFAULT_AGGREGATE_SPILL_PARTITIONS = 16
+
+
+@dataclass(frozen=True)
+class ExecutionConfig:
+    sort_buffer_rows: int = DEFAULT_SORT_BUFFER_ROWS
+    sort_buffer_bytes: int | None = None
+    spill_dir: str | None = None
+    sort_workers: int = 1
+    parallel_sort_min_rows: int = DEFAULT_PARALLEL_SORT_MIN_ROWS
+    aggregate_workers: int = 1
+    aggregate_buffer_groups: int = DEFAULT_AGGREGATE_BUFFER_GROUPS
+    aggregate_buffer_bytes: int | None = None
+    aggregate_spill_partitions: int = DEFAULT_AGGREGATE_SPILL_PARTITIONS
+
+    def __post_init__(self):
+        assert self.sort_buffer_rows > 0, (
+            f"Sort buffer must hold at least one row: {self.sort_buffer_rows}"
+        )
+        assert self.sort_buffer_bytes is None or self.sort_buffer_bytes > 0, (
+            f"Sort buffer must have a positive size: {self.sort_buffer_bytes}"
+        )
+        assert self.sort_workers > 0, (
+            f"Sort needs at least one worker: {self.sort_workers}"
+        )
+        assert self.aggregate_workers > 0, (
+            f"Aggregation needs at least one worker: {self.aggregate_workers}"
+        )
+        assert self.aggregate_buffer_groups > 0, (
+            f"Aggregation buffer must hold at least one group: {self.aggregate_buffer_groups}"
+        )
+        assert (
+            self.aggregate_buffer_bytes is None
+            or self.aggregate_buffer_bytes > 0
+        ), (
+            f"Aggregation buffer must have a positive size: {self.aggregate_buffer_bytes}"
+        )
+        assert self.aggregate_spill_partitions > 1, (
+            f"Aggregation needs at least two spill partitions: {self.aggregate_spill_partitions}"
+        )
@@ -1,17 +1,19 @@
+import sys
+import tempfile
 from collections.abc import Iterator
 from copy import deepcopy
+from itertools import islice
+from typing import BinaryIO
 
-from engine.execution.aggregate import AggregationType
+from engine.execution.aggregate import create_aggregate_expressions
+from engine.execution.config import ExecutionConfig
 from engine.execution.executors.executor import Executor
 from engine.execution.expressions.aggregate_expression import (
     AggregateExpression,
-    AvgExpression,
-    CountExpression,
-    MaxExpression,
-    MinExpression,
-    SumExpression,
 )
 from engine.execution.plan.aggregation_plan import AggregationPlan
+from storage.batch import DEFAULT_BATCH_SIZE
+from storage.row_codec import RowCodec
 from storage.tuple import Tuple
 from type.value import Value
 
@@ -19,33 +21,42 @@ from type.value import Value
 GROUP_KEY = tuple[Value, ...]
 GROUP_VALUE = list[AggregateExpression]
 
+# Past this depth partitions are aggregated in memory whatever their size
+MAX_SPILL_LEVEL = 4
+
 
 class AggregationExecutor(Executor):
-    def __init__(self, plan: AggregationPlan, child: Executor) -> None:
+    def __init__(
+        self,
+        plan: AggregationPlan,
+        child: Executor,
+        config: ExecutionConfig | None = None,
+    ) -> None:
         self._plan = plan
         self._child = child
+        self._config = config or ExecutionConfig()
         self._hash_table: dict[GROUP_KEY, GROUP_VALUE] = {}
         self._group_bys = plan.get_group_bys()
         self._aggregates = plan.get_aggregates()
         self._output_schema = plan.get_output_schema()
+        self._codec: RowCodec | None = None
+        self._partitions: list[BinaryIO] = []
 
         self._result_iterator: (
             Iterator[tuple[GROUP_KEY, GROUP_VALUE]] | None
         ) = None
 
     def init(self) -> None:
+        self._close_partitions()
         self._child.init()
 
-        while (tup := self._child.next()) is not None:
-            group_key = tuple(expr.evaluate(tup) for expr in self._group_bys)
-            if group_key not in self._hash_table:
-                self._hash_table[group_key] = self.get_initital_values()
-
-            states = self._hash_table[group_key]
-            for agg, state in zip(self._aggregates, states, strict=False):
-                state.update(agg.expr.evaluate(tup))
-
-        self._result_iterator = iter(self._hash_table.items())
+        if self._group_bys:
+            self._hash_table, partitions = self._build(self._read_child(), 0)
+        else:
+            self._hash_table, partitions = self._build_vectorized(), []
+        self._result_iterator = self._iterate_groups(
+            self._hash_table, partitions, 0
+        )
 
     def next(self) -> Tuple | None:
         if self._result_iterator is None:
@@ -56,37 +67,134 @@ class AggregationExecutor(Executor):
         except StopIteration:
             return None
 
+        return self._to_tuple(group_key, agg_values)
+
+    def next_batch(self, size: int = DEFAULT_BATCH_SIZE) -> list[Tuple]:
+        if self._result_iterator is None:
+            raise RuntimeError("Executor not initialized. Call init() first.")
+
+        return [
+            self._to_tuple(group_key, agg_values)
+            for group_key, agg_values in islice(self._result_iterator, size)
+        ]
+
+    def close(self) -> None:
+        self._hash_table = {}
+        self._result_iterator = None
+        self._close_partitions()
+        self._child.close()
+
+    def get_initital_values(self) -> list[AggregateExpression]:
+        return create_aggregate_expressions(self._aggregates)
+
+    def get_hash_table(self) -> dict[GROUP_KEY, GROUP_VALUE]:
+        return deepcopy(self._hash_table)
+
+    def get_partition_count(self) -> int:
+        return len(self._partitions)
+
+    def _read_child(self) -> Iterator[Tuple]:
+        while batch := self._child.next_batch():
+            yield from batch
+
+    def _to_tuple(
+        self, group_key: GROUP_KEY, agg_values: GROUP_VALUE
+    ) -> Tuple:
         values: list[Value] = []
         values.extend(group_key)
 
         for agg in agg_values:
             values.append(agg.finalize())
 
-        return Tuple(values, self._plan.get_output_schema())
-
-    def get_initital_values(self) -> list[AggregateExpression]:
-        values: list[AggregateExpression] = []
-        for aggr in self._aggregates:
-            expr = None
-            match aggr.type:
-                case AggregationType.SUM:
-                    expr = SumExpression()
-                case AggregationType.COUNT:
-                    expr = CountExpression()
-                case AggregationType.AVG:
-                    expr = AvgExpression()
-                case AggregationType.MIN:
-                    expr = MinExpression()
-                case AggregationType.MAX:
-                    expr = MaxExpression()
-                case _:
-                    pass
-            if expr is None:
-                raise TypeError(
-                    f"Unsupported aggregation operation {aggr.type}"
+        return Tuple(values, self._output_schema)
+
+    def _build_vectorized(self) -> dict[GROUP_KEY, GROUP_VALUE]:
+        # Without group keys every row updates the same states, so whole
+        # column vectors are folded at once
+        states: GROUP_VALUE | None = None
+        while (batch := self._child.next_record_batch()) is not None:
+            if not batch.get_row_count():
+                continue
+            if states is None:
+                states = self.get_initital_values()
+            for agg, state in zip(self._aggregates, states, strict=False):
+                state.update_vector(agg.expr.evaluate_vector(batch))
+        return {} if states is None else {(): states}
+
+    def _build(
+        self, rows: Iterator[Tuple], level: int
+    ) -> tuple[dict[GROUP_KEY, GROUP_VALUE], list[BinaryIO]]:
+        budget = self._config.aggregate_buffer_groups
+        byte_budget = self._config.aggregate_buffer_bytes
+        used = 0
+        hash_table: dict[GROUP_KEY, GROUP_VALUE] = {}
+        partitions: list[BinaryIO] = []
+
+        for tup in rows:
+            group_key = tuple(expr.evaluate(tup) for expr in self._group_bys)
+            states = hash_table.get(group_key)
+            if states is None:
+                is_full = len(hash_table) >= budget or (
+                    byte_budget is not None and used >= byte_budget
                 )
-            values.append(expr)
-        return values
+                if is_full and level < MAX_SPILL_LEVEL:
+                    # Groups already in memory keep aggregating, rows of
+                    # new groups go to disk by hash
+                    if not partitions:
+                        partitions = self._create_partitions()
+                    idx = hash((level, group_key)) % len(partitions)
+                    self._get_codec(tup).write(partitions[idx], tup)
+                    continue
+                states = self.get_initital_values()
+                hash_table[group_key] = states
+                if byte_budget is not None:
+                    used += self._get_group_footprint(group_key, states)
 
-    def get_hash_table(self) -> dict[GROUP_KEY, GROUP_VALUE]:
-        return deepcopy(self._hash_table)
+            for agg, state in zip(self._aggregates, states, strict=False):
+                state.update(agg.expr.evaluate(tup))
+
+        return hash_table, partitions
+
+    def _get_group_footprint(
+        self, group_key: GROUP_KEY, states: GROUP_VALUE
+    ) -> int:
+        return (
+            sys.getsizeof(group_key)
+            + sum(value.get_footprint() for value in group_key)
+            + sys.getsizeof(states)
+            + sum(state.get_footprint() for state in states)
+        )
+
+    def _iterate_groups(
+        self,
+        hash_table: dict[GROUP_KEY, GROUP_VALUE],
+        partitions: list[BinaryIO],
+        level: int,
+    ) -> Iterator[tuple[GROUP_KEY, GROUP_VALUE]]:
+        yield from hash_table.items()
+
+        for partition in partitions:
+            partition.seek(0)
+            assert self._codec is not None
+            rows = self._codec.read(partition)
+            table, nested = self._build(rows, level + 1)
+            partition.close()
+            yield from self._iterate_groups(table, nested, level + 1)
+
+    def _create_partitions(self) -> list[BinaryIO]:
+        partitions: list[BinaryIO] = [
+            tempfile.TemporaryFile(dir=self._config.spill_dir)
+            for _ in range(self._config.aggregate_spill_partitions)
+        ]
+        self._partitions.extend(partitions)
+        return partitions
+
+    def _get_codec(self, tup: Tuple) -> RowCodec:
+        if self._codec is None:
+            self._codec = RowCodec(tup.schema)
+        return self._codec
+
+    def _close_partitions(self) -> None:
+        for partition in self._partitions:
+            partition.close()
+        self._partitions = []
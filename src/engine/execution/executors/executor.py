@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from storage.batch import DEFAULT_BATCH_SIZE, RecordBatch, RecordBatchBuilder
 from storage.tuple import Tuple
 
 
@@ -9,3 +10,27 @@ class Executor(ABC):
 
     @abstractmethod
     def next(self) -> Tuple | None: ...
+
+    def next_batch(self, size: int = DEFAULT_BATCH_SIZE) -> list[Tuple]:
+        # Row-only operators are adapted by pulling tuples one by one,
+        # an empty batch means the input is exhausted
+        batch: list[Tuple] = []
+        while len(batch) < size and (tup := self.next()) is not None:
+            batch.append(tup)
+        return batch
+
+    def next_record_batch(
+        self, size: int = DEFAULT_BATCH_SIZE
+    ) -> RecordBatch | None:
+        # Row operators are adapted by packing their tuples into columns,
+        # None means the input is exhausted
+        rows = self.next_batch(size)
+        if not rows:
+            return None
+        builder = RecordBatchBuilder(rows[0].schema)
+        for tup in rows:
+            builder.append_row([value.get_value() for value in tup.values])
+        return builder.build()
+
+    @abstractmethod
+    def close(self) -> None: ...
@@ -1,11 +1,24 @@
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from engine.execution.config import ExecutionConfig
 from engine.execution.executors.aggregation_executor import AggregationExecutor
 from engine.execution.executors.executor import Executor
 from engine.execution.executors.filter_executor import FilterExecutor
 from engine.execution.executors.limit_executor import LimitExecutor
 from engine.execution.executors.offset_executor import OffsetExecutor
+from engine.execution.executors.parallel_aggregation_executor import (
+    ParallelAggregationExecutor,
+)
 from engine.execution.executors.projection_executor import ProjectionExecutor
 from engine.execution.executors.scan_executor import ScanExecutor
 from engine.execution.executors.sort_executor import SortExecutor
+from engine.execution.executors.streaming_aggregation_executor import (
+    StreamingAggregationExecutor,
+)
+from engine.execution.executors.top_n_executor import TopNExecutor
+from engine.execution.parallel_aggregation import find_parallel_source
 from engine.execution.plan.aggregation_plan import AggregationPlan
 from engine.execution.plan.execution_plan import ExecutionPlan
 from engine.execution.plan.filter_plan import FilterPlan
@@ -14,59 +27,83 @@ from engine.execution.plan.offset_plan import OffsetPlan
 from engine.execution.plan.projection_plan import ProjectionPlan
 from engine.execution.plan.scan_plan import ScanPlan
 from engine.execution.plan.sort_plan import SortPlan
+from engine.execution.plan.top_n_plan import TopNPlan
 from storage.reader import TableReaderFactory
 from storage.table import Table
 
 
 class ExecutorFactory:
-    def __init__(self, catalog: dict[str, Table]):
+    def __init__(
+        self,
+        catalog: dict[str, Table],
+        config: ExecutionConfig | None = None,
+    ):
         self._catalog = catalog
+        self._config = config or ExecutionConfig()
+        self._builders: dict[
+            type[ExecutionPlan], Callable[[Any], Executor]
+        ] = {
+            ScanPlan: self._create_scan_executor,
+            FilterPlan: partial(self._create_unary_executor, FilterExecutor),
+            AggregationPlan: self._create_aggregation_executor,
+            ProjectionPlan: partial(
+                self._create_unary_executor, ProjectionExecutor
+            ),
+            LimitPlan: partial(self._create_unary_executor, LimitExecutor),
+            OffsetPlan: partial(self._create_unary_executor, OffsetExecutor),
+            SortPlan: self._create_sort_executor,
+            TopNPlan: partial(self._create_unary_executor, TopNExecutor),
+        }
 
     def create_executor(self, plan: ExecutionPlan) -> Executor:
-        if isinstance(plan, ScanPlan):
-            return self._create_scan_executor(plan)
-        elif isinstance(plan, FilterPlan):
-            child_executor = self.create_executor(plan.get_child())
-            return FilterExecutor(
-                plan=plan,
-                child=child_executor,
-            )
-        elif isinstance(plan, AggregationPlan):
-            child_executor = self.create_executor(plan.get_child())
-            return AggregationExecutor(
-                plan=plan,
-                child=child_executor,
-            )
-        elif isinstance(plan, ProjectionPlan):
-            child_executor = self.create_executor(plan.get_child())
-            return ProjectionExecutor(
-                plan=plan,
-                child=child_executor,
-            )
-        if isinstance(plan, LimitPlan):
-            child_executor = self.create_executor(plan.get_child())
-            return LimitExecutor(
-                plan=plan,
-                child=child_executor,
+        build = self._builders.get(type(plan))
+        if build is None:
+            raise NotImplementedError(
+                f"Executor for {type(plan)} not implemented"
             )
-        if isinstance(plan, OffsetPlan):
-            child_executor = self.create_executor(plan.get_child())
-            return OffsetExecutor(
+        return build(plan)
+
+    def _create_unary_executor(
+        self, executor_type: Callable[..., Executor], plan: ExecutionPlan
+    ) -> Executor:
+        (child,) = plan.get_children()
+        return executor_type(plan=plan, child=self.create_executor(child))
+
+    def _create_sort_executor(self, plan: SortPlan) -> Executor:
+        return SortExecutor(
+            plan=plan,
+            child=self.create_executor(plan.get_child()),
+            config=self._config,
+        )
+
+    def _create_aggregation_executor(self, plan: AggregationPlan) -> Executor:
+        child_executor = self.create_executor(plan.get_child())
+        if plan.is_input_sorted():
+            return StreamingAggregationExecutor(
                 plan=plan,
                 child=child_executor,
             )
-        if isinstance(plan, SortPlan):
-            child_executor = self.create_executor(plan.get_child())
-            return SortExecutor(
+        if (
+            self._config.aggregate_workers > 1
+            and find_parallel_source(plan.get_child()) is not None
+        ):
+            return ParallelAggregationExecutor(
                 plan=plan,
                 child=child_executor,
+                config=self._config,
             )
-        else:
-            raise NotImplementedError(
-                f"Executor for {type(plan)} not implemented"
-            )
+        return AggregationExecutor(
+            plan=plan,
+            child=child_executor,
+            config=self._config,
+        )
 
     def _create_scan_executor(self, plan: ScanPlan) -> ScanExecutor:
         return ScanExecutor(
-            plan, TableReaderFactory.create_reader(plan.get_table())
+            plan,
+            TableReaderFactory.create_reader(
+                plan.get_table(),
+                columns=plan.get_column_indices(),
+                predicates=plan.get_predicates(),
+            ),
         )
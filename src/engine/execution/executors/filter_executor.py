@@ -1,6 +1,10 @@
 from engine.execution.executors.executor import Executor
+from engine.execution.expressions.compiler import compile_predicate
+from engine.execution.kernels import select
 from engine.execution.plan.filter_plan import FilterPlan
+from storage.batch import DEFAULT_BATCH_SIZE, RecordBatch
 from storage.tuple import Tuple
+from type.type_enum import TypeEnum
 
 
 class FilterExecutor(Executor):
@@ -8,15 +12,38 @@ class FilterExecutor(Executor):
         super().__init__()
         self._plan = plan
         self._child = child
+        self._predicate = plan.get_predicate()
+        self._accepts = compile_predicate(self._predicate)
 
     def init(self) -> None:
         self._child.init()
 
     def next(self) -> Tuple | None:
         while (tup := self._child.next()) is not None:
-            result = self._plan.get_predicate().evaluate(tup)
-            if result.is_null():
-                continue
-            if result.to_boolean().get_value():
+            if self._accepts(tup):
                 return tup
         return None
+
+    def next_batch(self, size: int = DEFAULT_BATCH_SIZE) -> list[Tuple]:
+        while batch := self._child.next_batch(size):
+            result = [tup for tup in batch if self._accepts(tup)]
+            if result:
+                return result
+        return []
+
+    def next_record_batch(
+        self, size: int = DEFAULT_BATCH_SIZE
+    ) -> RecordBatch | None:
+        if self._predicate.get_return_type() != TypeEnum.BOOLEAN:
+            return super().next_record_batch(size)
+
+        while (batch := self._child.next_record_batch(size)) is not None:
+            selected = select(self._predicate.evaluate_vector(batch))
+            if len(selected) == batch.get_row_count():
+                return batch
+            if selected:
+                return batch.take(selected)
+        return None
+
+    def close(self) -> None:
+        self._child.close()
@@ -1,5 +1,6 @@
 from engine.execution.executors.executor import Executor
 from engine.execution.plan.limit_plan import LimitPlan
+from storage.batch import DEFAULT_BATCH_SIZE
 from storage.tuple import Tuple
 
 
@@ -18,13 +19,28 @@ class LimitExecutor(Executor):
         self._child.init()
 
     def next(self) -> Tuple | None:
-        if self._limit == 0:
+        if self._count >= self._limit:
             return None
 
         tup = self._child.next()
         if tup is None:
             return None
-        if self._count >= self._limit:
-            return None
         self._count += 1
+        if self._count >= self._limit:
+            # Stop reading the input as soon as the limit is reached
+            self._child.close()
         return tup
+
+    def next_batch(self, size: int = DEFAULT_BATCH_SIZE) -> list[Tuple]:
+        remaining = self._limit - self._count
+        if remaining <= 0:
+            return []
+
+        batch = self._child.next_batch(min(size, remaining))
+        self._count += len(batch)
+        if batch and self._count >= self._limit:
+            self._child.close()
+        return batch
+
+    def close(self) -> None:
+        self._child.close()
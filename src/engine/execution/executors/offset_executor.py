@@ -1,5 +1,6 @@
 from engine.execution.executors.executor import Executor
 from engine.execution.plan.offset_plan import OffsetPlan
+from storage.batch import DEFAULT_BATCH_SIZE
 from storage.tuple import Tuple
 
 
@@ -21,3 +22,16 @@ class OffsetExecutor(Executor):
                 continue
             return tup
         return None
+
+    def next_batch(self, size: int = DEFAULT_BATCH_SIZE) -> list[Tuple]:
+        while batch := self._child.next_batch(size):
+            skip = min(self._offset - self._count, len(batch))
+            if skip > 0:
+                self._count += skip
+                batch = batch[skip:]
+            if batch:
+                return batch
+        return []
+
+    def close(self) -> None:
+        self._child.close()
@@ -0,0 +1,77 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from engine.execution.config import ExecutionConfig
+from engine.execution.executors.aggregation_executor import AggregationExecutor
+from engine.execution.executors.executor import Executor
+from engine.execution.parallel_aggregation import (
+    PartialAggregationTask,
+    aggregate_byte_range,
+    find_parallel_source,
+    merge_partial_aggregate,
+)
+from engine.execution.plan.aggregation_plan import AggregationPlan
+from storage.byte_range import DEFAULT_CHUNK_SIZE, split_byte_ranges
+from storage.decoder import RowDecoder
+from type.registry import register_types
+
+
+class ParallelAggregationExecutor(AggregationExecutor):
+    def __init__(
+        self,
+        plan: AggregationPlan,
+        child: Executor,
+        config: ExecutionConfig | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        super().__init__(plan, child, config)
+        source = find_parallel_source(plan.get_child())
+        assert source is not None, (
+            f"Parallel aggregation needs a CSV scan input: {plan.get_child()}"
+        )
+        self._table = source.table
+        self._scan_plan = source.scan_plan
+        self._predicate = source.predicate
+        self._workers = self._config.aggregate_workers
+        self._chunk_size = chunk_size
+
+    def init(self) -> None:
+        ranges = split_byte_ranges(
+            self._table.get_path(),
+            self._chunk_size,
+            self._table.get_skip_first(),
+        )
+        # Partials are merged in memory, only the serial path spills
+        if len(ranges) <= 1:
+            # A single chunk isn't worth the worker start-up
+            super().init()
+            return
+
+        self._close_partitions()
+        task = PartialAggregationTask(
+            self._table.get_path(),
+            RowDecoder(
+                self._table.get_schema(),
+                self._scan_plan.get_column_indices(),
+                self._scan_plan.get_predicates(),
+            ),
+            self._predicate,
+            self._group_bys,
+            self._aggregates,
+        )
+        self._hash_table = {}
+        pool = ProcessPoolExecutor(
+            max_workers=self._workers, initializer=register_types
+        )
+        try:
+            # Partials are merged in file order, so groups keep the order
+            # in which a serial scan first meets them
+            partials = pool.map(partial(aggregate_byte_range, task), ranges)
+            for result in partials:
+                merge_partial_aggregate(
+                    self._hash_table, result, self._aggregates
+                )
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        self._result_iterator = iter(self._hash_table.items())
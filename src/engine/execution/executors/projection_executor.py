@@ -1,5 +1,6 @@
 from engine.execution.executors.executor import Executor
 from engine.execution.plan.projection_plan import ProjectionPlan
+from storage.batch import DEFAULT_BATCH_SIZE
 from storage.tuple import Tuple
 
 
@@ -21,5 +22,14 @@ class ProjectionExecutor(Executor):
         if input_tuple is None:
             return None
 
-        values = [expr.evaluate(input_tuple) for expr in self._expressions]
+        return self._project(input_tuple)
+
+    def next_batch(self, size: int = DEFAULT_BATCH_SIZE) -> list[Tuple]:
+        return [self._project(tup) for tup in self._child.next_batch(size)]
+
+    def close(self) -> None:
+        self._child.close()
+
+    def _project(self, tup: Tuple) -> Tuple:
+        values = [expr.evaluate(tup) for expr in self._expressions]
         return Tuple(values, self._output_schema)
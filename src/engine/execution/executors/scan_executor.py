@@ -1,7 +1,9 @@
-from collections.abc import Iterator
+from collections.abc import Generator, Iterator
+from itertools import islice
 
 from engine.execution.executors.executor import Executor
 from engine.execution.plan.scan_plan import ScanPlan
+from storage.batch import DEFAULT_BATCH_SIZE, RecordBatch
 from storage.reader import TableReader
 from storage.tuple import Tuple
 
@@ -12,9 +14,11 @@ class ScanExecutor(Executor):
         self._plan = plan
         self._reader = reader
         self._iterator = None
+        self._batches: Iterator[RecordBatch] | None = None
 
     def init(self) -> None:
         self._iterator = self._reader.read()
+        self._batches = None
 
     def next(self) -> Tuple | None:
         if self._iterator is None:
@@ -25,6 +29,30 @@ class ScanExecutor(Executor):
         except StopIteration:
             return None
 
+    def next_batch(self, size: int = DEFAULT_BATCH_SIZE) -> list[Tuple]:
+        if self._iterator is None:
+            raise RuntimeError("Executor not initialized. Call init() first.")
+        return list(islice(self._iterator, size))
+
+    def next_record_batch(
+        self, size: int = DEFAULT_BATCH_SIZE
+    ) -> RecordBatch | None:
+        if self._iterator is None:
+            raise RuntimeError("Executor not initialized. Call init() first.")
+        # Columnar readers, such as the column cache, hand their batches
+        # over without building tuples
+        if self._batches is None:
+            self._batches = self._reader.read_batches(size)
+        return next(self._batches, None)
+
+    def close(self) -> None:
+        # Closing the reader generator releases its file handle or pool
+        for iterator in (self._iterator, self._batches):
+            if isinstance(iterator, Generator):
+                iterator.close()
+        self._iterator = None
+        self._batches = None
+
     def get_iterator(self) -> Iterator[Tuple]:
         if self._iterator is None:
             raise RuntimeError("Executor not initialized. Call init() first.")
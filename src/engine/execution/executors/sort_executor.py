@@ -1,34 +1,126 @@
+import heapq
+import tempfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO
+
+from engine.execution.config import ExecutionConfig
 from engine.execution.executors.executor import Executor
+from engine.execution.parallel_sort import parallel_argsort
 from engine.execution.plan.sort_plan import SortPlan
+from engine.execution.sort_key import SortKey, build_sort_key
+from storage.row_codec import RowCodec
 from storage.tuple import Tuple
 
 
 class SortExecutor(Executor):
-    def __init__(self, plan: SortPlan, child: Executor) -> None:
+    def __init__(
+        self,
+        plan: SortPlan,
+        child: Executor,
+        config: ExecutionConfig | None = None,
+    ) -> None:
         self._plan = plan
         self._order_by = plan.get_order_by()
+        self._sort_key: Callable[[Tuple], SortKey] | None = None
         self._child = child
+        self._config = config or ExecutionConfig()
+        self._codec = RowCodec(plan.get_output_schema())
         self._sorted: list[Tuple] | None = None
         self._idx = 0
+        self._runs: list[BinaryIO] = []
+        self._merged: Iterator[Tuple] | None = None
+        self._pool: ProcessPoolExecutor | None = None
 
     def init(self) -> None:
+        self._close_runs()
+        self._sort_key = build_sort_key(
+            self._order_by, self._plan.get_output_schema()
+        )
         self._child.init()
+        budget = self._config.sort_buffer_rows
+        byte_budget = self._config.sort_buffer_bytes
+        used = 0
         rows: list[Tuple] = []
-        while (tup := self._child.next()) is not None:
-            rows.append(tup)
-        rows.sort(
-            key=lambda t: [
-                expr.evaluate(t).get_value() for expr in self._order_by
-            ]
-        )
-        self._sorted = rows
+        try:
+            while (tup := self._child.next()) is not None:
+                rows.append(tup)
+                if byte_budget is not None:
+                    used += tup.get_footprint()
+                if len(rows) >= budget or (
+                    byte_budget is not None and used >= byte_budget
+                ):
+                    self._spill(rows)
+                    rows = []
+                    used = 0
+            rows = self._sort_rows(rows)
+        finally:
+            self._shutdown_pool()
+
+        if self._runs:
+            # Runs hold consecutive input rows, and heapq.merge prefers
+            # earlier iterables on ties, so the merge stays stable
+            self._merged = heapq.merge(
+                *(self._codec.read(run) for run in self._runs),
+                rows,
+                key=self._sort_key,
+            )
+            self._sorted = []
+        else:
+            self._sorted = rows
         self._idx = 0
 
     def next(self) -> Tuple | None:
         if self._sorted is None:
             raise RuntimeError("Executor not initialized. Call init() first.")
+        if self._merged is not None:
+            return next(self._merged, None)
         if self._idx >= len(self._sorted):
             return None
         tup = self._sorted[self._idx]
         self._idx += 1
         return tup
+
+    def close(self) -> None:
+        self._sorted = None
+        self._close_runs()
+        self._child.close()
+
+    def get_run_count(self) -> int:
+        return len(self._runs)
+
+    def _sort_rows(self, rows: list[Tuple]) -> list[Tuple]:
+        workers = self._config.sort_workers
+        if workers == 1 or len(rows) < self._config.parallel_sort_min_rows:
+            rows.sort(key=self._sort_key)
+            return rows
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=workers)
+        # Only the native keys travel to the workers, rows stay here
+        keys = [self._sort_key(tup) for tup in rows]  # type: ignore
+        order = parallel_argsort(keys, self._pool, workers)
+        return [rows[i] for i in order]
+
+    def _shutdown_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def _spill(self, rows: list[Tuple]) -> None:
+        rows = self._sort_rows(rows)
+        run = tempfile.TemporaryFile(dir=self._config.spill_dir)
+        try:
+            for tup in rows:
+                self._codec.write(run, tup)
+            run.seek(0)
+        except BaseException:
+            run.close()
+            raise
+        self._runs.append(run)
+
+    def _close_runs(self) -> None:
+        self._merged = None
+        for run in self._runs:
+            run.close()
+        self._runs = []
@@ -0,0 +1,73 @@
+from engine.execution.aggregate import create_aggregate_expressions
+from engine.execution.executors.aggregation_executor import (
+    GROUP_KEY,
+    GROUP_VALUE,
+)
+from engine.execution.executors.executor import Executor
+from engine.execution.plan.aggregation_plan import AggregationPlan
+from storage.tuple import Tuple
+from type.value import Value
+
+
+class StreamingAggregationExecutor(Executor):
+    def __init__(self, plan: AggregationPlan, child: Executor) -> None:
+        self._plan = plan
+        self._child = child
+        self._group_bys = plan.get_group_bys()
+        self._aggregates = plan.get_aggregates()
+        self._output_schema = plan.get_output_schema()
+        self._group_key: GROUP_KEY | None = None
+        self._states: GROUP_VALUE | None = None
+        self._initialized = False
+        self._exhausted = False
+
+    def init(self) -> None:
+        self._child.init()
+        self._group_key = None
+        self._states = None
+        self._initialized = True
+        self._exhausted = False
+
+    def next(self) -> Tuple | None:
+        if not self._initialized:
+            raise RuntimeError("Executor not initialized. Call init() first.")
+        if self._exhausted:
+            return None
+
+        # Input is ordered on the group key, so a key change closes a group
+        while (tup := self._child.next()) is not None:
+            group_key = tuple(expr.evaluate(tup) for expr in self._group_bys)
+            if self._states is not None and group_key == self._group_key:
+                self._update(tup)
+                continue
+
+            finished = self._finish_group()
+            self._group_key = group_key
+            self._states = create_aggregate_expressions(self._aggregates)
+            self._update(tup)
+            if finished is not None:
+                return finished
+
+        self._exhausted = True
+        return self._finish_group()
+
+    def close(self) -> None:
+        self._group_key = None
+        self._states = None
+        self._initialized = False
+        self._child.close()
+
+    def _update(self, tup: Tuple) -> None:
+        assert self._states is not None
+        for agg, state in zip(self._aggregates, self._states, strict=True):
+            state.update(agg.expr.evaluate(tup))
+
+    def _finish_group(self) -> Tuple | None:
+        if self._group_key is None or self._states is None:
+            return None
+
+        values: list[Value] = list(self._group_key)
+        values.extend(state.finalize() for state in self._states)
+        self._group_key = None
+        self._states = None
+        return Tuple(values, self._output_schema)
@@ -0,0 +1,50 @@
+import heapq
+from collections.abc import Callable, Iterator
+
+from engine.execution.executors.executor import Executor
+from engine.execution.plan.top_n_plan import TopNPlan
+from engine.execution.sort_key import SortKey, build_sort_key
+from storage.tuple import Tuple
+
+
+class TopNExecutor(Executor):
+    def __init__(self, plan: TopNPlan, child: Executor) -> None:
+        self._plan = plan
+        self._n = plan.get_n()
+        self._order_by = plan.get_order_by()
+        self._sort_key: Callable[[Tuple], SortKey] | None = None
+        self._child = child
+        self._top: list[Tuple] | None = None
+        self._idx = 0
+
+    def init(self) -> None:
+        self._idx = 0
+        if self._n == 0:
+            self._top = []
+            return
+
+        self._sort_key = build_sort_key(
+            self._order_by, self._plan.get_output_schema()
+        )
+        self._child.init()
+        # nsmallest keeps a heap of n rows and is stable like list.sort
+        self._top = heapq.nsmallest(
+            self._n, self._read_child(), key=self._sort_key
+        )
+
+    def next(self) -> Tuple | None:
+        if self._top is None:
+            raise RuntimeError("Executor not initialized. Call init() first.")
+        if self._idx >= len(self._top):
+            return None
+        tup = self._top[self._idx]
+        self._idx += 1
+        return tup
+
+    def close(self) -> None:
+        self._top = None
+        self._child.close()
+
+    def _read_child(self) -> Iterator[Tuple]:
+        while (tup := self._child.next()) is not None:
+            yield tup
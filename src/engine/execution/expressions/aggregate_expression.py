@@ -1,16 +1,47 @@
+import sys
 from abc import ABC, abstractmethod
 
-from type.type_enum import TypeEnum
+from engine.execution.kernels import (
+    count,
+    max_value,
+    min_value,
+    sum_values,
+)
+from storage.vector import ColumnVector
+from type.type_enum import NUMERIC_TYPES, TypeEnum
 from type.value import Value
 
 
+AggregateState = tuple[object, ...]
+
+
 class AggregateExpression(ABC):
     @abstractmethod
     def update(self, val: Value) -> None: ...
 
+    def update_vector(self, vector: ColumnVector) -> None:
+        for val in vector.to_values():
+            self.update(val)
+
     @abstractmethod
     def finalize(self) -> Value: ...
 
+    @abstractmethod
+    def get_state(self) -> AggregateState: ...
+
+    @abstractmethod
+    def merge_state(self, state: AggregateState) -> None: ...
+
+    def merge(self, other: "AggregateExpression") -> None:
+        self.merge_state(other.get_state())
+
+    def get_footprint(self) -> int:
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(vars(self))
+            + sum(sys.getsizeof(val) for val in self.get_state())
+        )
+
 
 class CountExpression(AggregateExpression):
     def __init__(self):
@@ -21,9 +52,19 @@ class CountExpression(AggregateExpression):
             return
         self._count += 1
 
+    def update_vector(self, vector: ColumnVector) -> None:
+        self._count += count(vector)
+
     def finalize(self) -> Value:
         return Value.create_int(self._count)
 
+    def get_state(self) -> AggregateState:
+        return (self._count,)
+
+    def merge_state(self, state: AggregateState) -> None:
+        (count,) = state
+        self._count += count  # type: ignore
+
 
 class AvgExpression(AggregateExpression):
     def __init__(self):
@@ -41,6 +82,17 @@ class AvgExpression(AggregateExpression):
             return Value.create_null_from_type_id(TypeEnum.DECIMAL)
         return self._sum.divide(Value.create_int(self._count))
 
+    def get_state(self) -> AggregateState:
+        return (self._count, self._sum)
+
+    def merge_state(self, state: AggregateState) -> None:
+        count, total = state
+        if total is None:
+            return
+        assert isinstance(total, Value)
+        self._count += count  # type: ignore
+        self._sum = total if self._sum is None else self._sum.add(total)
+
 
 class SumExpression(AggregateExpression):
     def __init__(self):
@@ -56,6 +108,15 @@ class SumExpression(AggregateExpression):
             return Value.create_null_from_type_id(TypeEnum.DECIMAL)
         return self._sum
 
+    def get_state(self) -> AggregateState:
+        return (self._sum,)
+
+    def merge_state(self, state: AggregateState) -> None:
+        (total,) = state
+        if total is not None:
+            assert isinstance(total, Value)
+            self.update(total)
+
 
 class MaxExpression(AggregateExpression):
     def __init__(self):
@@ -66,11 +127,25 @@ class MaxExpression(AggregateExpression):
             return
         self._max = val if self._max is None else self._max.max(val)
 
+    def update_vector(self, vector: ColumnVector) -> None:
+        val = max_value(vector)
+        if val is not None:
+            self.update(Value(vector.get_type_id(), val))
+
     def finalize(self) -> Value:
         if self._max is None:
             return Value.create_null_from_type_id(TypeEnum.DECIMAL)
         return self._max
 
+    def get_state(self) -> AggregateState:
+        return (self._max,)
+
+    def merge_state(self, state: AggregateState) -> None:
+        (val,) = state
+        if val is not None:
+            assert isinstance(val, Value)
+            self.update(val)
+
 
 class MinExpression(AggregateExpression):
     def __init__(self):
@@ -81,7 +156,78 @@ class MinExpression(AggregateExpression):
             return
         self._min = val if self._min is None else self._min.min(val)
 
+    def update_vector(self, vector: ColumnVector) -> None:
+        val = min_value(vector)
+        if val is not None:
+            self.update(Value(vector.get_type_id(), val))
+
     def finalize(self) -> Value:
         if self._min is None:
             return Value.create_null_from_type_id(TypeEnum.DECIMAL)
         return self._min
+
+    def get_state(self) -> AggregateState:
+        return (self._min,)
+
+    def merge_state(self, state: AggregateState) -> None:
+        (val,) = state
+        if val is not None:
+            assert isinstance(val, Value)
+            self.update(val)
+
+
+class NativeSumExpression(AggregateExpression):
+    def __init__(self, type_id: TypeEnum):
+        assert type_id in NUMERIC_TYPES, f"Sum of {type_id} is not numeric"
+        self._type_id = type_id
+        self._sum: int | float | None = None
+
+    def update(self, val: Value) -> None:
+        raw = val.get_value()
+        if raw is None:
+            return
+        self._sum = raw if self._sum is None else self._sum + raw  # type: ignore
+
+    def update_vector(self, vector: ColumnVector) -> None:
+        self.merge_state((sum_values(vector),))
+
+    def finalize(self) -> Value:
+        return Value(self._type_id, self._sum)
+
+    def get_state(self) -> AggregateState:
+        return (self._sum,)
+
+    def merge_state(self, state: AggregateState) -> None:
+        (total,) = state
+        if total is None:
+            return
+        self._sum = total if self._sum is None else self._sum + total  # type: ignore
+
+
+class NativeAvgExpression(AggregateExpression):
+    def __init__(self):
+        self._count = 0
+        self._sum: int | float = 0
+
+    def update(self, val: Value) -> None:
+        raw = val.get_value()
+        if raw is None:
+            return
+        self._count += 1
+        self._sum += raw  # type: ignore
+
+    def update_vector(self, vector: ColumnVector) -> None:
+        self.merge_state((count(vector), sum_values(vector) or 0))
+
+    def finalize(self) -> Value:
+        if self._count == 0:
+            return Value.create_null_from_type_id(TypeEnum.DECIMAL)
+        return Value.create_decimal(self._sum / self._count)
+
+    def get_state(self) -> AggregateState:
+        return (self._count, self._sum)
+
+    def merge_state(self, state: AggregateState) -> None:
+        count, total = state
+        self._count += count  # type: ignore
+        self._sum += total  # type: ignore
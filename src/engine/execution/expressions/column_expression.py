@@ -1,5 +1,7 @@
-from storage.schema import Column
+from storage.batch import RecordBatch
+from storage.schema import Column, Schema
 from storage.tuple import Tuple
+from storage.vector import ColumnVector
 from type.type_enum import TypeEnum
 from type.value import Value
 
@@ -7,12 +9,33 @@ from .expression import Expression
 
 
 class ColumnExpression(Expression):
-    def __init__(self, column: Column):
+    def __init__(self, column: Column, index: int | None = None):
         super().__init__([])
         self._column = column
+        self._index = index
 
     def evaluate(self, tup: Tuple) -> Value:
-        return tup.get_value_by_name(self._column.name)
+        if self._index is None:
+            return tup.get_value_by_name(self._column.name)
+        return tup.values[self._index]
+
+    def evaluate_vector(self, batch: RecordBatch) -> ColumnVector:
+        if self._index is None:
+            return ColumnVector.from_batch(
+                batch.get_column_by_name(self._column.name)
+            )
+        return ColumnVector.from_batch(batch.get_column(self._index))
+
+    def bind(self, schema: Schema) -> "ColumnExpression":
+        return ColumnExpression(
+            self._column, schema.get_column_idx(self._column.name)
+        )
+
+    def get_index(self) -> int | None:
+        return self._index
+
+    def is_bound(self) -> bool:
+        return self._index is not None
 
     def get_return_type(self) -> TypeEnum:
         return self._column.get_type_id()
@@ -1,8 +1,13 @@
+from engine.execution.kernels import compare
+from storage.batch import RecordBatch
+from storage.schema import Schema
 from storage.tuple import Tuple
+from storage.vector import ColumnVector
 from type.enums import ComparisonOperandEnum
 from type.type_enum import TypeEnum
 from type.value import Value
 
+from .constant_expression import ConstantExpression
 from .expression import Expression
 
 
@@ -20,12 +25,32 @@ class ComparisonExpression(Expression):
         rhs = self._right.evaluate(tup)
         return Value.create_boolean(lhs.compare(rhs, self._op))
 
+    def evaluate_vector(self, batch: RecordBatch) -> ColumnVector:
+        lhs = self._left.evaluate_vector(batch)
+        # Constants are compared as scalars instead of broadcast vectors
+        rhs = (
+            self._right.get_value()
+            if isinstance(self._right, ConstantExpression)
+            else self._right.evaluate_vector(batch)
+        )
+        return compare(lhs, rhs, self._op)
+
+    def bind(self, schema: Schema) -> "ComparisonExpression":
+        left = self._left.bind(schema)
+        right = self._right.bind(schema)
+        if isinstance(right, ConstantExpression):
+            right = right.coerce(left.get_return_type())
+        return ComparisonExpression(left, right, self._op)
+
     def get_left(self) -> Expression:
         return self._left
 
     def get_right(self) -> Expression:
         return self._right
 
+    def get_op(self) -> ComparisonOperandEnum:
+        return self._op
+
     def get_return_type(self) -> TypeEnum:
         return TypeEnum.BOOLEAN
 
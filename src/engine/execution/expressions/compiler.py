@@ -0,0 +1,91 @@
+from collections.abc import Callable
+
+from storage.tuple import Tuple
+from type.type import Type
+from type.type_enum import NUMERIC_TYPES, TypeEnum
+
+from .column_expression import ColumnExpression
+from .comparison_expression import ComparisonExpression
+from .constant_expression import ConstantExpression
+from .expression import Expression
+
+
+NativeFn = Callable[[Tuple], object]
+PredicateFn = Callable[[Tuple], bool]
+
+
+def compile_expression(expr: Expression) -> NativeFn:
+    match expr:
+        case ColumnExpression() if expr.is_bound():
+            idx = expr.get_index()
+            return lambda tup: tup.values[idx].get_value()  # type: ignore
+        case ConstantExpression():
+            val = expr.get_value().get_value()
+            return lambda tup: val
+        case ComparisonExpression() if _is_comparable(expr):
+            return _compile_comparison(expr)
+        case _:
+            pass
+
+    # Anything else is evaluated through the expression tree
+    return lambda tup: expr.evaluate(tup).get_value()
+
+
+def compile_predicate(expr: Expression) -> PredicateFn:
+    if expr.get_return_type() != TypeEnum.BOOLEAN:
+        return _evaluate_predicate(expr)
+
+    native = compile_expression(expr)
+    # NULL never passes a filter
+    return lambda tup: native(tup) is True
+
+
+def _compile_comparison(expr: ComparisonExpression) -> NativeFn:
+    left = expr.get_left()
+    right = expr.get_right()
+    compare = Type.get_comparator(
+        left.get_return_type(), right.get_return_type(), expr.get_op()
+    )
+    lhs = compile_expression(left)
+
+    if isinstance(right, ConstantExpression):
+        const = right.get_value().get_value()
+        if const is None:
+            return lambda tup: None
+
+        def compare_constant(tup: Tuple) -> object:
+            val = lhs(tup)
+            if val is None:
+                return None
+            return compare(val, const)
+
+        return compare_constant
+
+    rhs = compile_expression(right)
+
+    def compare_values(tup: Tuple) -> object:
+        lval = lhs(tup)
+        rval = rhs(tup)
+        if lval is None or rval is None:
+            return None
+        return compare(lval, rval)
+
+    return compare_values
+
+
+def _is_comparable(expr: ComparisonExpression) -> bool:
+    left_type = expr.get_left().get_return_type()
+    right_type = expr.get_right().get_return_type()
+    return left_type == right_type or (
+        left_type in NUMERIC_TYPES and right_type in NUMERIC_TYPES
+    )
+
+
+def _evaluate_predicate(expr: Expression) -> PredicateFn:
+    def predicate(tup: Tuple) -> bool:
+        result = expr.evaluate(tup)
+        if result.is_null():
+            return False
+        return bool(result.to_boolean().get_value())
+
+    return predicate
@@ -1,5 +1,7 @@
+from storage.batch import RecordBatch
 from storage.tuple import Tuple
-from type.type_enum import TypeEnum
+from storage.vector import ColumnVector
+from type.type_enum import NUMERIC_TYPES, TypeEnum
 from type.value import Value
 
 from .expression import Expression
@@ -13,6 +15,32 @@ class ConstantExpression(Expression):
     def evaluate(self, tup: Tuple) -> Value:
         return self._value
 
+    def evaluate_vector(self, batch: RecordBatch) -> ColumnVector:
+        return ColumnVector.from_constant(self._value, batch.get_row_count())
+
+    def coerce(self, type_id: TypeEnum) -> "ConstantExpression":
+        # Numeric constants take the type of the other operand when that
+        # loses nothing, so the comparison is between native values of
+        # one type
+        val = self._value.get_value()
+        if (
+            val is None
+            or self.get_return_type() == type_id
+            or self.get_return_type() not in NUMERIC_TYPES
+            or type_id not in NUMERIC_TYPES
+        ):
+            return self
+
+        if type_id == TypeEnum.INT:
+            if not float(val).is_integer():  # type: ignore
+                return self
+            return ConstantExpression(Value(type_id, int(val)))  # type: ignore
+
+        coerced = float(val)  # type: ignore
+        if coerced != val:
+            return self
+        return ConstantExpression(Value(type_id, coerced))
+
     def get_value(self) -> Value:
         return self._value
 
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 
+from storage.batch import RecordBatch
+from storage.schema import Schema
 from storage.tuple import Tuple
+from storage.vector import ColumnVector
 from type.type_enum import TypeEnum
 from type.value import Value
 
@@ -12,9 +15,18 @@ class Expression(ABC):
     @abstractmethod
     def evaluate(self, tup: Tuple) -> Value: ...
 
+    def evaluate_vector(self, batch: RecordBatch) -> ColumnVector:
+        return ColumnVector.from_natives(
+            self.get_return_type(),
+            [self.evaluate(tup).get_value() for tup in batch.to_tuples()],
+        )
+
     @abstractmethod
     def get_return_type(self) -> TypeEnum: ...
 
+    def bind(self, schema: Schema) -> "Expression":
+        return self
+
     def get_children(self) -> list["Expression"]:
         return self._children.copy()
 
@@ -0,0 +1,202 @@
+import operator
+from collections.abc import Callable
+
+from storage.vector import ColumnVector
+from type.enums import ComparisonOperandEnum, ModificationOperandEnum
+from type.type import Type
+from type.type_enum import NUMERIC_TYPES, TypeEnum
+from type.value import Value
+
+
+try:
+    import numpy as np
+except ImportError:
+    # Only vectors backed by NumPy arrays reach the NumPy branches
+    pass
+
+
+Operand = ColumnVector | Value
+
+_MODIFICATIONS: dict[
+    ModificationOperandEnum, Callable[[object, object], object]
+] = {
+    ModificationOperandEnum.ADD: operator.add,
+    ModificationOperandEnum.SUB: operator.sub,
+    ModificationOperandEnum.MULT: operator.mul,
+    ModificationOperandEnum.DIV: operator.truediv,
+}
+
+# Integer sums that may leave this range are added as Python ints
+_I64_LIMIT = 2**63
+
+
+def compare(
+    left: ColumnVector, right: Operand, op: ComparisonOperandEnum
+) -> ColumnVector:
+    # The comparators are plain operators, so they apply elementwise to
+    # NumPy arrays as well
+    compare_op = Type.get_comparator(
+        left.get_type_id(), right.get_type_id(), op
+    )
+    if _is_null(right):
+        return _create_nulls(TypeEnum.BOOLEAN, len(left))
+
+    if _is_numpy(left, right):
+        data = compare_op(left.get_data(), _get_numpy_data(right))
+        return ColumnVector(
+            TypeEnum.BOOLEAN,
+            np.asarray(data, dtype=bool),
+            _get_numpy_validity(left, right),
+        )
+
+    results: list[object] = []
+    for lval, rval in zip(
+        left.to_natives(), _get_natives(right, len(left)), strict=True
+    ):
+        if lval is None or rval is None:
+            results.append(None)
+        else:
+            results.append(compare_op(lval, rval))
+    return ColumnVector.from_natives(TypeEnum.BOOLEAN, results)
+
+
+def modify(
+    left: ColumnVector, right: Operand, op: ModificationOperandEnum
+) -> ColumnVector:
+    if not (
+        left.get_type_id() in NUMERIC_TYPES
+        and right.get_type_id() in NUMERIC_TYPES
+    ):
+        raise TypeError("Values are not numeric")
+
+    modify_op = _MODIFICATIONS.get(op)
+    if modify_op is None:
+        raise ValueError(f"Unsupported modification operator: {op}")
+    if _is_null(right):
+        return _create_nulls(TypeEnum.DECIMAL, len(left))
+
+    # Arithmetic yields decimals and division by zero yields NaN, like
+    # Type.modify does
+    if _is_numpy(left, right):
+        lhs = left.get_data().astype("float64")
+        rhs = np.asarray(_get_numpy_data(right), dtype="float64")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            data = modify_op(lhs, rhs)
+        if op == ModificationOperandEnum.DIV:
+            data = np.where(rhs == 0, np.nan, data)
+        return ColumnVector(
+            TypeEnum.DECIMAL,
+            np.asarray(data, dtype="float64"),
+            _get_numpy_validity(left, right),
+        )
+
+    results: list[object] = []
+    for lval, rval in zip(
+        left.to_natives(), _get_natives(right, len(left)), strict=True
+    ):
+        if lval is None or rval is None:
+            results.append(None)
+        elif op == ModificationOperandEnum.DIV and rval == 0:
+            results.append(float("nan"))
+        else:
+            results.append(modify_op(float(lval), float(rval)))  # type: ignore
+    return ColumnVector.from_natives(TypeEnum.DECIMAL, results)
+
+
+def count(vector: ColumnVector) -> int:
+    if vector.is_numpy():
+        return int(np.count_nonzero(vector.get_validity()))
+    return sum(1 for valid in vector.get_validity() if valid)
+
+
+def sum_values(vector: ColumnVector) -> int | float | None:
+    type_id = vector.get_type_id()
+    if type_id not in NUMERIC_TYPES:
+        raise TypeError("Values are not numeric")
+
+    if vector.is_numpy():
+        valid = vector.get_data()[vector.get_validity()]
+        if not len(valid):
+            return None
+        if type_id == TypeEnum.DECIMAL:
+            return float(valid.sum())
+        bound = max(abs(int(valid.min())), abs(int(valid.max())))
+        if bound * len(valid) < _I64_LIMIT:
+            return int(valid.sum())
+        return sum(int(val) for val in valid)
+
+    natives = [val for val in vector.to_natives() if val is not None]
+    if not natives:
+        return None
+    return sum(natives)  # type: ignore
+
+
+def min_value(vector: ColumnVector) -> object:
+    if vector.is_numpy():
+        valid = vector.get_data()[vector.get_validity()]
+        return _to_native(valid.min()) if len(valid) else None
+    natives = [val for val in vector.to_natives() if val is not None]
+    return min(natives) if natives else None  # type: ignore
+
+
+def max_value(vector: ColumnVector) -> object:
+    if vector.is_numpy():
+        valid = vector.get_data()[vector.get_validity()]
+        return _to_native(valid.max()) if len(valid) else None
+    natives = [val for val in vector.to_natives() if val is not None]
+    return max(natives) if natives else None  # type: ignore
+
+
+def select(mask: ColumnVector) -> list[int]:
+    assert mask.get_type_id() == TypeEnum.BOOLEAN, (
+        f"Selection mask must be boolean, got {mask.get_type_id()}"
+    )
+    if mask.is_numpy():
+        selected = mask.get_data() & mask.get_validity()
+        return [int(idx) for idx in np.flatnonzero(selected)]
+    return [
+        idx
+        for idx, (val, valid) in enumerate(
+            zip(mask.get_data(), mask.get_validity(), strict=True)
+        )
+        if valid and val
+    ]
+
+
+def _is_numpy(left: ColumnVector, right: Operand) -> bool:
+    return left.is_numpy() and (isinstance(right, Value) or right.is_numpy())
+
+
+def _is_null(operand: Operand) -> bool:
+    return isinstance(operand, Value) and operand.is_null()
+
+
+def _create_nulls(type_id: TypeEnum, length: int) -> ColumnVector:
+    return ColumnVector.from_natives(type_id, [None] * length)
+
+
+def _get_numpy_data(operand: Operand) -> object:
+    if isinstance(operand, Value):
+        return operand.get_value()
+    return operand.get_data()
+
+
+def _get_numpy_validity(left: ColumnVector, right: Operand) -> object:
+    if isinstance(right, Value):
+        return left.get_validity().copy()
+    return left.get_validity() & right.get_validity()
+
+
+def _get_natives(operand: Operand, length: int) -> list[object]:
+    if isinstance(operand, Value):
+        return [operand.get_value()] * length
+    assert len(operand) == length, (
+        f"Vector lengths don't match: {len(operand)} vs {length}"
+    )
+    return operand.to_natives()
+
+
+def _to_native(val: object) -> object:
+    if isinstance(val, np.generic):
+        return val.item()
+    return val
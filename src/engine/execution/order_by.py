@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from engine.execution.expressions.expression import Expression
+
+
+class SortDirection(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class NullOrder(str, Enum):
+    FIRST = "nulls_first"
+    LAST = "nulls_last"
+
+
+@dataclass(frozen=True)
+class OrderBy:
+    expr: Expression
+    direction: SortDirection = SortDirection.ASC
+    nulls: NullOrder | None = None
+
+    def is_descending(self) -> bool:
+        return self.direction == SortDirection.DESC
+
+    def get_null_order(self) -> NullOrder:
+        # NULL sorts as the largest value unless stated otherwise
+        if self.nulls is not None:
+            return self.nulls
+        return NullOrder.FIRST if self.is_descending() else NullOrder.LAST
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+
+from engine.execution.aggregate import Aggregate, create_aggregate_expressions
+from engine.execution.executors.aggregation_executor import (
+    GROUP_KEY,
+    GROUP_VALUE,
+)
+from engine.execution.expressions.aggregate_expression import AggregateState
+from engine.execution.expressions.expression import Expression
+from engine.execution.plan.execution_plan import ExecutionPlan
+from engine.execution.plan.filter_plan import FilterPlan
+from engine.execution.plan.scan_plan import ScanPlan
+from storage.byte_range import ByteRange, read_byte_range
+from storage.decoder import RowDecoder
+from storage.table import CSVTable
+
+
+PartialAggregate = dict[GROUP_KEY, list[AggregateState]]
+
+
+@dataclass(frozen=True)
+class PartialAggregationTask:
+    path: str
+    decoder: RowDecoder
+    predicate: Expression | None
+    group_bys: list[Expression]
+    aggregates: list[Aggregate]
+
+
+@dataclass(frozen=True)
+class ParallelSource:
+    scan_plan: ScanPlan
+    table: CSVTable
+    predicate: Expression | None
+
+
+def find_parallel_source(plan: ExecutionPlan) -> ParallelSource | None:
+    # Workers can only replay a plain CSV scan with an optional filter
+    predicate = None
+    if isinstance(plan, FilterPlan):
+        predicate = plan.get_predicate()
+        plan = plan.get_child()
+    if not isinstance(plan, ScanPlan):
+        return None
+
+    table = plan.get_table()
+    if not isinstance(table, CSVTable) or table.get_use_cache():
+        return None
+    return ParallelSource(plan, table, predicate)
+
+
+def aggregate_byte_range(
+    task: PartialAggregationTask, byte_range: ByteRange
+) -> PartialAggregate:
+    hash_table: dict[GROUP_KEY, GROUP_VALUE] = {}
+    for row in read_byte_range(task.path, byte_range):
+        if not task.decoder.accepts(row):
+            continue
+        tup = task.decoder.decode(row)
+        if task.predicate is not None:
+            result = task.predicate.evaluate(tup)
+            if result.is_null() or not result.to_boolean().get_value():
+                continue
+
+        group_key = tuple(expr.evaluate(tup) for expr in task.group_bys)
+        states = hash_table.get(group_key)
+        if states is None:
+            states = create_aggregate_expressions(task.aggregates)
+            hash_table[group_key] = states
+        for agg, state in zip(task.aggregates, states, strict=True):
+            state.update(agg.expr.evaluate(tup))
+
+    return {
+        key: [state.get_state() for state in states]
+        for key, states in hash_table.items()
+    }
+
+
+def merge_partial_aggregate(
+    hash_table: dict[GROUP_KEY, GROUP_VALUE],
+    partial: PartialAggregate,
+    aggregates: list[Aggregate],
+) -> None:
+    for group_key, partial_states in partial.items():
+        states = hash_table.get(group_key)
+        if states is None:
+            states = create_aggregate_expressions(aggregates)
+            hash_table[group_key] = states
+        for state, partial_state in zip(states, partial_states, strict=True):
+            state.merge_state(partial_state)
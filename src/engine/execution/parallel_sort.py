@@ -0,0 +1,58 @@
+import random
+from bisect import bisect_right
+from concurrent.futures import Executor as PoolExecutor
+
+from engine.execution.sort_key import SortKey
+
+
+DEFAULT_SAMPLE_SIZE = 1000
+
+
+def choose_boundaries(
+    keys: list[SortKey],
+    partitions: int,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+) -> list[SortKey]:
+    if partitions <= 1 or not keys:
+        return []
+    # A fixed seed keeps the partitioning reproducible between runs
+    sample = sorted(random.Random(0).sample(keys, min(sample_size, len(keys))))
+    boundaries: list[SortKey] = []
+    for i in range(1, partitions):
+        boundary = sample[i * len(sample) // partitions]
+        if not boundaries or boundaries[-1] < boundary:
+            boundaries.append(boundary)
+    return boundaries
+
+
+def partition_keys(
+    keys: list[SortKey], boundaries: list[SortKey]
+) -> list[list[int]]:
+    # Equal keys always land in the same partition, in input order
+    partitions: list[list[int]] = [[] for _ in range(len(boundaries) + 1)]
+    for idx, key in enumerate(keys):
+        partitions[bisect_right(boundaries, key)].append(idx)
+    return partitions
+
+
+def sort_partition(keys: list[SortKey]) -> list[int]:
+    return sorted(range(len(keys)), key=keys.__getitem__)
+
+
+def parallel_argsort(
+    keys: list[SortKey], pool: PoolExecutor, partitions: int
+) -> list[int]:
+    boundaries = choose_boundaries(keys, partitions)
+    indices = partition_keys(keys, boundaries)
+    futures = [
+        pool.submit(sort_partition, [keys[i] for i in part])
+        for part in indices
+        if part
+    ]
+    parts = [part for part in indices if part]
+
+    # Partitions cover disjoint key ranges, so they merge by concatenation
+    order: list[int] = []
+    for part, future in zip(parts, futures, strict=True):
+        order.extend(part[i] for i in future.result())
+    return order
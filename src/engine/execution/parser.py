@@ -10,6 +10,7 @@ from engine.execution.expressions.comparison_expression import (
 )
 from engine.execution.expressions.constant_expression import ConstantExpression
 from engine.execution.expressions.expression import Expression
+from engine.execution.order_by import NullOrder, OrderBy, SortDirection
 from engine.execution.planner import (
     AggregateDef,
     SelectStatement,
@@ -20,6 +21,10 @@ from type.enums import ComparisonOperandEnum
 from type.value import Value
 
 
+_SORT_DIRECTIONS = {direction.value for direction in SortDirection}
+_NULL_ORDERS = {nulls.value for nulls in NullOrder}
+
+
 class Parser(ABC):
     @abstractmethod
     def parse(self, args: list[str]) -> SelectStatement: ...
@@ -143,10 +148,7 @@ class ConsoleSelectParser(Parser):
         ]
 
         # SORT
-        sort_exprs: list[Expression] = [
-            self.resolver.resolve_column_expression(col, config.table)
-            for col in config.sort
-        ]
+        order_by = [self._parse_sort(s, config.table) for s in config.sort]
 
         # AGGREGATES
         aggregates = [
@@ -164,7 +166,7 @@ class ConsoleSelectParser(Parser):
             where_clause=where_expr,
             group_bys=group_by_exprs,
             aggregates=aggregates,
-            order_by=sort_exprs,
+            order_by=order_by,
             offset=config.offset,
             limit=config.limit,
         )
@@ -187,6 +189,26 @@ class ConsoleSelectParser(Parser):
         output_name = f"{func_str.lower()}({col_str})"
         return AggregateDef(agg_type, column_expr, output_name)
 
+    def _parse_sort(self, s: str, table_name: str) -> OrderBy:
+        col_str, *options = s.split(":")
+        direction = SortDirection.ASC
+        nulls = None
+        for option in options:
+            token = option.strip().lower()
+            if token in _SORT_DIRECTIONS:
+                direction = SortDirection(token)
+            elif token in _NULL_ORDERS:
+                nulls = NullOrder(token)
+            else:
+                raise ValueError(
+                    f"Invalid sort format: '{s}' (expected column[:asc|desc][:nulls_first|nulls_last])"
+                )
+
+        column_expr = self.resolver.resolve_column_expression(
+            col_str.strip(), table_name
+        )
+        return OrderBy(column_expr, direction, nulls)
+
     def _infer_select_expressions(
         self,
         group_by_exprs: list[Expression] | None,
@@ -12,10 +12,12 @@ class AggregationPlan(ExecutionPlan):
         aggregates: list[Aggregate],
         output_schema: Schema,
         child: ExecutionPlan,
+        is_input_sorted: bool = False,
     ):
         super().__init__(output_schema, [child])
         self._group_bys = group_bys
         self._aggregates = aggregates
+        self._is_input_sorted = is_input_sorted
 
     def get_group_bys(self) -> list[Expression]:
         return self._group_bys.copy()
@@ -23,5 +25,8 @@ class AggregationPlan(ExecutionPlan):
     def get_aggregates(self) -> list[Aggregate]:
         return self._aggregates.copy()
 
+    def is_input_sorted(self) -> bool:
+        return self._is_input_sorted
+
     def get_child(self) -> ExecutionPlan:
         return self._children[0]
@@ -1,3 +1,4 @@
+from storage.predicate import ColumnPredicate
 from storage.schema import Schema
 from storage.table import Table
 
@@ -5,9 +6,27 @@ from .execution_plan import ExecutionPlan
 
 
 class ScanPlan(ExecutionPlan):
-    def __init__(self, table: Table, output_schema: Schema) -> None:
+    def __init__(
+        self,
+        table: Table,
+        output_schema: Schema,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> None:
         super().__init__(output_schema, [])
         self._table = table
+        self._predicates = predicates or []
 
     def get_table(self) -> Table:
         return self._table
+
+    def get_predicates(self) -> list[ColumnPredicate]:
+        return self._predicates.copy()
+
+    def get_column_indices(self) -> list[int] | None:
+        table_schema = self._table.get_schema()
+        if self._output_schema == table_schema:
+            return None
+        return [
+            table_schema.get_column_idx(column.get_name())
+            for column in self._output_schema.get_columns()
+        ]
@@ -1,4 +1,4 @@
-from engine.execution.expressions.expression import Expression
+from engine.execution.order_by import OrderBy
 from engine.execution.plan.execution_plan import ExecutionPlan
 from storage.schema import Schema
 
@@ -6,14 +6,14 @@ from storage.schema import Schema
 class SortPlan(ExecutionPlan):
     def __init__(
         self,
-        order_by: list[Expression],
+        order_by: list[OrderBy],
         output_schema: Schema,
         child: ExecutionPlan,
     ) -> None:
         super().__init__(output_schema, [child])
         self._order_by = order_by
 
-    def get_order_by(self) -> list[Expression]:
+    def get_order_by(self) -> list[OrderBy]:
         return self._order_by
 
     def get_child(self) -> ExecutionPlan:
@@ -0,0 +1,25 @@
+from engine.execution.order_by import OrderBy
+from engine.execution.plan.execution_plan import ExecutionPlan
+from storage.schema import Schema
+
+
+class TopNPlan(ExecutionPlan):
+    def __init__(
+        self,
+        order_by: list[OrderBy],
+        n: int,
+        output_schema: Schema,
+        child: ExecutionPlan,
+    ) -> None:
+        super().__init__(output_schema, [child])
+        self._order_by = order_by
+        self._n = n
+
+    def get_order_by(self) -> list[OrderBy]:
+        return self._order_by
+
+    def get_n(self) -> int:
+        return self._n
+
+    def get_child(self) -> ExecutionPlan:
+        return self._children[0]
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from engine.execution.aggregate import (
     Aggregate,
@@ -6,7 +6,12 @@ from engine.execution.aggregate import (
     get_start_count_expr,
 )
 from engine.execution.expressions.column_expression import ColumnExpression
+from engine.execution.expressions.comparison_expression import (
+    ComparisonExpression,
+)
+from engine.execution.expressions.constant_expression import ConstantExpression
 from engine.execution.expressions.expression import Expression
+from engine.execution.order_by import OrderBy
 from engine.execution.plan.aggregation_plan import AggregationPlan
 from engine.execution.plan.execution_plan import ExecutionPlan
 from engine.execution.plan.filter_plan import FilterPlan
@@ -15,8 +20,10 @@ from engine.execution.plan.offset_plan import OffsetPlan
 from engine.execution.plan.projection_plan import ProjectionPlan
 from engine.execution.plan.scan_plan import ScanPlan
 from engine.execution.plan.sort_plan import SortPlan
+from engine.execution.plan.top_n_plan import TopNPlan
+from storage.predicate import ColumnPredicate
 from storage.schema import Column, Schema
-from storage.table import Table
+from storage.table import CSVTable, Table
 from type.type_enum import TypeEnum
 
 
@@ -33,7 +40,7 @@ class SelectStatement:
     from_table: str
     group_bys: list[Expression]
     aggregates: list[AggregateDef]
-    order_by: list[Expression] | None = None
+    order_by: list[OrderBy] | None = None
     limit: int | None = None
     offset: int | None = None
     where_clause: Expression | None = None
@@ -112,11 +119,18 @@ class QueryPlanner:
         table = self._catalog.get(statement.from_table)
         assert table
         table_schema = table.get_schema()
+        scan_schema = self._construct_scan_schema(statement, table_schema)
 
-        plan = ScanPlan(table, table_schema)
+        plan = ScanPlan(
+            table,
+            scan_schema,
+            self._build_scan_predicates(statement.where_clause),
+        )
 
         if statement.where_clause:
-            plan = FilterPlan(statement.where_clause, table_schema, plan)
+            plan = FilterPlan(
+                statement.where_clause.bind(scan_schema), scan_schema, plan
+            )
 
         if statement.group_bys or statement.aggregates:
             plan = self._build_aggregation_plan(statement, plan, table_schema)
@@ -125,8 +139,20 @@ class QueryPlanner:
 
         plan = self._build_projection_plan(output_schema, plan)
 
-        if statement.order_by:
-            plan = SortPlan(statement.order_by, output_schema, plan)
+        order_by = [
+            replace(item, expr=item.expr.bind(output_schema))
+            for item in statement.order_by or []
+        ]
+        if order_by and statement.limit is not None:
+            # Only the first offset + limit rows of the sort are ever read
+            plan = TopNPlan(
+                order_by,
+                (statement.offset or 0) + statement.limit,
+                output_schema,
+                plan,
+            )
+        elif order_by:
+            plan = SortPlan(order_by, output_schema, plan)
         if statement.offset is not None:
             plan = OffsetPlan(statement.offset, output_schema, plan)
         if statement.limit is not None:
@@ -134,6 +160,71 @@ class QueryPlanner:
 
         return plan
 
+    def _construct_scan_schema(
+        self, statement: SelectStatement, table_schema: Schema
+    ) -> Schema:
+        expressions: list[Expression] = [
+            *statement.select_expressions,
+            *statement.group_bys,
+            *(agg.column for agg in statement.aggregates if agg.column),
+            *(item.expr for item in statement.order_by or []),
+        ]
+        if statement.where_clause:
+            expressions.append(statement.where_clause)
+
+        names: set[str] = set()
+        for expr in expressions:
+            if not self._collect_column_names(expr, names):
+                return table_schema
+
+        if not (statement.group_bys or statement.aggregates):
+            # Without aggregation the projection reads its output columns
+            # straight from the scan
+            output_schema = self._construct_output_schema(
+                statement, table_schema
+            )
+            names.update(c.get_name() for c in output_schema.get_columns())
+
+        return Schema(
+            [c for c in table_schema.get_columns() if c.get_name() in names]
+        )
+
+    def _collect_column_names(self, expr: Expression, names: set[str]) -> bool:
+        if isinstance(expr, ColumnExpression):
+            names.add(expr.get_column().get_name())
+            return True
+        if isinstance(expr, ConstantExpression):
+            return True
+        if isinstance(expr, ComparisonExpression):
+            return self._collect_column_names(
+                expr.get_left(), names
+            ) and self._collect_column_names(expr.get_right(), names)
+
+        # Unknown expressions may read any column
+        return False
+
+    def _build_scan_predicates(
+        self, where_clause: Expression | None
+    ) -> list[ColumnPredicate]:
+        # Only plain "column op constant" comparisons can be checked
+        # against storage statistics
+        if not isinstance(where_clause, ComparisonExpression):
+            return []
+
+        left = where_clause.get_left()
+        right = where_clause.get_right()
+        if not (
+            isinstance(left, ColumnExpression)
+            and isinstance(right, ConstantExpression)
+        ):
+            return []
+
+        return [
+            ColumnPredicate(
+                left.get_column(), where_clause.get_op(), right.get_value()
+            )
+        ]
+
     def _build_aggregation_plan(
         self,
         statement: SelectStatement,
@@ -141,15 +232,44 @@ class QueryPlanner:
         table_schema: Schema,
     ) -> ExecutionPlan:
         output_schema = self._construct_output_schema(statement, table_schema)
-        group_bys = statement.group_bys
-        aggregates = self._construct_aggregates(statement.aggregates)
+        input_schema = child_plan.get_output_schema()
+        group_bys = [expr.bind(input_schema) for expr in statement.group_bys]
+        aggregates = [
+            replace(aggr, expr=aggr.expr.bind(input_schema))
+            for aggr in self._construct_aggregates(statement.aggregates)
+        ]
         return AggregationPlan(
             group_bys=group_bys,
             aggregates=aggregates,
             output_schema=output_schema,
             child=child_plan,
+            is_input_sorted=self._is_sorted_on(child_plan, group_bys),
         )
 
+    def _is_sorted_on(
+        self, plan: ExecutionPlan, group_bys: list[Expression]
+    ) -> bool:
+        if not group_bys or not all(
+            isinstance(expr, ColumnExpression) for expr in group_bys
+        ):
+            return False
+
+        # Filters drop rows without reordering them
+        while isinstance(plan, FilterPlan):
+            plan = plan.get_child()
+
+        if not isinstance(plan, ScanPlan):
+            return False
+        table = plan.get_table()
+        if isinstance(table, CSVTable) and not table.is_scan_ordered():
+            return False
+        names = {
+            expr.get_column().get_name()  # type: ignore
+            for expr in group_bys
+        }
+        sorted_by = table.get_sorted_by()
+        return set(sorted_by[: len(names)]) == names
+
     def _construct_aggregates(
         self, aggregates: list[AggregateDef]
     ) -> list[Aggregate]:
@@ -165,9 +285,11 @@ class QueryPlanner:
     def _build_projection_plan(
         self, output_schema: Schema, child_plan: ExecutionPlan
     ) -> ExecutionPlan:
-        projection_expressions = self._build_projection_expressions(
-            output_schema
-        )
+        input_schema = child_plan.get_output_schema()
+        projection_expressions = [
+            expr.bind(input_schema)
+            for expr in self._build_projection_expressions(output_schema)
+        ]
         return ProjectionPlan(
             projection_expressions, output_schema, child_plan
         )
@@ -0,0 +1,83 @@
+import operator
+from collections.abc import Callable
+from functools import total_ordering
+
+from engine.execution.expressions.column_expression import ColumnExpression
+from engine.execution.order_by import NullOrder, OrderBy
+from storage.schema import Schema
+from storage.tuple import Tuple
+from type.type_enum import TypeEnum
+
+
+SortKey = tuple[object, ...]
+KeyPart = Callable[[Tuple], object]
+
+_NULLS_FIRST = 0
+_NOT_NULL = 1
+_NULLS_LAST = 2
+
+# Types whose values can be negated to reverse their order
+_NEGATABLE_TYPES = {TypeEnum.INT, TypeEnum.DECIMAL, TypeEnum.BOOLEAN}
+
+
+@total_ordering
+class Descending:
+    __slots__ = ("_value",)
+
+    def __init__(self, value: object) -> None:
+        self._value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Descending) and self._value == other._value
+
+    def __lt__(self, other: "Descending") -> bool:
+        return other._value < self._value  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash(self._value)
+
+
+def build_sort_key(
+    order_by: list[OrderBy], schema: Schema
+) -> Callable[[Tuple], SortKey]:
+    parts = [_build_key_part(item, schema) for item in order_by]
+
+    def sort_key(tup: Tuple) -> SortKey:
+        return tuple([part(tup) for part in parts])
+
+    return sort_key
+
+
+def _build_key_part(item: OrderBy, schema: Schema) -> KeyPart:
+    native = _build_native_getter(item, schema)
+    null_rank = (
+        _NULLS_FIRST
+        if item.get_null_order() == NullOrder.FIRST
+        else _NULLS_LAST
+    )
+    invert: Callable[[object], object] | None = None
+    if item.is_descending():
+        invert = (
+            operator.neg  # type: ignore
+            if item.expr.get_return_type() in _NEGATABLE_TYPES
+            else Descending
+        )
+
+    def key_part(tup: Tuple) -> object:
+        val = native(tup)
+        if val is None:
+            return (null_rank, None)
+        return (_NOT_NULL, val if invert is None else invert(val))
+
+    return key_part
+
+
+def _build_native_getter(item: OrderBy, schema: Schema) -> KeyPart:
+    expr = item.expr
+    if isinstance(expr, ColumnExpression):
+        # Resolve the column position once instead of per row
+        idx = expr.get_index()
+        if idx is None:
+            idx = schema.get_column_idx(expr.get_column().get_name())
+        return lambda tup: tup.values[idx].get_value()
+    return lambda tup: expr.evaluate(tup).get_value()
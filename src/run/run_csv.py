@@ -27,7 +27,9 @@ products_schema = Schema(
         Column(name="rating", type_id=TypeEnum.DECIMAL),
     ]
 )
-example_table = CSVTable(schema=example_schema, path="data/example.csv")
+example_table = CSVTable(
+    schema=example_schema, path="data/example.csv", sorted_by=["id"]
+)
 products_table = CSVTable(schema=products_schema, path="data/products.csv")
 table_registry: dict[str, Table] = {
     "example": example_table,
@@ -0,0 +1,178 @@
+from array import array
+
+from storage.schema import Schema
+from storage.tuple import Tuple
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+DEFAULT_BATCH_SIZE = 4096
+
+ColumnData = array | list[object]
+
+_TYPECODES: dict[TypeEnum, str] = {
+    TypeEnum.INT: "q",
+    TypeEnum.DECIMAL: "d",
+    TypeEnum.BOOLEAN: "b",
+}
+_NULL_PLACEHOLDERS: dict[TypeEnum, object] = {
+    TypeEnum.INT: 0,
+    TypeEnum.DECIMAL: 0.0,
+    TypeEnum.BOOLEAN: False,
+}
+
+
+class ColumnBatch:
+    def __init__(
+        self,
+        type_id: TypeEnum,
+        data: ColumnData | None = None,
+        nulls: bytearray | None = None,
+    ) -> None:
+        self._type_id = type_id
+        self._data = data if data is not None else self._create_data()
+        self._nulls = nulls if nulls is not None else bytearray()
+
+    def get_type_id(self) -> TypeEnum:
+        return self._type_id
+
+    def get_data(self) -> ColumnData:
+        return self._data
+
+    def get_nulls(self) -> bytearray:
+        return self._nulls
+
+    def is_null(self, index: int) -> bool:
+        return bool(self._nulls[index])
+
+    def get_native(self, index: int) -> object:
+        if self._nulls[index]:
+            return None
+        val = self._data[index]
+        if self._type_id == TypeEnum.BOOLEAN:
+            return bool(val)
+        return val
+
+    def get_value(self, index: int) -> Value:
+        return Value.intern(self._type_id, self.get_native(index))
+
+    def append(self, val: object) -> None:
+        if val is None:
+            self._data.append(
+                _NULL_PLACEHOLDERS.get(self._type_id)  # type: ignore
+            )
+            self._nulls.append(1)
+            return
+
+        try:
+            self._data.append(val)  # type: ignore
+        except OverflowError:
+            # Integers wider than 64 bits don't fit the typed array
+            self._data = list(self._data)
+            self._data.append(val)
+        self._nulls.append(0)
+
+    def take(self, indices: list[int]) -> "ColumnBatch":
+        data = self._data
+        values = [data[i] for i in indices]
+        return ColumnBatch(
+            self._type_id,
+            array(data.typecode, values)
+            if isinstance(data, array)
+            else values,
+            bytearray(self._nulls[i] for i in indices),
+        )
+
+    def __len__(self) -> int:
+        return len(self._nulls)
+
+    def _create_data(self) -> ColumnData:
+        typecode = _TYPECODES.get(self._type_id)
+        if typecode is None:
+            return []
+        return array(typecode)
+
+
+class RecordBatch:
+    def __init__(
+        self,
+        columns: list[ColumnBatch],
+        schema: Schema,
+        row_count: int | None = None,
+    ) -> None:
+        assert len(columns) == schema.get_column_count(), (
+            f"Column count doesn't match schema: {len(columns)} vs {schema.get_columns()}"
+        )
+        if row_count is None:
+            row_count = len(columns[0]) if columns else 0
+        self._columns = columns
+        self._schema = schema
+        self._row_count = row_count
+
+    def get_schema(self) -> Schema:
+        return self._schema
+
+    def get_columns(self) -> list[ColumnBatch]:
+        return self._columns.copy()
+
+    def get_column(self, index: int) -> ColumnBatch:
+        return self._columns[index]
+
+    def get_column_by_name(self, name: str) -> ColumnBatch:
+        return self._columns[self._schema.get_column_idx(name)]
+
+    def get_row_count(self) -> int:
+        return self._row_count
+
+    def select(self, columns: list[int]) -> "RecordBatch":
+        return RecordBatch(
+            [self._columns[i] for i in columns],
+            Schema([self._schema.get_column(i) for i in columns]),
+            self._row_count,
+        )
+
+    def take(self, indices: list[int]) -> "RecordBatch":
+        return RecordBatch(
+            [column.take(indices) for column in self._columns],
+            self._schema,
+            len(indices),
+        )
+
+    def get_tuple(self, index: int) -> Tuple:
+        return Tuple.create_unchecked(
+            [column.get_value(index) for column in self._columns],
+            self._schema,
+        )
+
+    def to_tuples(self) -> list[Tuple]:
+        return [self.get_tuple(i) for i in range(self.get_row_count())]
+
+
+class RecordBatchBuilder:
+    def __init__(self, schema: Schema) -> None:
+        self._schema = schema
+        self._columns = self._create_columns()
+        self._row_count = 0
+
+    def append_row(self, row: list[object]) -> None:
+        assert len(row) == self._schema.get_column_count(), (
+            f"Value count doesn't match schema: {row} vs {self._schema.get_columns()}"
+        )
+        for column, val in zip(self._columns, row, strict=True):
+            column.append(val)
+        self._row_count += 1
+
+    def get_row_count(self) -> int:
+        return self._row_count
+
+    def build(self) -> RecordBatch:
+        batch = RecordBatch(self._columns, self._schema, self._row_count)
+        self._columns = self._create_columns()
+        self._row_count = 0
+        return batch
+
+    def _create_columns(self) -> list[ColumnBatch]:
+        return [
+            ColumnBatch(column.get_type_id())
+            for column in self._schema.get_columns()
+        ]
@@ -0,0 +1,63 @@
+import csv
+import io
+import os
+from collections.abc import Iterator
+from typing import BinaryIO
+
+from storage.decoder import RowDecoder
+
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+ByteRange = tuple[int, int]
+
+
+def split_byte_ranges(
+    path: str, chunk_size: int, skip_first: bool
+) -> list[ByteRange]:
+    size = os.path.getsize(path)
+    ranges: list[ByteRange] = []
+
+    with open(path, "rb") as file:
+        start = 0
+        if skip_first:
+            _read_row(file, 0, size)
+            start = file.tell()
+
+        while start < size:
+            # Ranges start outside quotes, so an odd quote count means the
+            # chunk ends inside a quoted cell
+            quotes = file.read(chunk_size).count(b'"')
+            end = _read_row(file, quotes, size)
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def _read_row(file: BinaryIO, quotes: int, size: int) -> int:
+    # A newline only ends a row when every quote before it is closed
+    while file.tell() < size:
+        quotes += file.readline().count(b'"')
+        if quotes % 2 == 0:
+            break
+    return file.tell()
+
+
+def read_byte_range(path: str, byte_range: ByteRange) -> Iterator[list[str]]:
+    start, end = byte_range
+    with open(path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    return csv.reader(io.StringIO(data.decode(), newline=""))
+
+
+def parse_byte_range(
+    path: str, byte_range: ByteRange, decoder: RowDecoder
+) -> list[list[object]]:
+    return [
+        decoder.parse(row)
+        for row in read_byte_range(path, byte_range)
+        if decoder.accepts(row)
+    ]
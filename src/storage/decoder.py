@@ -0,0 +1,141 @@
+from collections.abc import Callable
+
+from storage.lazy_values import LazyValues
+from storage.predicate import ColumnPredicate, RawTextPredicate
+from storage.schema import Schema
+from storage.tuple import Tuple
+from type.interner import ValueInterner
+from type.type import Type
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class RowFilter:
+    def __init__(
+        self, schema: Schema, predicates: list[ColumnPredicate] | None = None
+    ) -> None:
+        # Incomparable predicates are left to the filter executor
+        self._filters: list[tuple[int, RawTextPredicate]] = [
+            (
+                schema.get_column_idx(predicate.get_column().get_name()),
+                RawTextPredicate(predicate),
+            )
+            for predicate in predicates or []
+            if predicate.is_comparable()
+        ]
+
+    def get_filters(self) -> list[tuple[int, RawTextPredicate]]:
+        return self._filters.copy()
+
+    def is_empty(self) -> bool:
+        return not self._filters
+
+    def accepts(self, row: list[str]) -> bool:
+        return all(matches(row[idx]) for idx, matches in self._filters)
+
+
+class FieldDecoder:
+    def __init__(self, type_id: TypeEnum, interner: ValueInterner) -> None:
+        self._type_id = type_id
+        self._parse = Type.get_instance(type_id).get_parser()
+        self._interner = interner
+
+    def __call__(self, raw: str) -> Value:
+        try:
+            val = self._parse(raw)
+        except ValueError:
+            # Re-parse through the type to raise its descriptive error
+            val = Type.get_instance(self._type_id).parse(raw)
+        return self._interner(val)
+
+
+class RowDecoder:
+    def __init__(
+        self,
+        schema: Schema,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> None:
+        self._input_schema = schema
+        self._width = schema.get_column_count()
+        self._columns = columns
+        self._schema = (
+            schema
+            if columns is None
+            else Schema([schema.get_column(i) for i in columns])
+        )
+        self._type_ids: list[TypeEnum] = [
+            column.get_type_id() for column in self._schema.get_columns()
+        ]
+        self._parsers: list[Callable[[str], object]] = [
+            Type.get_instance(type_id).get_parser()
+            for type_id in self._type_ids
+        ]
+        self._interners = [
+            ValueInterner(type_id) for type_id in self._type_ids
+        ]
+        self._field_decoders = [
+            FieldDecoder(type_id, interner)
+            for type_id, interner in zip(
+                self._type_ids, self._interners, strict=True
+            )
+        ]
+        self._filter = RowFilter(schema, predicates)
+
+    def get_schema(self) -> Schema:
+        return self._schema
+
+    def get_columns(self) -> list[int] | None:
+        return self._columns
+
+    def accepts(self, row: list[str]) -> bool:
+        if self._filter.is_empty():
+            return True
+        self._check_width(row)
+        return self._filter.accepts(row)
+
+    def decode(self, row: list[str]) -> Tuple:
+        return self.to_tuple(self.parse(row))
+
+    def decode_lazy(self, row: list[str]) -> Tuple:
+        # Fields are parsed on first access, so rejected rows and unused
+        # columns are never decoded
+        self._check_width(row)
+        cells = (
+            row if self._columns is None else [row[i] for i in self._columns]
+        )
+        return Tuple.create_unchecked(
+            LazyValues(cells, self._field_decoders),
+            self._schema,
+        )
+
+    def to_tuple(self, row: list[object]) -> Tuple:
+        return Tuple.create_unchecked(
+            [
+                intern(val)
+                for intern, val in zip(self._interners, row, strict=True)
+            ],
+            self._schema,
+        )
+
+    def parse(self, row: list[str]) -> list[object]:
+        self._check_width(row)
+        cells = (
+            row if self._columns is None else [row[i] for i in self._columns]
+        )
+        try:
+            return [
+                parse(raw)
+                for parse, raw in zip(self._parsers, cells, strict=True)
+            ]
+        except ValueError:
+            # Re-parse through the type to raise its descriptive error
+            return [
+                Type.get_instance(type_id).parse(raw)
+                for type_id, raw in zip(self._type_ids, cells, strict=True)
+            ]
+
+    def _check_width(self, row: list[str]) -> None:
+        assert len(row) == self._width, (
+            f"Value count doesn't match schema: {row} vs {self._input_schema.get_columns()}"
+        )
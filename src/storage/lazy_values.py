@@ -0,0 +1,57 @@
+from collections.abc import Callable, Iterator, Sequence
+from typing import overload
+
+from type.value import Value
+
+
+DecodeFn = Callable[[str], Value]
+
+
+class LazyValues(Sequence[Value]):
+    __slots__ = ("_cells", "_decoders", "_values")
+    __hash__ = None  # type: ignore
+
+    def __init__(self, cells: list[str], decoders: Sequence[DecodeFn]) -> None:
+        assert len(cells) == len(decoders), (
+            f"Value count doesn't match schema: {cells} vs {len(decoders)} columns"
+        )
+        self._cells = cells
+        self._decoders = decoders
+        self._values: list[Value | None] = [None] * len(cells)
+
+    def is_decoded(self, index: int) -> bool:
+        return self._values[index] is not None
+
+    @overload
+    def __getitem__(self, index: int) -> Value: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[Value]: ...
+
+    def __getitem__(self, index: int | slice) -> Value | list[Value]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        value = self._values[index]
+        if value is None:
+            value = self._decoders[index](self._cells[index])
+            self._values[index] = value
+        return value
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __iter__(self) -> Iterator[Value]:
+        for i in range(len(self._cells)):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyValues | list):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __reduce__(self) -> tuple[type, tuple[list[Value]]]:
+        # Rows sent to other processes or spilled arrive fully decoded
+        return (list, (list(self),))
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+
+from storage.schema import Column
+from type.enums import ComparisonOperandEnum
+from type.type import Type
+from type.type_enum import NUMERIC_TYPES
+from type.value import Value
+
+
+@dataclass(frozen=True)
+class ColumnPredicate:
+    column: Column
+    op: ComparisonOperandEnum
+    value: Value
+
+    def get_column(self) -> Column:
+        return self.column
+
+    def get_op(self) -> ComparisonOperandEnum:
+        return self.op
+
+    def get_value(self) -> Value:
+        return self.value
+
+    def is_comparable(self) -> bool:
+        column_type = self.column.get_type_id()
+        value_type = self.value.get_type_id()
+        return column_type == value_type or (
+            column_type in NUMERIC_TYPES and value_type in NUMERIC_TYPES
+        )
+
+    def __str__(self) -> str:
+        return f"{self.column.name} {self.op.value} {self.value}"
+
+
+class RawTextPredicate:
+    def __init__(self, predicate: ColumnPredicate) -> None:
+        assert predicate.is_comparable(), (
+            f"Predicate {predicate} is not comparable"
+        )
+        type_id = predicate.get_column().get_type_id()
+        value = predicate.get_value()
+
+        self._type_id = type_id
+        self._parse = Type.get_instance(type_id).get_parser()
+        self._compare = Type.get_comparator(
+            type_id, value.get_type_id(), predicate.get_op()
+        )
+        self._is_null = value.is_null()
+        self._value = value.get_value()
+
+    def __call__(self, raw: str) -> bool:
+        if self._is_null:
+            return False
+        try:
+            val = self._parse(raw)
+        except ValueError:
+            # Re-parse through the type to raise its descriptive error
+            val = Type.get_instance(self._type_id).parse(raw)
+        return self._compare(val, self._value)
@@ -1,84 +1,445 @@
 import csv
+import mmap
+import os
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
 from pathlib import Path
 from typing import overload
 
-from storage.table import CSVTable, StringTable, Table
+from storage.batch import DEFAULT_BATCH_SIZE, RecordBatch, RecordBatchBuilder
+from storage.byte_range import (
+    DEFAULT_CHUNK_SIZE,
+    ByteRange,
+    parse_byte_range,
+    split_byte_ranges,
+)
+from storage.decoder import RowDecoder, RowFilter
+from storage.predicate import ColumnPredicate
+from storage.schema import Schema
+from storage.sidecar import (
+    Fingerprint,
+    SidecarError,
+    SidecarReader,
+    SidecarWriter,
+    get_sidecar_path,
+)
+from storage.table import CSVTable, ScanMode, StringTable, Table
 from storage.tuple import Tuple
-from type.type import Type
-from type.value import Value
+from type.registry import register_types
 
 
 class TableReader(ABC):
-    def __init__(self, table: Table) -> None:
+    def __init__(
+        self,
+        table: Table,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> None:
         self._table = table
+        self._columns = columns
+        self._predicates = predicates or []
+
+    def get_output_schema(self) -> Schema:
+        schema = self._table.get_schema()
+        if self._columns is None:
+            return schema
+        return Schema([schema.get_column(i) for i in self._columns])
 
     @abstractmethod
     def read(self) -> Iterator[Tuple]: ...
 
+    def read_batches(
+        self, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[RecordBatch]:
+        builder = RecordBatchBuilder(self.get_output_schema())
+        for tup in self.read():
+            builder.append_row([value.get_value() for value in tup.values])
+            if builder.get_row_count() >= batch_size:
+                yield builder.build()
+
+        if builder.get_row_count():
+            yield builder.build()
+
+    def _create_decoder(self) -> RowDecoder:
+        return RowDecoder(
+            self._table.get_schema(), self._columns, self._predicates
+        )
+
 
 class CSVTableReader(TableReader):
-    def __init__(self, table: CSVTable) -> None:
+    def __init__(
+        self,
+        table: CSVTable,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> None:
+        super().__init__(table, columns, predicates)
         self._table = table
 
     def read(self) -> Iterator[Tuple]:
-        schema = self._table.get_schema()
+        decoder = self._create_decoder()
+        decode = (
+            decoder.decode_lazy
+            if self._table.get_lazy_decode()
+            else decoder.decode
+        )
+        for row in self._read_rows():
+            if decoder.accepts(row):
+                yield decode(row)
+
+    def read_batches(
+        self, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[RecordBatch]:
+        decoder = self._create_decoder()
+        builder = RecordBatchBuilder(decoder.get_schema())
+        for row in self._read_rows():
+            if not decoder.accepts(row):
+                continue
+            builder.append_row(decoder.parse(row))
+            if builder.get_row_count() >= batch_size:
+                yield builder.build()
+
+        if builder.get_row_count():
+            yield builder.build()
+
+    def _read_rows(self) -> Iterator[list[str]]:
         path = Path(self._table.get_path())
 
         with path.open("r", newline="") as csvfile:
             reader = csv.reader(csvfile)
             if self._table.get_skip_first():
                 next(reader, None)
-            for row in reader:
-                values: list[Value] = []
-                for i, raw in enumerate(row):
-                    column = schema.get_column(i)
-                    type_id = column.get_type_id()
-                    value = Type.get_instance(type_id).deserialize(
-                        raw.encode()
+            yield from reader
+
+
+class ParallelCSVTableReader(TableReader):
+    def __init__(
+        self,
+        table: CSVTable,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        super().__init__(table, columns, predicates)
+        self._table = table
+        self._workers = workers or table.get_workers() or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+
+    def read(self) -> Iterator[Tuple]:
+        decoder = self._create_decoder()
+        ranges = split_byte_ranges(
+            self._table.get_path(),
+            self._chunk_size,
+            self._table.get_skip_first(),
+        )
+        if not ranges:
+            return
+
+        pool = ProcessPoolExecutor(
+            max_workers=self._workers, initializer=register_types
+        )
+        try:
+            for rows in self._map(pool, ranges, decoder):
+                for row in rows:
+                    yield decoder.to_tuple(row)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _map(
+        self,
+        pool: ProcessPoolExecutor,
+        ranges: list[ByteRange],
+        decoder: RowDecoder,
+    ) -> Iterator[list[list[object]]]:
+        # Keep a bounded number of chunks in flight so results stream
+        max_pending = self._workers * 2
+        path = self._table.get_path()
+        remaining = iter(ranges)
+
+        def submit() -> Future[list[list[object]]] | None:
+            byte_range = next(remaining, None)
+            if byte_range is None:
+                return None
+            return pool.submit(parse_byte_range, path, byte_range, decoder)
+
+        if self._table.get_preserve_order():
+            yield from self._map_ordered(submit, max_pending)
+        else:
+            yield from self._map_unordered(submit, max_pending)
+
+    def _map_ordered(
+        self,
+        submit: Callable[[], Future[list[list[object]]] | None],
+        max_pending: int,
+    ) -> Iterator[list[list[object]]]:
+        ordered: deque[Future[list[list[object]]]] = deque()
+        while len(ordered) < max_pending and (future := submit()):
+            ordered.append(future)
+        while ordered:
+            rows = ordered.popleft().result()
+            if future := submit():
+                ordered.append(future)
+            yield rows
+
+    def _map_unordered(
+        self,
+        submit: Callable[[], Future[list[list[object]]] | None],
+        max_pending: int,
+    ) -> Iterator[list[list[object]]]:
+        pending: set[Future[list[list[object]]]] = set()
+        while len(pending) < max_pending and (future := submit()):
+            pending.add(future)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for completed in done:
+                if future := submit():
+                    pending.add(future)
+                yield completed.result()
+
+
+class MMapCSVTableReader(TableReader):
+    def __init__(
+        self,
+        table: CSVTable,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> None:
+        super().__init__(table, columns, predicates)
+        self._table = table
+
+    def read(self) -> Iterator[Tuple]:
+        path = self._table.get_path()
+        if os.path.getsize(path) == 0:
+            return
+
+        schema = self._table.get_schema()
+        width = schema.get_column_count()
+        columns = self._columns if self._columns is not None else range(width)
+        decoder = RowDecoder(self.get_output_schema())
+        decode = (
+            decoder.decode_lazy
+            if self._table.get_lazy_decode()
+            else decoder.decode
+        )
+        filters = RowFilter(schema, self._predicates).get_filters()
+
+        with (
+            open(path, "rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+        ):
+            pos = 0
+            size = len(buffer)
+            if self._table.get_skip_first():
+                pos = self._find_line_end(buffer, pos, size) + 1
+
+            while pos < size:
+                start = pos
+                line_end = self._find_line_end(buffer, start, size)
+                if buffer.find(b'"', start, line_end) != -1:
+                    # A quoted cell may hold newlines, read on until every
+                    # quote is closed
+                    quotes = buffer[start:line_end].count(b'"')
+                    while line_end < size and quotes % 2:
+                        next_end = self._find_line_end(
+                            buffer, line_end + 1, size
+                        )
+                        quotes += buffer[line_end:next_end].count(b'"')
+                        line_end = next_end
+                pos = line_end + 1
+                if line_end > start and buffer[line_end - 1] == ord("\r"):
+                    line_end -= 1
+
+                if buffer.find(b'"', start, line_end) != -1:
+                    # Quoted cells may hold commas, let csv split the line
+                    line = buffer[start:line_end].decode()
+                    fields = next(csv.reader([line]), [])
+                    assert len(fields) == width, (
+                        f"Value count doesn't match schema: {fields} vs {schema.get_columns()}"
                     )
-                    values.append(value)
-                yield Tuple(values, schema)
+                    if not all(
+                        matches(fields[idx]) for idx, matches in filters
+                    ):
+                        continue
+                    row = [fields[i] for i in columns]
+                else:
+                    starts = self._find_field_starts(buffer, start, line_end)
+                    assert len(starts) == width, (
+                        f"Value count doesn't match schema: {buffer[start:line_end]!r} vs {schema.get_columns()}"
+                    )
+                    starts.append(line_end + 1)
+                    if not all(
+                        matches(
+                            buffer[starts[idx] : starts[idx + 1] - 1].decode()
+                        )
+                        for idx, matches in filters
+                    ):
+                        continue
+                    row = [
+                        buffer[starts[i] : starts[i + 1] - 1].decode()
+                        for i in columns
+                    ]
 
+                yield decode(row)
 
-class StringTableReader(TableReader):
-    def __init__(self, table: StringTable) -> None:
+    def _find_line_end(self, buffer: mmap.mmap, pos: int, size: int) -> int:
+        line_end = buffer.find(b"\n", pos)
+        return line_end if line_end != -1 else size
+
+    def _find_field_starts(
+        self, buffer: mmap.mmap, pos: int, line_end: int
+    ) -> list[int]:
+        starts = [pos]
+        comma = buffer.find(b",", pos, line_end)
+        while comma != -1:
+            starts.append(comma + 1)
+            comma = buffer.find(b",", comma + 1, line_end)
+        return starts
+
+
+class CachedCSVTableReader(TableReader):
+    def __init__(
+        self,
+        table: CSVTable,
+        source: TableReader,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> None:
+        super().__init__(table, columns, predicates)
         self._table = table
+        self._source = source
+        self._sidecar_path = get_sidecar_path(table.get_path())
 
     def read(self) -> Iterator[Tuple]:
+        for batch in self.read_batches():
+            yield from batch.to_tuples()
+
+    def read_batches(
+        self, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[RecordBatch]:
         schema = self._table.get_schema()
+        fingerprint = Fingerprint.from_path(
+            self._table.get_path(), self._table.get_skip_first()
+        )
+        sidecar = SidecarReader(self._sidecar_path, schema)
+        if sidecar.is_valid(fingerprint):
+            yield from sidecar.read_batches(self._predicates, self._columns)
+            return
+
+        writer = self._create_writer(schema, fingerprint)
+        try:
+            for batch in self._source.read_batches(batch_size):
+                if writer is not None:
+                    try:
+                        writer.write_batch(batch)
+                    except (SidecarError, OSError):
+                        writer.abort()
+                        writer = None
+                yield (
+                    batch
+                    if self._columns is None
+                    else batch.select(self._columns)
+                )
+            if writer is not None:
+                writer.commit()
+                writer = None
+        finally:
+            if writer is not None:
+                writer.abort()
+
+    def _create_writer(
+        self, schema: Schema, fingerprint: Fingerprint
+    ) -> SidecarWriter | None:
+        try:
+            return SidecarWriter(self._sidecar_path, schema, fingerprint)
+        except OSError:
+            return None
+
+
+class StringTableReader(TableReader):
+    def __init__(
+        self,
+        table: StringTable,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> None:
+        super().__init__(table, columns, predicates)
+        self._table = table
+
+    def read(self) -> Iterator[Tuple]:
+        decoder = self._create_decoder()
         lines = self._table.get_data().splitlines()
         for line in lines:
-            cells = line.strip().split(",")
-            values: list[Value] = []
-            for i, raw in enumerate(cells):
-                type_id = schema.get_column(i).get_type_id()
-                value = Type.get_instance(type_id).deserialize(raw.encode())
-                values.append(value)
-
-            yield Tuple(values, schema)
+            row = line.strip().split(",")
+            if decoder.accepts(row):
+                yield decoder.decode(row)
 
 
 class TableReaderFactory:
     @classmethod
     @overload
-    def create_reader(cls, table: CSVTable) -> TableReader: ...
+    def create_reader(
+        cls,
+        table: CSVTable,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> TableReader: ...
     @classmethod
     @overload
-    def create_reader(cls, table: StringTable) -> TableReader: ...
+    def create_reader(
+        cls,
+        table: StringTable,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> TableReader: ...
     @classmethod
     @overload
-    def create_reader(cls, table: Table) -> TableReader: ...
+    def create_reader(
+        cls,
+        table: Table,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> TableReader: ...
 
     @classmethod
-    def create_reader(cls, table: Table) -> TableReader:
+    def create_reader(
+        cls,
+        table: Table,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> TableReader:
         match table:
+            case CSVTable() if table.get_use_cache():
+                return CachedCSVTableReader(
+                    table, cls._create_csv_reader(table), columns, predicates
+                )
             case CSVTable():
-                return CSVTableReader(table)
+                return cls._create_csv_reader(table, columns, predicates)
             case StringTable():
-                return StringTableReader(table)
+                return StringTableReader(table, columns, predicates)
             case _:
                 pass
 
         raise TypeError(f"Unsupported table type {type(table)}")
+
+    @classmethod
+    def _create_csv_reader(
+        cls,
+        table: CSVTable,
+        columns: list[int] | None = None,
+        predicates: list[ColumnPredicate] | None = None,
+    ) -> TableReader:
+        match table.get_scan_mode():
+            case ScanMode.PARALLEL:
+                return ParallelCSVTableReader(table, columns, predicates)
+            case ScanMode.MMAP:
+                return MMapCSVTableReader(table, columns, predicates)
+            case _:
+                return CSVTableReader(table, columns, predicates)
@@ -0,0 +1,149 @@
+import struct
+from collections.abc import Callable, Iterator
+from typing import BinaryIO
+
+from storage.schema import Schema
+from storage.tuple import Tuple
+from type.interner import ValueInterner
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+_NULL = 0
+_PRESENT = 1
+_WIDE_INT = 2
+
+_I64_MIN = -(2**63)
+_I64_MAX = 2**63 - 1
+
+Encoder = Callable[[object], bytes]
+Decoder = Callable[[bytes, int, int], tuple[object, int]]
+
+
+class RowCodec:
+    def __init__(self, schema: Schema) -> None:
+        self._schema = schema
+        self._type_ids = [c.get_type_id() for c in schema.get_columns()]
+        self._encoders: list[Encoder] = [
+            _ENCODERS[type_id] for type_id in self._type_ids
+        ]
+        self._decoders: list[Decoder] = [
+            _DECODERS[type_id] for type_id in self._type_ids
+        ]
+        self._interners = [
+            ValueInterner(type_id) for type_id in self._type_ids
+        ]
+
+    def get_schema(self) -> Schema:
+        return self._schema
+
+    def encode(self, tup: Tuple) -> bytes:
+        assert len(tup.values) == len(self._encoders), (
+            f"Value count doesn't match schema: {tup.values} vs {self._schema.get_columns()}"
+        )
+        data = b"".join(
+            encode(value.get_value())
+            for encode, value in zip(self._encoders, tup.values, strict=True)
+        )
+        return _U32.pack(len(data)) + data
+
+    def decode(self, data: bytes) -> Tuple:
+        values: list[Value] = []
+        pos = 0
+        for intern, decode in zip(
+            self._interners, self._decoders, strict=True
+        ):
+            tag = data[pos]
+            pos += 1
+            if tag == _NULL:
+                values.append(intern(None))
+                continue
+            val, pos = decode(data, pos, tag)
+            values.append(intern(val))
+        return Tuple.create_unchecked(values, self._schema)
+
+    def write(self, file: BinaryIO, tup: Tuple) -> None:
+        file.write(self.encode(tup))
+
+    def read(self, file: BinaryIO) -> Iterator[Tuple]:
+        while header := file.read(_U32.size):
+            (length,) = _U32.unpack(header)
+            yield self.decode(file.read(length))
+
+
+def _encode_int(val: object) -> bytes:
+    if val is None:
+        return bytes((_NULL,))
+    assert isinstance(val, int)
+    if _I64_MIN <= val <= _I64_MAX:
+        return bytes((_PRESENT,)) + _I64.pack(val)
+    # Integers wider than 64 bits are stored as text
+    return bytes((_WIDE_INT,)) + _encode_text(str(val))
+
+
+def _encode_decimal(val: object) -> bytes:
+    if val is None:
+        return bytes((_NULL,))
+    return bytes((_PRESENT,)) + _F64.pack(val)
+
+
+def _encode_boolean(val: object) -> bytes:
+    if val is None:
+        return bytes((_NULL,))
+    return bytes((_PRESENT, 1 if val else 0))
+
+
+def _encode_string(val: object) -> bytes:
+    if val is None:
+        return bytes((_NULL,))
+    return bytes((_PRESENT,)) + _encode_text(str(val))
+
+
+def _encode_text(val: str) -> bytes:
+    encoded = val.encode()
+    return _U32.pack(len(encoded)) + encoded
+
+
+def _decode_int(data: bytes, pos: int, tag: int) -> tuple[object, int]:
+    if tag == _WIDE_INT:
+        text, pos = _decode_text(data, pos)
+        return int(text), pos
+    (val,) = _I64.unpack_from(data, pos)
+    return val, pos + _I64.size
+
+
+def _decode_decimal(data: bytes, pos: int, tag: int) -> tuple[object, int]:
+    (val,) = _F64.unpack_from(data, pos)
+    return val, pos + _F64.size
+
+
+def _decode_boolean(data: bytes, pos: int, tag: int) -> tuple[object, int]:
+    return bool(data[pos]), pos + 1
+
+
+def _decode_string(data: bytes, pos: int, tag: int) -> tuple[object, int]:
+    return _decode_text(data, pos)
+
+
+def _decode_text(data: bytes, pos: int) -> tuple[str, int]:
+    (length,) = _U32.unpack_from(data, pos)
+    pos += _U32.size
+    return data[pos : pos + length].decode(), pos + length
+
+
+_ENCODERS: dict[TypeEnum, Encoder] = {
+    TypeEnum.INT: _encode_int,
+    TypeEnum.DECIMAL: _encode_decimal,
+    TypeEnum.BOOLEAN: _encode_boolean,
+    TypeEnum.STRING: _encode_string,
+}
+_DECODERS: dict[TypeEnum, Decoder] = {
+    TypeEnum.INT: _decode_int,
+    TypeEnum.DECIMAL: _decode_decimal,
+    TypeEnum.BOOLEAN: _decode_boolean,
+    TypeEnum.STRING: _decode_string,
+}
@@ -0,0 +1,305 @@
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from storage.batch import ColumnBatch, RecordBatch
+from storage.predicate import ColumnPredicate
+from storage.schema import Column, Schema
+from storage.zone_map import ZoneMap
+from type.type_enum import TypeEnum
+
+
+SIDECAR_SUFFIX = ".colcache"
+
+_MAGIC = b"CSVC"
+_VERSION = 3
+_HEADER = struct.Struct("<4sHBQq?H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_STAT_FORMATS: dict[TypeEnum, struct.Struct] = {
+    TypeEnum.INT: struct.Struct("<qq"),
+    TypeEnum.DECIMAL: struct.Struct("<dd"),
+    TypeEnum.BOOLEAN: struct.Struct("<??"),
+}
+_TYPECODES: dict[TypeEnum, str] = {
+    TypeEnum.INT: "q",
+    TypeEnum.DECIMAL: "d",
+    TypeEnum.BOOLEAN: "b",
+}
+_CODE_TYPECODE = "I"
+
+
+class SidecarError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    size: int
+    mtime_ns: int
+    # The same file read with or without its header row holds other rows
+    skip_first: bool = True
+
+    @classmethod
+    def from_path(cls, path: str, skip_first: bool = True) -> "Fingerprint":
+        stat = os.stat(path)
+        return cls(stat.st_size, stat.st_mtime_ns, skip_first)
+
+
+def get_sidecar_path(csv_path: str) -> str:
+    return csv_path + SIDECAR_SUFFIX
+
+
+class SidecarWriter:
+    def __init__(
+        self, path: str, schema: Schema, fingerprint: Fingerprint
+    ) -> None:
+        self._path = path
+        self._tmp_path = f"{path}.{os.getpid()}.tmp"
+        self._schema = schema
+        self._file: BinaryIO = open(self._tmp_path, "wb")
+        self._write_header(fingerprint)
+
+    def write_batch(self, batch: RecordBatch) -> None:
+        blocks: list[bytes] = []
+        for column in batch.get_columns():
+            block = _encode_column(column)
+            blocks.append(_U32.pack(len(block)))
+            blocks.append(block)
+        data = b"".join(blocks)
+        stats = b"".join(
+            _encode_zone_map(column.get_type_id(), ZoneMap.from_column(column))
+            for column in batch.get_columns()
+        )
+
+        self._file.write(_U32.pack(batch.get_row_count()))
+        self._file.write(stats)
+        self._file.write(_U64.pack(len(data)))
+        self._file.write(data)
+
+    def commit(self) -> None:
+        self._file.close()
+        os.replace(self._tmp_path, self._path)
+
+    def abort(self) -> None:
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def _write_header(self, fingerprint: Fingerprint) -> None:
+        self._file.write(
+            _HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                sys.byteorder == "little",
+                fingerprint.size,
+                fingerprint.mtime_ns,
+                fingerprint.skip_first,
+                self._schema.get_column_count(),
+            )
+        )
+        for column in self._schema.get_columns():
+            _write_string(self._file, column.get_name())
+            _write_string(self._file, column.get_type_id().value)
+
+
+class SidecarReader:
+    def __init__(self, path: str, schema: Schema) -> None:
+        self._path = path
+        self._schema = schema
+
+    def is_valid(self, fingerprint: Fingerprint) -> bool:
+        if not os.path.exists(self._path):
+            return False
+        try:
+            with open(self._path, "rb") as file:
+                return self._read_header(file) == fingerprint
+        except (SidecarError, struct.error, UnicodeDecodeError, ValueError):
+            return False
+
+    def read_batches(
+        self,
+        predicates: list[ColumnPredicate] | None = None,
+        columns: list[int] | None = None,
+    ) -> Iterator[RecordBatch]:
+        predicates = predicates or []
+        indices = [
+            self._schema.get_column_idx(p.get_column().get_name())
+            for p in predicates
+        ]
+        selected = (
+            columns
+            if columns is not None
+            else list(range(self._schema.get_column_count()))
+        )
+        wanted = set(selected)
+        output_schema = Schema([self._schema.get_column(i) for i in selected])
+
+        with open(self._path, "rb") as file:
+            self._read_header(file)
+            while header := file.read(_U32.size):
+                (row_count,) = _U32.unpack(header)
+                zone_maps = [
+                    _read_zone_map(file, column.get_type_id(), row_count)
+                    for column in self._schema.get_columns()
+                ]
+                (length,) = _U64.unpack(file.read(_U64.size))
+                if not all(
+                    zone_maps[idx].might_match(predicate)
+                    for idx, predicate in zip(indices, predicates, strict=True)
+                ):
+                    file.seek(length, os.SEEK_CUR)
+                    continue
+
+                decoded: dict[int, ColumnBatch] = {}
+                for idx, column in enumerate(self._schema.get_columns()):
+                    (size,) = _U32.unpack(file.read(_U32.size))
+                    if idx not in wanted:
+                        file.seek(size, os.SEEK_CUR)
+                        continue
+                    decoded[idx] = _decode_column(
+                        column.get_type_id(), file.read(size), row_count
+                    )
+                yield RecordBatch(
+                    [decoded[idx] for idx in selected],
+                    output_schema,
+                    row_count,
+                )
+
+    def read_zone_maps(self) -> list[list[ZoneMap]]:
+        result: list[list[ZoneMap]] = []
+        with open(self._path, "rb") as file:
+            self._read_header(file)
+            while header := file.read(_U32.size):
+                (row_count,) = _U32.unpack(header)
+                result.append(
+                    [
+                        _read_zone_map(file, column.get_type_id(), row_count)
+                        for column in self._schema.get_columns()
+                    ]
+                )
+                (length,) = _U64.unpack(file.read(_U64.size))
+                file.seek(length, os.SEEK_CUR)
+        return result
+
+    def _read_header(self, file: BinaryIO) -> Fingerprint:
+        magic, version, little, size, mtime_ns, skip_first, count = (
+            _HEADER.unpack(file.read(_HEADER.size))
+        )
+        if magic != _MAGIC or version != _VERSION:
+            raise SidecarError(f"Unsupported sidecar file {self._path}")
+        if little != (sys.byteorder == "little"):
+            raise SidecarError("Sidecar byte order doesn't match platform")
+
+        columns = [
+            Column(_read_string(file), TypeEnum(_read_string(file)))
+            for _ in range(count)
+        ]
+        if columns != self._schema.get_columns():
+            raise SidecarError("Sidecar schema doesn't match table schema")
+
+        return Fingerprint(size, mtime_ns, skip_first)
+
+
+def _encode_column(column: ColumnBatch) -> bytes:
+    data = column.get_data()
+    nulls = bytes(column.get_nulls())
+    type_id = column.get_type_id()
+
+    if type_id == TypeEnum.STRING:
+        dictionary: dict[object, int] = {}
+        codes = array(
+            _CODE_TYPECODE,
+            (
+                0
+                if val is None
+                else dictionary.setdefault(val, len(dictionary))
+                for val in data
+            ),
+        )
+        parts = [nulls, _U32.pack(len(dictionary))]
+        for val in dictionary:
+            encoded = str(val).encode()
+            parts.append(_U32.pack(len(encoded)))
+            parts.append(encoded)
+        parts.append(codes.tobytes())
+        return b"".join(parts)
+
+    if not isinstance(data, array):
+        raise SidecarError(f"Column of {type_id.value} is not fixed width")
+    return nulls + data.tobytes()
+
+
+def _decode_column(type_id: TypeEnum, block: bytes, rows: int) -> ColumnBatch:
+    nulls = bytearray(block[:rows])
+    pos = rows
+
+    if type_id == TypeEnum.STRING:
+        (size,) = _U32.unpack_from(block, pos)
+        pos += _U32.size
+        dictionary: list[str] = []
+        for _ in range(size):
+            (length,) = _U32.unpack_from(block, pos)
+            pos += _U32.size
+            dictionary.append(block[pos : pos + length].decode())
+            pos += length
+        codes = array(_CODE_TYPECODE)
+        codes.frombytes(block[pos:])
+        values: list[object] = [
+            None if null else dictionary[code]
+            for code, null in zip(codes, nulls, strict=True)
+        ]
+        return ColumnBatch(type_id, values, nulls)
+
+    data = array(_TYPECODES[type_id])
+    data.frombytes(block[pos:])
+    return ColumnBatch(type_id, data, nulls)
+
+
+def _encode_zone_map(type_id: TypeEnum, zone_map: ZoneMap) -> bytes:
+    header = _U32.pack(zone_map.null_count)
+    if not zone_map.has_values():
+        return header
+
+    stat_format = _STAT_FORMATS.get(type_id)
+    if stat_format is None:
+        return header + b"".join(
+            _U32.pack(len(encoded)) + encoded
+            for encoded in (
+                str(zone_map.min).encode(),
+                str(zone_map.max).encode(),
+            )
+        )
+    try:
+        return header + stat_format.pack(zone_map.min, zone_map.max)
+    except struct.error as exc:
+        raise SidecarError("Column statistics are out of range") from exc
+
+
+def _read_zone_map(file: BinaryIO, type_id: TypeEnum, rows: int) -> ZoneMap:
+    (null_count,) = _U32.unpack(file.read(_U32.size))
+    if null_count == rows:
+        return ZoneMap(rows, null_count)
+
+    stat_format = _STAT_FORMATS.get(type_id)
+    if stat_format is None:
+        return ZoneMap(
+            rows, null_count, _read_string(file), _read_string(file)
+        )
+    low, high = stat_format.unpack(file.read(stat_format.size))
+    return ZoneMap(rows, null_count, low, high)
+
+
+def _write_string(file: BinaryIO, val: str) -> None:
+    encoded = val.encode()
+    file.write(_U32.pack(len(encoded)))
+    file.write(encoded)
+
+
+def _read_string(file: BinaryIO) -> str:
+    (length,) = _U32.unpack(file.read(_U32.size))
+    return file.read(length).decode()
@@ -1,15 +1,38 @@
 from abc import ABC
+from dataclasses import dataclass
+from enum import Enum
 
 from storage.schema import Schema
 
 
+class ScanMode(str, Enum):
+    SEQUENTIAL = "sequential"
+    PARALLEL = "parallel"
+    MMAP = "mmap"
+
+
+@dataclass(frozen=True)
+class ScanOptions:
+    mode: ScanMode = ScanMode.SEQUENTIAL
+    workers: int | None = None
+    preserve_order: bool = True
+    use_cache: bool = False
+    lazy_decode: bool = False
+
+
 class Table(ABC):
-    def __init__(self, schema: Schema) -> None:
+    def __init__(
+        self, schema: Schema, sorted_by: list[str] | None = None
+    ) -> None:
         self._schema = schema
+        self._sorted_by = sorted_by or []
 
     def get_schema(self) -> Schema:
         return self._schema
 
+    def get_sorted_by(self) -> list[str]:
+        return self._sorted_by.copy()
+
 
 class StringTable(Table):
     def __init__(self, data: str, schema: Schema) -> None:
@@ -25,14 +48,44 @@ class StringTable(Table):
 
 class CSVTable(Table):
     def __init__(
-        self, path: str, schema: Schema, skip_first: bool = True
+        self,
+        path: str,
+        schema: Schema,
+        skip_first: bool = True,
+        options: ScanOptions | None = None,
+        sorted_by: list[str] | None = None,
     ) -> None:
-        super().__init__(schema)
+        super().__init__(schema, sorted_by)
         self._path = path
         self._skip_first = skip_first
+        self._options = options or ScanOptions()
 
     def get_path(self) -> str:
         return self._path
 
     def get_skip_first(self) -> bool:
         return self._skip_first
+
+    def get_options(self) -> ScanOptions:
+        return self._options
+
+    def get_scan_mode(self) -> ScanMode:
+        return self._options.mode
+
+    def get_workers(self) -> int | None:
+        return self._options.workers
+
+    def get_preserve_order(self) -> bool:
+        return self._options.preserve_order
+
+    def get_use_cache(self) -> bool:
+        return self._options.use_cache
+
+    def get_lazy_decode(self) -> bool:
+        return self._options.lazy_decode
+
+    def is_scan_ordered(self) -> bool:
+        return (
+            self._options.mode != ScanMode.PARALLEL
+            or self._options.preserve_order
+        )
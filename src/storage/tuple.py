@@ -1,18 +1,21 @@
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Self
 
 from storage.schema import Schema
 from type.value import Value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tuple:
-    values: list[Value]
+    values: Sequence[Value]
     schema: Schema
 
     def __post_init__(self):
-        assert (
-            len(self.values) == self.schema.get_column_count()
-        ), f"Value count doesn't match schema: {self.values} vs {self.schema.get_columns()}"
+        assert len(self.values) == self.schema.get_column_count(), (
+            f"Value count doesn't match schema: {self.values} vs {self.schema.get_columns()}"
+        )
 
     def get_value(self, index: int) -> Value:
         return self.values[index]
@@ -21,5 +24,21 @@ class Tuple:
         idx = self.schema.get_column_idx(name)
         return self.values[idx]
 
+    def get_footprint(self) -> int:
+        # The schema is shared by every row, so only the row itself counts
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.values)
+            + sum(value.get_footprint() for value in self.values)
+        )
+
+    @classmethod
+    def create_unchecked(cls, values: Sequence[Value], schema: Schema) -> Self:
+        # Skips the width check, for rows a decoder already checked
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "values", values)
+        object.__setattr__(instance, "schema", schema)
+        return instance
+
     def __str__(self) -> str:
         return ",".join(str(v) for v in self.values)
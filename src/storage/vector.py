@@ -0,0 +1,117 @@
+from collections.abc import Sequence
+from typing import Any
+
+from storage.batch import ColumnBatch
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional, vectors fall back to Python lists without it
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+
+_DTYPES: dict[TypeEnum, str] = {
+    TypeEnum.INT: "int64",
+    TypeEnum.DECIMAL: "float64",
+    TypeEnum.BOOLEAN: "bool",
+    TypeEnum.STRING: "object",
+}
+_NULL_PLACEHOLDERS: dict[TypeEnum, object] = {
+    TypeEnum.INT: 0,
+    TypeEnum.DECIMAL: 0.0,
+    TypeEnum.BOOLEAN: False,
+    TypeEnum.STRING: "",
+}
+_NATIVE_TYPES: dict[TypeEnum, type] = {
+    TypeEnum.INT: int,
+    TypeEnum.DECIMAL: float,
+    TypeEnum.BOOLEAN: bool,
+    TypeEnum.STRING: str,
+}
+
+
+class ColumnVector:
+    def __init__(self, type_id: TypeEnum, data: Any, validity: Any) -> None:
+        assert len(data) == len(validity), (
+            f"Validity count doesn't match data: {len(validity)} vs {len(data)}"
+        )
+        self._type_id = type_id
+        self._data = data
+        self._validity = validity
+
+    def get_type_id(self) -> TypeEnum:
+        return self._type_id
+
+    def get_data(self) -> Any:
+        return self._data
+
+    def get_validity(self) -> Any:
+        return self._validity
+
+    def is_numpy(self) -> bool:
+        return HAS_NUMPY and isinstance(self._data, np.ndarray)
+
+    def is_valid(self, index: int) -> bool:
+        return bool(self._validity[index])
+
+    def get_native(self, index: int) -> object:
+        if not self._validity[index]:
+            return None
+        return _NATIVE_TYPES[self._type_id](self._data[index])
+
+    def get_value(self, index: int) -> Value:
+        return Value(self._type_id, self.get_native(index))
+
+    def to_natives(self) -> list[object]:
+        return [self.get_native(i) for i in range(len(self))]
+
+    def to_values(self) -> list[Value]:
+        return [self.get_value(i) for i in range(len(self))]
+
+    def __len__(self) -> int:
+        return len(self._validity)
+
+    @classmethod
+    def from_natives(
+        cls, type_id: TypeEnum, values: Sequence[object]
+    ) -> "ColumnVector":
+        placeholder = _NULL_PLACEHOLDERS[type_id]
+        validity = [val is not None for val in values]
+        data = [placeholder if val is None else val for val in values]
+        return cls.create(type_id, data, validity)
+
+    @classmethod
+    def from_constant(cls, value: Value, length: int) -> "ColumnVector":
+        return cls.from_natives(
+            value.get_type_id(), [value.get_value()] * length
+        )
+
+    @classmethod
+    def from_batch(cls, column: ColumnBatch) -> "ColumnVector":
+        type_id = column.get_type_id()
+        validity = [not null for null in column.get_nulls()]
+        data = column.get_data()
+        if type_id == TypeEnum.STRING:
+            placeholder = _NULL_PLACEHOLDERS[type_id]
+            data = [placeholder if val is None else val for val in data]
+        elif type_id == TypeEnum.BOOLEAN:
+            data = [bool(val) for val in data]
+        return cls.create(type_id, data, validity)
+
+    @classmethod
+    def create(
+        cls, type_id: TypeEnum, data: Sequence[object], validity: list[bool]
+    ) -> "ColumnVector":
+        if not HAS_NUMPY:
+            return cls(type_id, list(data), validity)
+        try:
+            array = np.asarray(data, dtype=_DTYPES[type_id])
+        except OverflowError:
+            # Integers wider than 64 bits stay Python ints
+            return cls(type_id, list(data), validity)
+        return cls(type_id, array, np.asarray(validity, dtype=bool))
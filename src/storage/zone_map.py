@@ -0,0 +1,67 @@
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from storage.batch import ColumnBatch
+from storage.predicate import ColumnPredicate
+from type.enums import ComparisonOperandEnum
+from type.type_enum import TypeEnum
+
+
+BoundCheck = Callable[[Any, Any, Any], bool]
+
+_BOUND_CHECKS: dict[ComparisonOperandEnum, BoundCheck] = {
+    ComparisonOperandEnum.EQ: lambda low, high, val: low <= val <= high,
+    ComparisonOperandEnum.NEQ: lambda low, high, val: not (low == val == high),
+    ComparisonOperandEnum.LT: lambda low, high, val: low < val,
+    ComparisonOperandEnum.LTE: lambda low, high, val: low <= val,
+    ComparisonOperandEnum.GT: lambda low, high, val: high > val,
+    ComparisonOperandEnum.GTE: lambda low, high, val: high >= val,
+}
+
+
+@dataclass(frozen=True)
+class ZoneMap:
+    row_count: int
+    null_count: int
+    min: Any = None
+    max: Any = None
+
+    @classmethod
+    def from_column(cls, column: ColumnBatch) -> "ZoneMap":
+        nulls = column.get_nulls()
+        null_count = nulls.count(1)
+        row_count = len(column)
+        if null_count == row_count:
+            return cls(row_count, null_count)
+
+        data = column.get_data()
+        values = (
+            [val for val, null in zip(data, nulls, strict=True) if not null]
+            if null_count
+            else data
+        )
+        if column.get_type_id() == TypeEnum.DECIMAL and any(
+            math.isnan(val) for val in values
+        ):
+            # NaN doesn't order, so the chunk gets bounds that never prune
+            return cls(row_count, null_count, math.nan, math.nan)
+        return cls(row_count, null_count, min(values), max(values))
+
+    def has_values(self) -> bool:
+        return self.null_count < self.row_count
+
+    def might_match(self, predicate: ColumnPredicate) -> bool:
+        if not self.has_values() or predicate.get_value().is_null():
+            return False
+        check = _BOUND_CHECKS.get(predicate.get_op())
+        if check is None or not predicate.is_comparable() or self.has_nan():
+            return True
+        return check(self.min, self.max, predicate.get_value().get_value())
+
+    def has_nan(self) -> bool:
+        return any(
+            isinstance(bound, float) and math.isnan(bound)
+            for bound in (self.min, self.max)
+        )
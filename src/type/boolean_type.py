@@ -48,13 +48,18 @@ class BooleanType(Type):
         if left.is_null() or right.is_null():
             return ComparisonValue.NULL
 
-        lval = bool(left.get_value())
-        rval = bool(right.cast(TypeEnum.BOOLEAN).get_value())
-
-        return self._compare_with_op(lval, rval, op)
+        return self._compare_with_op(left, right, op)
 
     def deserialize(self, raw: bytes) -> "Value":
-        return Value.create_string(raw.decode()).cast(self.get_type_id())
+        return Value(self._type_id, self.parse(raw.decode()))
+
+    def parse(self, raw: str) -> object:
+        s = raw.lower()
+        if s in {"true", "1"}:
+            return True
+        elif s in {"false", "0"}:
+            return False
+        raise ValueError("Boolean value format error")
 
     def _calculate_modification(
         self, left: Value, right: Value, op: ModificationOperandEnum
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from copy import copy
 from typing import cast
 
@@ -49,13 +50,21 @@ class DecimalType(Type):
         if left.is_null() or right.is_null():
             return ComparisonValue.NULL
 
-        lval = cast(float, left.get_value())
-        rval = cast(float, right.cast(TypeEnum.DECIMAL).get_value())
+        return self._compare_with_op(left, right, op)
 
-        return self._compare_with_op(lval, rval, op)
+    def get_parser(self) -> Callable[[str], object]:
+        return float
 
     def deserialize(self, raw: bytes) -> "Value":
-        return Value.create_string(raw.decode()).cast(self.get_type_id())
+        return Value(self._type_id, self.parse(raw.decode()))
+
+    def parse(self, raw: str) -> object:
+        try:
+            return float(raw)
+        except ValueError as exc:
+            raise ValueError(
+                f"Cannot convert string '{raw}' to decimal"
+            ) from exc
 
     def _calculate_modification(
         self, left: Value, right: Value, op: ModificationOperandEnum
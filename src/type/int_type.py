@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from copy import copy
 from typing import cast
 
@@ -7,7 +8,7 @@ from type.enums import (
     ModificationOperandEnum,
 )
 from type.type import Type
-from type.type_enum import NUMERIC_TYPES, TypeEnum
+from type.type_enum import TypeEnum
 from type.value import Value
 
 
@@ -49,20 +50,21 @@ class IntType(Type):
         if left.is_null() or right.is_null():
             return ComparisonValue.NULL
 
-        if (
-            left.get_type_id() in NUMERIC_TYPES
-            and right.get_type_id() in NUMERIC_TYPES
-        ):
-            lval = cast(float, left.cast(TypeEnum.DECIMAL).get_value())
-            rval = cast(float, right.cast(TypeEnum.DECIMAL).get_value())
-        else:
-            lval = cast(int, left.get_value())
-            rval = cast(int, right.cast(TypeEnum.INT).get_value())
+        return self._compare_with_op(left, right, op)
 
-        return self._compare_with_op(lval, rval, op)
+    def get_parser(self) -> Callable[[str], object]:
+        return int
 
     def deserialize(self, raw: bytes) -> "Value":
-        return Value.create_string(raw.decode()).cast(self.get_type_id())
+        return Value(self._type_id, self.parse(raw.decode()))
+
+    def parse(self, raw: str) -> object:
+        try:
+            return int(raw)
+        except ValueError as exc:
+            raise ValueError(
+                f"Cannot convert string '{raw}' to integer"
+            ) from exc
 
     def _calculate_modification(
         self, left: Value, right: Value, op: ModificationOperandEnum
@@ -0,0 +1,42 @@
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+DEFAULT_INTERN_CAPACITY = 65_536
+
+
+class ValueInterner:
+    def __init__(
+        self, type_id: TypeEnum, capacity: int = DEFAULT_INTERN_CAPACITY
+    ) -> None:
+        assert capacity >= 0, (
+            f"Intern capacity must be non-negative: {capacity}"
+        )
+        self._type_id = type_id
+        self._capacity = capacity
+        self._strings: dict[object, Value] = {}
+
+    def get_type_id(self) -> TypeEnum:
+        return self._type_id
+
+    def get_size(self) -> int:
+        return len(self._strings)
+
+    def __call__(self, val: object) -> Value:
+        if self._type_id != TypeEnum.STRING or val is None:
+            return Value.intern(self._type_id, val)
+
+        cached = self._strings.get(val)
+        if cached is not None:
+            return cached
+        cached = Value.create_unchecked(self._type_id, val)
+        # Past the capacity the column is treated as high-cardinality
+        if len(self._strings) < self._capacity:
+            self._strings[val] = cached
+        return cached
+
+    def __getstate__(self) -> dict[str, object]:
+        # Worker processes build their own cache
+        state = self.__dict__.copy()
+        state["_strings"] = {}
+        return state
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from copy import copy
 
 from type.enums import (
@@ -63,13 +64,16 @@ class StringType(Type):
         if left.is_null() or right.is_null():
             return ComparisonValue.NULL
 
-        lval = str(left.get_value())
-        rval = str(right.cast(TypeEnum.STRING).get_value())
+        return self._compare_with_op(left, right, op)
 
-        return self._compare_with_op(lval, rval, op)
+    def get_parser(self) -> Callable[[str], object]:
+        return str
 
     def deserialize(self, raw: bytes) -> "Value":
-        return Value.create_string(raw.decode()).cast(self.get_type_id())
+        return Value(self._type_id, self.parse(raw.decode()))
+
+    def parse(self, raw: str) -> object:
+        return raw
 
     def _calculate_modification(
         self, left: Value, right: Value, op: ModificationOperandEnum
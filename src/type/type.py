@@ -1,4 +1,6 @@
+import operator
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -19,6 +21,35 @@ if TYPE_CHECKING:
     from type.value import Value
 
 
+Comparator = Callable[[Any, Any], bool]
+ComparatorKey = tuple[TypeEnum, TypeEnum, ComparisonOperandEnum]
+
+_OPERATORS: dict[ComparisonOperandEnum, Comparator] = {
+    ComparisonOperandEnum.EQ: operator.eq,
+    ComparisonOperandEnum.NEQ: operator.ne,
+    ComparisonOperandEnum.LT: operator.lt,
+    ComparisonOperandEnum.LTE: operator.le,
+    ComparisonOperandEnum.GT: operator.gt,
+    ComparisonOperandEnum.GTE: operator.ge,
+}
+# Values of the same type compare natively, ints and floats compare
+# exactly with each other
+_COMPARABLE_TYPES: list[tuple[TypeEnum, TypeEnum]] = [
+    *(
+        (type_id, type_id)
+        for type_id in TypeEnum
+        if type_id != TypeEnum.INVALID
+    ),
+    (TypeEnum.INT, TypeEnum.DECIMAL),
+    (TypeEnum.DECIMAL, TypeEnum.INT),
+]
+_COMPARATORS: dict[ComparatorKey, Comparator] = {
+    (left, right, op): compare
+    for left, right in _COMPARABLE_TYPES
+    for op, compare in _OPERATORS.items()
+}
+
+
 @runtime_checkable
 class Comparable(Protocol):
     def __eq__(self, other: object, /) -> bool: ...
@@ -59,6 +90,12 @@ class Type(ABC):
     @abstractmethod
     def deserialize(self, raw: bytes) -> "Value": ...
 
+    @abstractmethod
+    def parse(self, raw: str) -> object: ...
+
+    def get_parser(self) -> Callable[[str], object]:
+        return self.parse
+
     def add(self, left: "Value", right: "Value") -> "Value":
         return self.modify(left, right, ModificationOperandEnum.ADD)
 
@@ -106,21 +143,30 @@ class Type(ABC):
     ) -> "Value": ...
 
     def _compare_with_op(
-        self, lval: Comparable, rval: Comparable, op: ComparisonOperandEnum
+        self, left: "Value", right: "Value", op: ComparisonOperandEnum
     ) -> ComparisonValue:
-        result = {
-            ComparisonOperandEnum.EQ: lval == rval,
-            ComparisonOperandEnum.NEQ: lval != rval,
-            ComparisonOperandEnum.LT: lval < rval,
-            ComparisonOperandEnum.LTE: lval <= rval,
-            ComparisonOperandEnum.GT: lval > rval,
-            ComparisonOperandEnum.GTE: lval >= rval,
-        }.get(op)
-
-        if result is None:
-            raise ValueError(f"Unsupported comparison operator: {op}")
-
-        return ComparisonValue.TRUE if result else ComparisonValue.FALSE
+        compare = self.get_comparator(
+            left.get_type_id(), right.get_type_id(), op
+        )
+        if compare(left.get_value(), right.get_value()):
+            return ComparisonValue.TRUE
+        return ComparisonValue.FALSE
+
+    @classmethod
+    def get_comparator(
+        cls,
+        left_type: TypeEnum,
+        right_type: TypeEnum,
+        op: ComparisonOperandEnum,
+    ) -> Comparator:
+        compare = _COMPARATORS.get((left_type, right_type, op))
+        if compare is None:
+            if op not in _OPERATORS:
+                raise ValueError(f"Unsupported comparison operator: {op}")
+            raise TypeError(
+                f"Values of {left_type.value} and {right_type.value} are not comparable"
+            )
+        return compare
 
     @classmethod
     def check_comparable(cls, left: "Value", right: "Value") -> bool:
@@ -1,3 +1,4 @@
+import sys
 from typing import Self, overload
 
 from type.enums import ComparisonOperandEnum, ComparisonValue
@@ -6,6 +7,8 @@ from type.type_enum import TypeEnum
 
 
 class Value:
+    __slots__ = ("_type_id", "_value")
+
     def __init__(self, type_id: TypeEnum, value: object):
         assert value is None or isinstance(
             value, Type.get_instance(type_id).get_required_type()
@@ -22,6 +25,11 @@ class Value:
     def is_null(self) -> bool:
         return self._value is None
 
+    def get_footprint(self) -> int:
+        # Shared values are counted for every reference, so this is an
+        # upper bound
+        return sys.getsizeof(self) + sys.getsizeof(self._value)
+
     def cast(self, type_id: TypeEnum) -> "Value":
         return self.get_instance().cast(self, type_id)
 
@@ -123,6 +131,28 @@ class Value:
     def create_null_from_type_id(cls, type_id: TypeEnum) -> Self:
         return cls.create(type_id, None)
 
+    @classmethod
+    def create_unchecked(cls, type_id: TypeEnum, value: object) -> Self:
+        # Skips the type check, for values a parser or codec produced
+        instance = object.__new__(cls)
+        instance._type_id = type_id
+        instance._value = value
+        return instance
+
+    @classmethod
+    def intern(cls, type_id: TypeEnum, value: object) -> "Value":
+        # Values are never mutated, so common ones are shared
+        if value is None:
+            return _NULLS[type_id]
+        if type_id == TypeEnum.BOOLEAN:
+            return _BOOLEANS[value]  # type: ignore
+        if (
+            type_id == TypeEnum.INT
+            and _SMALL_INT_MIN <= value <= _SMALL_INT_MAX  # type: ignore
+        ):
+            return _SMALL_INTS[value - _SMALL_INT_MIN]  # type: ignore
+        return cls.create_unchecked(type_id, value)
+
     def __str__(self) -> str:
         return self.to_string()
 
@@ -133,3 +163,21 @@ class Value:
 
     def __hash__(self):
         return hash((self._value, self._type_id))
+
+
+_SMALL_INT_MIN = -128
+_SMALL_INT_MAX = 1024
+
+_NULLS: dict[TypeEnum, Value] = {
+    type_id: Value.create_unchecked(type_id, None)
+    for type_id in TypeEnum
+    if type_id != TypeEnum.INVALID
+}
+_BOOLEANS: dict[bool, Value] = {
+    flag: Value.create_unchecked(TypeEnum.BOOLEAN, flag)
+    for flag in (False, True)
+}
+_SMALL_INTS: list[Value] = [
+    Value.create_unchecked(TypeEnum.INT, val)
+    for val in range(_SMALL_INT_MIN, _SMALL_INT_MAX + 1)
+]
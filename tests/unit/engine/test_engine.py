@@ -25,7 +25,7 @@ class TestEngine:
         self.tuple1 = Tuple([Value(TypeEnum.INT, 1)], self.schema)
         self.tuple2 = Tuple([Value(TypeEnum.INT, 2)], self.schema)
         self.executor = Mock(spec=Executor)
-        self.executor.next.side_effect = [self.tuple1, self.tuple2, None]
+        self.executor.next_batch.side_effect = [[self.tuple1, self.tuple2], []]
         self.executor_factory = Mock(spec=ExecutorFactory)
         self.executor_factory.create_executor.return_value = self.executor
         self.plan = Mock(spec=ExecutionPlan)
@@ -38,17 +38,16 @@ class TestEngine:
         assert result[0] == self.tuple1
         assert result[1] == self.tuple2
         self.executor.init.assert_called_once()
-        assert self.executor.next.call_count == 3
+        assert self.executor.next_batch.call_count == 2
 
     def test_run_empty_result(self):
-        self.executor.next.side_effect = [None]
-        self.executor.next.return_value = None
+        self.executor.next_batch.side_effect = [[]]
         result = self.engine.run()
         assert isinstance(result, list)
         assert len(result) == 0
 
         self.executor.init.assert_called_once()
-        self.executor.next.assert_called_once()
+        self.executor.next_batch.assert_called_once()
 
     def test_run_with_complex_plan(self):
         table = Mock(spec=Table)
@@ -74,10 +73,12 @@ class TestEngine:
             None,
         ]  # Sorted order
         proj_executor = Mock(spec=Executor)
-        proj_executor.next.side_effect = [
-            Tuple([Value(TypeEnum.INT, 1)], output_schema),
-            Tuple([Value(TypeEnum.INT, 2)], output_schema),
-            None,
+        proj_executor.next_batch.side_effect = [
+            [
+                Tuple([Value(TypeEnum.INT, 1)], output_schema),
+                Tuple([Value(TypeEnum.INT, 2)], output_schema),
+            ],
+            [],
         ]
 
         def create_executor(plan: ExecutionPlan):
@@ -99,4 +100,14 @@ class TestEngine:
         assert result[0].schema == output_schema
         assert result[1].schema == output_schema
         proj_executor.init.assert_called_once()
-        assert proj_executor.next.call_count == 3
+        assert proj_executor.next_batch.call_count == 2
+
+    def test_run_closes_executor(self):
+        self.engine.run()
+        self.executor.close.assert_called_once()
+
+    def test_run_closes_executor_on_error(self):
+        self.executor.next_batch.side_effect = ValueError("bad row")
+        with pytest.raises(ValueError):
+            self.engine.run()
+        self.executor.close.assert_called_once()
@@ -3,6 +3,7 @@ from unittest.mock import Mock
 import pytest
 
 from engine.execution.aggregate import Aggregate, AggregationType
+from engine.execution.config import ExecutionConfig
 from engine.execution.executors.aggregation_executor import AggregationExecutor
 from engine.execution.executors.executor import Executor
 from engine.execution.expressions.aggregate_expression import (
@@ -10,10 +11,14 @@ from engine.execution.expressions.aggregate_expression import (
     CountExpression,
     MaxExpression,
     MinExpression,
+    NativeAvgExpression,
+    NativeSumExpression,
     SumExpression,
 )
+from engine.execution.expressions.column_expression import ColumnExpression
 from engine.execution.expressions.expression import Expression
 from engine.execution.plan.aggregation_plan import AggregationPlan
+from storage.batch import RecordBatchBuilder
 from storage.schema import Column, Schema
 from storage.tuple import Tuple
 from type.type_enum import TypeEnum
@@ -40,14 +45,14 @@ class TestAggregationExecutorInit:
             [Value(TypeEnum.STRING, "group1"), Value(TypeEnum.INT, 10)],
             self.schema,
         )
-        self.child_executor.next.return_value = self.tuple
+        self.child_executor.next_batch.return_value = []
         self.plan = AggregationPlan(
             [self.group_by_expr], [self.aggregate], self.schema, Mock()
         )
         self.executor = AggregationExecutor(self.plan, self.child_executor)
 
     def test_init_populates_hash_table(self):
-        self.child_executor.next.side_effect = [self.tuple, None]
+        self.child_executor.next_batch.side_effect = [[self.tuple], []]
         self.executor.init()
         hash_table = self.executor.get_hash_table()
 
@@ -68,7 +73,7 @@ class TestAggregationExecutorInit:
             self.executor.next()
 
     def test_next_yields_tuples(self):
-        self.child_executor.next.side_effect = [self.tuple, None]
+        self.child_executor.next_batch.side_effect = [[self.tuple], []]
         self.executor.init()
         result = self.executor.next()
 
@@ -84,8 +89,22 @@ class TestAggregationExecutorInit:
         assert result.values[1].compare_equals(Value(TypeEnum.INT, 1))
         assert self.executor.next() is None
 
+    def test_next_batch_finalizes_groups(self):
+        self.child_executor.next_batch.side_effect = [[self.tuple], []]
+        self.executor.init()
+
+        result = self.executor.next_batch()
+
+        assert len(result) == 1
+        assert result[0].values[1].compare_equals(Value(TypeEnum.INT, 1))
+        assert self.executor.next_batch() == []
+
+    def test_next_batch_without_init_raises(self):
+        with pytest.raises(RuntimeError):
+            self.executor.next_batch()
+
     def test_next_empty_input(self):
-        self.child_executor.next.return_value = None
+        self.child_executor.next_batch.return_value = []
         self.executor.init()
         assert self.executor.next() is None
         self.group_by_expr.evaluate.assert_not_called()
@@ -117,6 +136,25 @@ class TestAggregationExecutorInit:
         assert len(values) == 1
         assert isinstance(values[0], SumExpression)
 
+    @pytest.mark.parametrize(
+        ("aggregation_type", "expected"),
+        [
+            (AggregationType.SUM, NativeSumExpression),
+            (AggregationType.AVG, NativeAvgExpression),
+            (AggregationType.MIN, MinExpression),
+        ],
+    )
+    def test_get_initial_values_numeric(self, aggregation_type, expected):
+        expr = Mock(spec=Expression)
+        expr.get_return_type.return_value = TypeEnum.DECIMAL
+        self.executor._aggregates = [  # type: ignore
+            Aggregate(aggregation_type, expr, "value")
+        ]
+
+        values = self.executor.get_initital_values()
+
+        assert isinstance(values[0], expected)
+
     def test_get_initial_values_min(self):
         self.executor._aggregates = [  # type: ignore
             Aggregate(AggregationType.MIN, Mock(), "min")
@@ -159,7 +197,7 @@ class TestAggregationExecutorWork:
             [Value(TypeEnum.STRING, "group1"), Value(TypeEnum.INT, 10)],
             self.schema,
         )
-        self.child_executor.next.return_value = self.tuple
+        self.child_executor.next_batch.return_value = []
         self.plan = AggregationPlan(
             [self.group_by_expr], [self.aggregate], self.schema, Mock()
         )
@@ -179,16 +217,24 @@ class TestAggregationExecutorWork:
             [self.group_by_expr], [aggregate], schema, Mock()
         )
         executor = AggregationExecutor(plan, self.child_executor)
-        self.child_executor.next.side_effect = [
-            Tuple(
-                [Value(TypeEnum.STRING, "group1"), Value(TypeEnum.INT, 10)],
-                schema,
-            ),
-            Tuple(
-                [Value(TypeEnum.STRING, "group1"), Value(TypeEnum.INT, None)],
-                schema,
-            ),
-            None,
+        self.child_executor.next_batch.side_effect = [
+            [
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.INT, 10),
+                    ],
+                    schema,
+                ),
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.INT, None),
+                    ],
+                    schema,
+                ),
+            ],
+            [],
         ]
         executor.init()
         result = executor.next()
@@ -214,22 +260,24 @@ class TestAggregationExecutorWork:
             [self.group_by_expr], [aggregate], schema, Mock()
         )
         executor = AggregationExecutor(plan, self.child_executor)
-        self.child_executor.next.side_effect = [
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value(TypeEnum.DECIMAL, 10.5),
-                ],
-                schema,
-            ),
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value(TypeEnum.DECIMAL, 20.5),
-                ],
-                schema,
-            ),
-            None,
+        self.child_executor.next_batch.side_effect = [
+            [
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.DECIMAL, 10.5),
+                    ],
+                    schema,
+                ),
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.DECIMAL, 20.5),
+                    ],
+                    schema,
+                ),
+            ],
+            [],
         ]
         executor.init()
         result = executor.next()
@@ -253,22 +301,24 @@ class TestAggregationExecutorWork:
             [self.group_by_expr], [aggregate], schema, Mock()
         )
         executor = AggregationExecutor(plan, self.child_executor)
-        self.child_executor.next.side_effect = [
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value(TypeEnum.DECIMAL, 10.0),
-                ],
-                schema,
-            ),
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value(TypeEnum.DECIMAL, 20.0),
-                ],
-                schema,
-            ),
-            None,
+        self.child_executor.next_batch.side_effect = [
+            [
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.DECIMAL, 10.0),
+                    ],
+                    schema,
+                ),
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.DECIMAL, 20.0),
+                    ],
+                    schema,
+                ),
+            ],
+            [],
         ]
         executor.init()
         result = executor.next()
@@ -292,22 +342,24 @@ class TestAggregationExecutorWork:
             [self.group_by_expr], [aggregate], schema, Mock()
         )
         executor = AggregationExecutor(plan, self.child_executor)
-        self.child_executor.next.side_effect = [
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value(TypeEnum.DECIMAL, 10.0),
-                ],
-                schema,
-            ),
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value(TypeEnum.DECIMAL, 5.0),
-                ],
-                schema,
-            ),
-            None,
+        self.child_executor.next_batch.side_effect = [
+            [
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.DECIMAL, 10.0),
+                    ],
+                    schema,
+                ),
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.DECIMAL, 5.0),
+                    ],
+                    schema,
+                ),
+            ],
+            [],
         ]
         executor.init()
         result = executor.next()
@@ -331,22 +383,24 @@ class TestAggregationExecutorWork:
             [self.group_by_expr], [aggregate], schema, Mock()
         )
         executor = AggregationExecutor(plan, self.child_executor)
-        self.child_executor.next.side_effect = [
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value(TypeEnum.DECIMAL, 10.0),
-                ],
-                self.schema,
-            ),
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value(TypeEnum.DECIMAL, 20.0),
-                ],
-                schema,
-            ),
-            None,
+        self.child_executor.next_batch.side_effect = [
+            [
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.DECIMAL, 10.0),
+                    ],
+                    self.schema,
+                ),
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.DECIMAL, 20.0),
+                    ],
+                    schema,
+                ),
+            ],
+            [],
         ]
         executor.init()
         result = executor.next()
@@ -387,22 +441,24 @@ class TestAggregationExecutorWork:
             [self.group_by_expr], [count_agg, sum_agg, avg_agg], schema, Mock()
         )
         executor = AggregationExecutor(plan, self.child_executor)
-        self.child_executor.next.side_effect = [
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value(TypeEnum.DECIMAL, 10.0),
-                ],
-                self.schema,
-            ),
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value(TypeEnum.DECIMAL, 20.0),
-                ],
-                self.schema,
-            ),
-            None,
+        self.child_executor.next_batch.side_effect = [
+            [
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.DECIMAL, 10.0),
+                    ],
+                    self.schema,
+                ),
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.DECIMAL, 20.0),
+                    ],
+                    self.schema,
+                ),
+            ],
+            [],
         ]
         executor.init()
         result = executor.next()
@@ -436,22 +492,24 @@ class TestAggregationExecutorWork:
             [self.group_by_expr], [aggregate], schema, Mock()
         )
         executor = AggregationExecutor(plan, self.child_executor)
-        self.child_executor.next.side_effect = [
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value(TypeEnum.DECIMAL, 10.0),
-                ],
-                self.schema,
-            ),
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group2"),
-                    Value(TypeEnum.DECIMAL, 20.0),
-                ],
-                self.schema,
-            ),
-            None,
+        self.child_executor.next_batch.side_effect = [
+            [
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value(TypeEnum.DECIMAL, 10.0),
+                    ],
+                    self.schema,
+                ),
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group2"),
+                        Value(TypeEnum.DECIMAL, 20.0),
+                    ],
+                    self.schema,
+                ),
+            ],
+            [],
         ]
         executor.init()
         result1 = executor.next()
@@ -510,15 +568,17 @@ class TestAggregationExecutorWork:
             Mock(),
         )
         executor = AggregationExecutor(plan, self.child_executor)
-        self.child_executor.next.side_effect = [
-            Tuple(
-                [
-                    Value(TypeEnum.STRING, "group1"),
-                    Value.create_null_from_type_id(TypeEnum.DECIMAL),
-                ],
-                self.schema,
-            ),
-            None,
+        self.child_executor.next_batch.side_effect = [
+            [
+                Tuple(
+                    [
+                        Value(TypeEnum.STRING, "group1"),
+                        Value.create_null_from_type_id(TypeEnum.DECIMAL),
+                    ],
+                    self.schema,
+                ),
+            ],
+            [],
         ]
         executor.init()
         result = executor.next()
@@ -539,3 +599,134 @@ class TestAggregationExecutorWork:
         assert result.values[5].compare_equals(
             Value.create_null_from_type_id(TypeEnum.DECIMAL)
         )  # MAX
+
+
+class TestAggregationExecutorSpill:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.group = Column("group", TypeEnum.STRING)
+        self.price = Column("price", TypeEnum.INT)
+        self.schema = Schema([self.group, self.price])
+        self.tuples = [
+            Tuple(
+                [
+                    Value(TypeEnum.STRING, f"group{i % 7}"),
+                    Value(TypeEnum.INT, None if i % 5 == 0 else i),
+                ],
+                self.schema,
+            )
+            for i in range(60)
+        ]
+        price_expr = ColumnExpression(self.price)
+        self.plan = AggregationPlan(
+            [ColumnExpression(self.group)],
+            [
+                Aggregate(AggregationType.COUNT, price_expr, "count"),
+                Aggregate(AggregationType.MAX, price_expr, "max"),
+            ],
+            Schema(
+                [
+                    self.group,
+                    Column("count", TypeEnum.INT),
+                    Column("max", TypeEnum.INT),
+                ]
+            ),
+            Mock(),
+        )
+
+    def run(self, config: ExecutionConfig | None) -> list[str]:
+        child_executor = Mock(spec=Executor)
+        child_executor.next_batch.side_effect = [self.tuples, []]
+        executor = AggregationExecutor(self.plan, child_executor, config)
+        executor.init()
+        result: list[str] = []
+        while (tup := executor.next()) is not None:
+            result.append(str(tup))
+        self.partition_count = executor.get_partition_count()
+        executor.close()
+        assert executor.get_partition_count() == 0
+        return result
+
+    def test_spilled_groups_match_in_memory(self):
+        expected = self.run(None)
+        assert self.partition_count == 0
+
+        config = ExecutionConfig(
+            aggregate_buffer_groups=2, aggregate_spill_partitions=2
+        )
+        result = self.run(config)
+
+        assert self.partition_count > 0
+        assert len(result) == 7
+        assert sorted(result) == sorted(expected)
+
+    def test_spilled_groups_by_byte_budget_match_in_memory(self):
+        expected = self.run(None)
+
+        config = ExecutionConfig(
+            aggregate_buffer_bytes=1, aggregate_spill_partitions=2
+        )
+        result = self.run(config)
+
+        assert self.partition_count > 0
+        assert sorted(result) == sorted(expected)
+
+
+class TestAggregationExecutorVectorized:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.schema = Schema(
+            [Column("name", TypeEnum.STRING), Column("price", TypeEnum.INT)]
+        )
+        self.price = ColumnExpression(self.schema.get_column(1)).bind(
+            self.schema
+        )
+        self.output_schema = Schema(
+            [
+                Column("count", TypeEnum.INT),
+                Column("sum", TypeEnum.INT),
+                Column("min", TypeEnum.INT),
+                Column("max", TypeEnum.INT),
+                Column("avg", TypeEnum.DECIMAL),
+            ]
+        )
+        self.plan = AggregationPlan(
+            [],
+            [
+                Aggregate(AggregationType.COUNT, self.price, "count"),
+                Aggregate(AggregationType.SUM, self.price, "sum"),
+                Aggregate(AggregationType.MIN, self.price, "min"),
+                Aggregate(AggregationType.MAX, self.price, "max"),
+                Aggregate(AggregationType.AVG, self.price, "avg"),
+            ],
+            self.output_schema,
+            Mock(),
+        )
+        self.child_executor = Mock(spec=Executor)
+
+    def create_batch(self, rows: list[list[object]]):
+        builder = RecordBatchBuilder(self.schema)
+        for row in rows:
+            builder.append_row(row)
+        return builder.build()
+
+    def test_aggregates_record_batches(self):
+        self.child_executor.next_record_batch.side_effect = [
+            self.create_batch([["phone", 999], ["tv", None]]),
+            self.create_batch([]),
+            self.create_batch([["cable", 5]]),
+            None,
+        ]
+        executor = AggregationExecutor(self.plan, self.child_executor)
+        executor.init()
+
+        assert str(executor.next()) == "2,1004,5,999,502.0"
+        assert executor.next() is None
+        self.child_executor.next_batch.assert_not_called()
+
+    def test_empty_input_yields_no_rows(self):
+        self.child_executor.next_record_batch.side_effect = [None]
+        executor = AggregationExecutor(self.plan, self.child_executor)
+        executor.init()
+
+        assert executor.next() is None
@@ -2,6 +2,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from engine.execution.config import ExecutionConfig
 from engine.execution.executors.aggregation_executor import AggregationExecutor
 from engine.execution.executors.executor_factory import ExecutorFactory
 from engine.execution.executors.filter_executor import FilterExecutor
@@ -10,6 +11,10 @@ from engine.execution.executors.offset_executor import OffsetExecutor
 from engine.execution.executors.projection_executor import ProjectionExecutor
 from engine.execution.executors.scan_executor import ScanExecutor
 from engine.execution.executors.sort_executor import SortExecutor
+from engine.execution.executors.streaming_aggregation_executor import (
+    StreamingAggregationExecutor,
+)
+from engine.execution.executors.top_n_executor import TopNExecutor
 from engine.execution.plan.aggregation_plan import AggregationPlan
 from engine.execution.plan.execution_plan import ExecutionPlan
 from engine.execution.plan.filter_plan import FilterPlan
@@ -18,14 +23,17 @@ from engine.execution.plan.offset_plan import OffsetPlan
 from engine.execution.plan.projection_plan import ProjectionPlan
 from engine.execution.plan.scan_plan import ScanPlan
 from engine.execution.plan.sort_plan import SortPlan
+from engine.execution.plan.top_n_plan import TopNPlan
 from storage.reader import TableReader, TableReaderFactory
-from storage.schema import Schema
+from storage.schema import Column, Schema
 from storage.table import StringTable, Table
+from type.type_enum import TypeEnum
 
 
 class TestExecutorFactory:
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, monkeypatch: pytest.MonkeyPatch):
+        self.monkeypatch = monkeypatch
         self.schema = Schema([])
         self.table = StringTable("", self.schema)
         self.catalog: dict[str, Table] = {"table1": self.table}
@@ -34,7 +42,11 @@ class TestExecutorFactory:
         self.child_plan = ScanPlan(self.table, self.schema)
 
     def test_create_scan_executor(self):
-        TableReaderFactory.create_reader = Mock(return_value=self.reader)
+        self.monkeypatch.setattr(
+            TableReaderFactory,
+            "create_reader",
+            Mock(return_value=self.reader),
+        )
         scan_plan = ScanPlan(self.table, self.schema)
 
         executor = self.factory.create_executor(scan_plan)
@@ -42,7 +54,9 @@ class TestExecutorFactory:
         assert isinstance(executor, ScanExecutor)
         assert executor._plan == scan_plan  # type: ignore
         assert executor._reader == self.reader  # type: ignore
-        TableReaderFactory.create_reader.assert_called_once_with(self.table)
+        TableReaderFactory.create_reader.assert_called_once_with(
+            self.table, columns=None, predicates=[]
+        )
 
     def test_create_filter_executor(self):
         filter_plan = FilterPlan(Mock(), self.schema, self.child_plan)
@@ -60,6 +74,14 @@ class TestExecutorFactory:
         assert executor._plan == aggregation_plan  # type: ignore
         assert executor._child._plan == self.child_plan  # type: ignore
 
+    def test_create_streaming_aggregation_executor(self):
+        aggregation_plan = AggregationPlan(
+            [], [], self.schema, self.child_plan, is_input_sorted=True
+        )
+        executor = self.factory.create_executor(aggregation_plan)
+        assert isinstance(executor, StreamingAggregationExecutor)
+        assert executor._plan == aggregation_plan  # type: ignore
+
     def test_create_projection_executor(self):
         projection_plan = ProjectionPlan([], self.schema, self.child_plan)
         executor = self.factory.create_executor(projection_plan)
@@ -76,6 +98,22 @@ class TestExecutorFactory:
         assert executor._order_by == order_by  # type: ignore
         assert executor._child._plan == self.child_plan  # type: ignore
 
+    def test_create_sort_executor_passes_config(self):
+        config = ExecutionConfig(sort_buffer_rows=10)
+        factory = ExecutorFactory(self.catalog, config)
+        sort_plan = SortPlan(Mock(), self.schema, self.child_plan)
+        executor = factory.create_executor(sort_plan)
+        assert executor._config == config  # type: ignore
+
+    def test_create_top_n_executor(self):
+        order_by = Mock()
+        top_n_plan = TopNPlan(order_by, 5, self.schema, self.child_plan)
+        executor = self.factory.create_executor(top_n_plan)
+        assert isinstance(executor, TopNExecutor)
+        assert executor._plan == top_n_plan  # type: ignore
+        assert executor._n == 5  # type: ignore
+        assert executor._child._plan == self.child_plan  # type: ignore
+
     def test_create_limit_executor(self):
         limit = 10
         limit_plan = LimitPlan(limit, self.schema, self.child_plan)
@@ -105,7 +143,11 @@ class TestExecutorFactory:
     def test_recursive_executor_creation(self):
         child_plan = ScanPlan(self.table, self.schema)
         filter_plan = FilterPlan(Mock(), self.schema, child_plan)
-        TableReaderFactory.create_reader = Mock(return_value=self.reader)
+        self.monkeypatch.setattr(
+            TableReaderFactory,
+            "create_reader",
+            Mock(return_value=self.reader),
+        )
 
         executor = self.factory.create_executor(filter_plan)
 
@@ -113,4 +155,23 @@ class TestExecutorFactory:
         assert isinstance(executor._child, ScanExecutor)  # type: ignore
         assert executor._child._plan == child_plan  # type: ignore
         assert executor._child._reader == self.reader  # type: ignore
-        TableReaderFactory.create_reader.assert_called_once_with(self.table)
+        TableReaderFactory.create_reader.assert_called_once_with(
+            self.table, columns=None, predicates=[]
+        )
+
+    def test_create_scan_executor_with_projected_columns(self):
+        column1 = Column("col1", TypeEnum.STRING)
+        column2 = Column("col2", TypeEnum.INT)
+        table = StringTable("", Schema([column1, column2]))
+        scan_plan = ScanPlan(table, Schema([column2]))
+        self.monkeypatch.setattr(
+            TableReaderFactory,
+            "create_reader",
+            Mock(return_value=self.reader),
+        )
+
+        self.factory.create_executor(scan_plan)
+
+        TableReaderFactory.create_reader.assert_called_once_with(
+            table, columns=[1], predicates=[]
+        )
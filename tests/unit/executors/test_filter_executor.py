@@ -4,10 +4,22 @@ import pytest
 
 from engine.execution.executors.executor import Executor
 from engine.execution.executors.filter_executor import FilterExecutor
+from engine.execution.executors.scan_executor import ScanExecutor
+from engine.execution.expressions.column_expression import ColumnExpression
+from engine.execution.expressions.comparison_expression import (
+    ComparisonExpression,
+)
+from engine.execution.expressions.constant_expression import (
+    ConstantExpression,
+)
 from engine.execution.expressions.expression import Expression
 from engine.execution.plan.filter_plan import FilterPlan
-from storage.schema import Schema
+from engine.execution.plan.scan_plan import ScanPlan
+from storage.reader import StringTableReader
+from storage.schema import Column, Schema
+from storage.table import StringTable
 from storage.tuple import Tuple
+from type.enums import ComparisonOperandEnum
 from type.type_enum import TypeEnum
 from type.value import Value
 
@@ -25,6 +37,10 @@ class TestFilterExecutor:
         self.executor.init()
         self.child_executor.init.assert_called_once()
 
+    def test_close_calls_child_close(self):
+        self.executor.close()
+        self.child_executor.close.assert_called_once()
+
     def test_next_filters_tuples(self):
         tuple1, tuple2, tuple3 = (
             Tuple([], self.schema),
@@ -79,3 +95,78 @@ class TestFilterExecutor:
 
         assert self.executor.next() is None
         self.predicate.evaluate.assert_not_called()
+
+    def test_next_batch_filters_tuples(self):
+        tuple1, tuple2, tuple3 = (
+            Tuple([], self.schema),
+            Tuple([], self.schema),
+            Tuple([], self.schema),
+        )
+        self.child_executor.next_batch.side_effect = [
+            [tuple1, tuple2],
+            [tuple3],
+            [],
+        ]
+        self.predicate.evaluate.side_effect = [
+            Value(TypeEnum.BOOLEAN, False),
+            Value(TypeEnum.BOOLEAN, None),
+            Value(TypeEnum.BOOLEAN, True),
+        ]
+
+        self.executor.init()
+
+        assert self.executor.next_batch() == [tuple3]
+        assert self.executor.next_batch() == []
+        self.child_executor.next.assert_not_called()
+
+
+class TestFilterExecutorRecordBatch:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.schema = Schema(
+            [Column("name", TypeEnum.STRING), Column("price", TypeEnum.INT)]
+        )
+        table = StringTable(
+            "phone,999\nlaptop,1200\ncable,5\ntv,2000\nwatch,300", self.schema
+        )
+        self.scan = ScanExecutor(
+            ScanPlan(table, self.schema), StringTableReader(table)
+        )
+
+    def create_executor(
+        self, op: ComparisonOperandEnum, value: int
+    ) -> FilterExecutor:
+        predicate = ComparisonExpression(
+            ColumnExpression(self.schema.get_column(1)).bind(self.schema),
+            ConstantExpression(Value(TypeEnum.INT, value)),
+            op,
+        )
+        return FilterExecutor(
+            FilterPlan(predicate, self.schema, Mock()), self.scan
+        )
+
+    def test_next_record_batch_selects_rows(self):
+        executor = self.create_executor(ComparisonOperandEnum.GT, 250)
+        executor.init()
+
+        batch = executor.next_record_batch()
+
+        assert batch is not None
+        assert [str(tup) for tup in batch.to_tuples()] == [
+            "phone,999",
+            "laptop,1200",
+            "tv,2000",
+            "watch,300",
+        ]
+        assert executor.next_record_batch() is None
+
+    def test_next_record_batch_skips_empty_batches(self):
+        executor = self.create_executor(ComparisonOperandEnum.LT, 10)
+        executor.init()
+
+        batch = executor.next_record_batch(2)
+
+        # The first batch selects nothing and is skipped
+        assert batch is not None
+        assert [str(tup) for tup in batch.to_tuples()] == ["cable,5"]
+        assert executor.next_record_batch(2) is None
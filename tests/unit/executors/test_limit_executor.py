@@ -38,6 +38,7 @@ class TestLimitExecutor:
         assert result2 == self.tuple2
         assert result3 is None
         assert self.executor._count == 2  # type: ignore
+        assert self.child_executor.next.call_count == 2
 
     def test_next_zero_limit(self):
         self.plan = LimitPlan(0, self.schema, Mock())
@@ -52,3 +53,29 @@ class TestLimitExecutor:
         self.child_executor.next.return_value = None
         self.executor.init()
         assert self.executor.next() is None
+
+    def test_next_closes_child_at_limit(self):
+        self.executor.init()
+        self.executor.next()
+        self.child_executor.close.assert_not_called()
+
+        self.executor.next()
+        self.child_executor.close.assert_called_once()
+
+    def test_close_closes_child(self):
+        self.executor.init()
+        self.executor.close()
+        self.child_executor.close.assert_called_once()
+
+    def test_next_batch_requests_remaining_rows(self):
+        self.child_executor.next_batch.side_effect = [
+            [self.tuple1, self.tuple2]
+        ]
+        self.executor.init()
+
+        assert self.executor.next_batch(10) == [self.tuple1, self.tuple2]
+        self.child_executor.next_batch.assert_called_once_with(2)
+        self.child_executor.close.assert_called_once()
+
+        assert self.executor.next_batch(10) == []
+        self.child_executor.next_batch.assert_called_once()
@@ -57,3 +57,17 @@ class TestOffsetExecutor:
         self.child_executor.next.return_value = None
         self.executor.init()
         assert self.executor.next() is None
+
+    def test_next_batch_skips_across_batches(self):
+        self.plan = OffsetPlan(2, self.schema, Mock())
+        self.executor = OffsetExecutor(self.plan, self.child_executor)
+        self.child_executor.next_batch.side_effect = [
+            [self.tuple1],
+            [self.tuple2, self.tuple3],
+            [],
+        ]
+        self.executor.init()
+
+        assert self.executor.next_batch() == [self.tuple3]
+        assert self.executor.next_batch() == []
+        assert self.executor._count == 2  # type: ignore
@@ -0,0 +1,121 @@
+import tempfile
+
+import pytest
+
+from engine.execution.aggregate import Aggregate, AggregationType
+from engine.execution.config import ExecutionConfig
+from engine.execution.executors.aggregation_executor import AggregationExecutor
+from engine.execution.executors.executor import Executor
+from engine.execution.executors.executor_factory import ExecutorFactory
+from engine.execution.executors.parallel_aggregation_executor import (
+    ParallelAggregationExecutor,
+)
+from engine.execution.expressions.column_expression import ColumnExpression
+from engine.execution.expressions.comparison_expression import (
+    ComparisonExpression,
+)
+from engine.execution.expressions.constant_expression import ConstantExpression
+from engine.execution.plan.aggregation_plan import AggregationPlan
+from engine.execution.plan.filter_plan import FilterPlan
+from engine.execution.plan.scan_plan import ScanPlan
+from storage.schema import Column, Schema
+from storage.table import CSVTable, StringTable
+from storage.tuple import Tuple
+from type.enums import ComparisonOperandEnum
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestParallelAggregationExecutor:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.brand = Column("brand", TypeEnum.STRING)
+        self.price = Column("price", TypeEnum.INT)
+        self.schema = Schema([self.brand, self.price])
+        rows = "".join(f"brand{i % 3},{i}\n" for i in range(300))
+        with tempfile.NamedTemporaryFile(
+            mode="w", delete=False, suffix=".csv"
+        ) as temp_file:
+            temp_file.write("brand,price\n" + rows)
+        self.table = CSVTable(temp_file.name, self.schema)
+
+        self.predicate = ComparisonExpression(
+            ColumnExpression(self.price),
+            ConstantExpression(Value(TypeEnum.INT, 100)),
+            ComparisonOperandEnum.GTE,
+        )
+        self.scan_plan = ScanPlan(self.table, self.schema)
+        self.filter_plan = FilterPlan(
+            self.predicate, self.schema, self.scan_plan
+        )
+        price_expr = ColumnExpression(self.price)
+        self.plan = AggregationPlan(
+            [ColumnExpression(self.brand)],
+            [
+                Aggregate(AggregationType.COUNT, price_expr, "count"),
+                Aggregate(AggregationType.SUM, price_expr, "sum"),
+                Aggregate(AggregationType.AVG, price_expr, "avg"),
+                Aggregate(AggregationType.MAX, price_expr, "max"),
+            ],
+            Schema(
+                [
+                    self.brand,
+                    Column("count", TypeEnum.INT),
+                    Column("sum", TypeEnum.INT),
+                    Column("avg", TypeEnum.DECIMAL),
+                    Column("max", TypeEnum.INT),
+                ]
+            ),
+            self.filter_plan,
+        )
+        self.factory = ExecutorFactory({})
+
+    def collect(self, executor: Executor) -> list[Tuple]:
+        executor.init()
+        result: list[Tuple] = []
+        while (tup := executor.next()) is not None:
+            result.append(tup)
+        executor.close()
+        return result
+
+    def test_matches_serial_aggregation(self):
+        child = self.factory.create_executor(self.filter_plan)
+        executor = ParallelAggregationExecutor(
+            self.plan,
+            child,
+            ExecutionConfig(aggregate_workers=2),
+            chunk_size=256,
+        )
+        serial = AggregationExecutor(
+            self.plan, self.factory.create_executor(self.filter_plan)
+        )
+
+        result = self.collect(executor)
+
+        assert [str(tup) for tup in result] == [
+            str(tup) for tup in self.collect(serial)
+        ]
+        assert str(result[0]) == "brand1,67,13333,199.0,298"
+
+    def test_single_chunk_runs_serially(self):
+        child = self.factory.create_executor(self.filter_plan)
+        executor = ParallelAggregationExecutor(
+            self.plan,
+            child,
+            ExecutionConfig(aggregate_workers=2),
+        )
+        assert len(self.collect(executor)) == 3
+
+    def test_factory_creates_parallel_executor(self):
+        factory = ExecutorFactory({}, ExecutionConfig(aggregate_workers=2))
+        executor = factory.create_executor(self.plan)
+        assert isinstance(executor, ParallelAggregationExecutor)
+
+    def test_factory_keeps_serial_executor_for_other_tables(self):
+        factory = ExecutorFactory({}, ExecutionConfig(aggregate_workers=2))
+        scan_plan = ScanPlan(StringTable("", self.schema), self.schema)
+        plan = AggregationPlan(
+            [], [], self.plan.get_output_schema(), scan_plan
+        )
+        executor = factory.create_executor(plan)
+        assert type(executor) is AggregationExecutor
@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from engine.execution.parallel_sort import (
+    choose_boundaries,
+    parallel_argsort,
+    partition_keys,
+    sort_partition,
+)
+from engine.execution.sort_key import Descending
+
+
+class TestParallelSort:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.keys = [((1, val),) for val in [5, 3, 9, 3, 1, 7, 3, 8, 2, 6]]
+
+    def test_choose_boundaries_are_sorted_and_unique(self):
+        boundaries = choose_boundaries(self.keys, 4)
+        assert boundaries == sorted(set(boundaries))
+        assert 0 < len(boundaries) <= 3
+
+    def test_choose_boundaries_single_partition(self):
+        assert choose_boundaries(self.keys, 1) == []
+        assert choose_boundaries([], 4) == []
+
+    def test_partition_keys_keeps_equal_keys_together(self):
+        boundaries = [((1, 3),), ((1, 7),)]
+        parts = partition_keys(self.keys, boundaries)
+
+        assert parts == [[4, 8], [0, 1, 3, 6, 9], [2, 5, 7]]
+
+    def test_sort_partition_is_stable(self):
+        keys = [((1, 2),), ((1, 1),), ((1, 2),)]
+        assert sort_partition(keys) == [1, 0, 2]
+
+    def test_parallel_argsort_matches_sorted(self):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            order = parallel_argsort(self.keys, pool, 3)
+
+        expected = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        assert order == expected
+
+    def test_descending_orders_in_reverse(self):
+        values = ["b", "c", "a"]
+        assert sorted(values, key=Descending) == ["c", "b", "a"]
+        assert Descending("a") == Descending("a")
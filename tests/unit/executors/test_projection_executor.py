@@ -100,3 +100,32 @@ class TestProjectionExecutor:
         )
         assert result2.values[1].compare_equals(Value(TypeEnum.INT, 84))
         assert result3 is None
+
+    def test_next_batch_projects_tuples(self):
+        self.child_executor.next_batch.side_effect = [
+            [self.input_tuple, self.input_tuple],
+            [],
+        ]
+        self.executor.init()
+
+        result = self.executor.next_batch()
+
+        assert len(result) == 2
+        assert all(tup.schema == self.output_schema for tup in result)
+        assert result[0].values[1].compare_equals(Value(TypeEnum.INT, 42))
+        assert self.executor.next_batch() == []
+
+    def test_next_record_batch_packs_tuples(self):
+        self.child_executor.next_batch.side_effect = [
+            [self.input_tuple, self.input_tuple],
+            [],
+        ]
+        self.executor.init()
+
+        batch = self.executor.next_record_batch()
+
+        assert batch is not None
+        assert batch.get_schema() == self.output_schema
+        assert batch.get_row_count() == 2
+        assert list(batch.get_column(1).get_data()) == [42, 42]
+        assert self.executor.next_record_batch() is None
@@ -4,6 +4,7 @@ import pytest
 
 from engine.execution.executors.scan_executor import ScanExecutor
 from engine.execution.plan.scan_plan import ScanPlan
+from storage.batch import RecordBatch
 from storage.reader import TableReader
 from storage.schema import Schema
 from storage.table import Table
@@ -51,3 +52,52 @@ class TestScanExecutor:
         self.mock_reader.read.return_value = iter([])
         self.executor.init()
         assert self.executor.next() is None
+
+    def test_close_closes_reader_generator(self):
+        closed: list[bool] = []
+
+        def read():
+            try:
+                yield Mock(spec=Tuple)
+                yield Mock(spec=Tuple)
+            finally:
+                closed.append(True)
+
+        self.mock_reader.read.return_value = read()
+        self.executor.init()
+        self.executor.next()
+        self.executor.close()
+
+        assert closed == [True]
+        with pytest.raises(RuntimeError):
+            self.executor.next()
+
+    def test_close_without_init(self):
+        self.executor.close()
+
+    def test_next_batch_reads_in_chunks(self):
+        tuples = [Mock(spec=Tuple) for _ in range(3)]
+        self.mock_reader.read.return_value = iter(tuples)
+        self.executor.init()
+
+        assert self.executor.next_batch(2) == tuples[:2]
+        assert self.executor.next_batch(2) == tuples[2:]
+        assert self.executor.next_batch(2) == []
+
+    def test_next_batch_without_init_raises(self):
+        with pytest.raises(RuntimeError):
+            self.executor.next_batch()
+
+    def test_next_record_batch_reads_reader_batches(self):
+        batches = [Mock(spec=RecordBatch), Mock(spec=RecordBatch)]
+        self.mock_reader.read_batches.return_value = iter(batches)
+        self.executor.init()
+
+        assert self.executor.next_record_batch(10) is batches[0]
+        assert self.executor.next_record_batch(10) is batches[1]
+        assert self.executor.next_record_batch(10) is None
+        self.mock_reader.read_batches.assert_called_once_with(10)
+
+    def test_next_record_batch_without_init_raises(self):
+        with pytest.raises(RuntimeError):
+            self.executor.next_record_batch()
@@ -2,9 +2,11 @@ from unittest.mock import Mock
 
 import pytest
 
+from engine.execution.config import ExecutionConfig
 from engine.execution.executors.executor import Executor
 from engine.execution.executors.sort_executor import SortExecutor
 from engine.execution.expressions.column_expression import ColumnExpression
+from engine.execution.order_by import NullOrder, OrderBy, SortDirection
 from engine.execution.plan.sort_plan import SortPlan
 from storage.schema import Column, Schema
 from storage.tuple import Tuple
@@ -28,7 +30,7 @@ class TestSortExecutor:
             self.tuple3,
             None,
         ]
-        self.plan = SortPlan([self.expr], self.schema, Mock())
+        self.plan = SortPlan([OrderBy(self.expr)], self.schema, Mock())
         self.executor = SortExecutor(self.plan, self.child_executor)
 
     def test_init_collects_tuples(self):
@@ -57,8 +59,152 @@ class TestSortExecutor:
         assert result3 == self.tuple3  # Value 3
         assert result4 is None
 
+    def test_next_batch_uses_row_adapter(self):
+        self.executor.init()
+
+        assert self.executor.next_batch(2) == [self.tuple2, self.tuple1]
+        assert self.executor.next_batch(2) == [self.tuple3]
+        assert self.executor.next_batch(2) == []
+
     def test_next_empty_input(self):
         self.child_executor.next.side_effect = [None]
         self.child_executor.next.return_value = None
         self.executor.init()
         assert self.executor.next() is None
+
+    def test_next_merges_spilled_runs(self):
+        schema = Schema([self.column1, Column("col2", TypeEnum.STRING)])
+        tuples = [
+            Tuple(
+                [Value(TypeEnum.INT, val), Value(TypeEnum.STRING, name)],
+                schema,
+            )
+            for val, name in [(3, "a"), (1, "b"), (2, "c"), (1, "d"), (2, "e")]
+        ]
+        self.child_executor.next.side_effect = [*tuples, None]
+        plan = SortPlan([OrderBy(self.expr)], schema, Mock())
+        executor = SortExecutor(
+            plan, self.child_executor, ExecutionConfig(sort_buffer_rows=2)
+        )
+
+        executor.init()
+        result: list[str] = []
+        while (tup := executor.next()) is not None:
+            result.append(str(tup))
+
+        assert executor.get_run_count() == 2
+        # Equal keys keep their input order across runs
+        assert result == ["1,b", "1,d", "2,c", "2,e", "3,a"]
+
+        executor.close()
+        assert executor.get_run_count() == 0
+        self.child_executor.close.assert_called_once()
+
+    def test_next_spills_by_byte_budget(self):
+        tuples = [
+            Tuple([Value(TypeEnum.INT, val)], self.schema)
+            for val in [3, 1, 2, 1, 2]
+        ]
+        self.child_executor.next.side_effect = [*tuples, None]
+        config = ExecutionConfig(
+            sort_buffer_bytes=tuples[0].get_footprint() * 2
+        )
+        executor = SortExecutor(self.plan, self.child_executor, config)
+
+        executor.init()
+        result: list[str] = []
+        while (tup := executor.next()) is not None:
+            result.append(str(tup))
+
+        assert executor.get_run_count() == 2
+        assert result == ["1", "1", "2", "2", "3"]
+        executor.close()
+
+    def test_next_multi_key_desc_with_nulls(self):
+        column2 = Column("col2", TypeEnum.STRING)
+        schema = Schema([self.column1, column2])
+        tuples = [
+            Tuple(
+                [Value(TypeEnum.INT, val), Value(TypeEnum.STRING, name)],
+                schema,
+            )
+            for val, name in [
+                (1, "a"),
+                (None, "b"),
+                (2, "c"),
+                (1, None),
+                (1, "d"),
+            ]
+        ]
+        self.child_executor.next.side_effect = [*tuples, None]
+        order_by = [
+            OrderBy(self.expr, SortDirection.DESC, NullOrder.LAST),
+            OrderBy(ColumnExpression(column2), SortDirection.DESC),
+        ]
+        executor = SortExecutor(
+            SortPlan(order_by, schema, Mock()), self.child_executor
+        )
+
+        executor.init()
+        result: list[str] = []
+        while (tup := executor.next()) is not None:
+            result.append(str(tup))
+
+        assert result == ["2,c", "1,None", "1,d", "1,a", "None,b"]
+
+    def test_next_uses_bound_column_index(self):
+        # Both columns share a name, so only the bound index tells them apart
+        column2 = Column("col1", TypeEnum.INT)
+        schema = Schema([self.column1, column2])
+        tuples = [
+            Tuple([Value(TypeEnum.INT, a), Value(TypeEnum.INT, b)], schema)
+            for a, b in [(1, 3), (2, 1), (3, 2)]
+        ]
+        self.child_executor.next.side_effect = [*tuples, None]
+        order_by = [OrderBy(ColumnExpression(column2, 1))]
+        executor = SortExecutor(
+            SortPlan(order_by, schema, Mock()), self.child_executor
+        )
+
+        executor.init()
+        result: list[str] = []
+        while (tup := executor.next()) is not None:
+            result.append(str(tup))
+
+        assert result == ["2,1", "3,2", "1,3"]
+
+    def test_next_parallel_sort_matches_serial(self):
+        column2 = Column("col2", TypeEnum.STRING)
+        schema = Schema([self.column1, column2])
+        tuples = [
+            Tuple(
+                [
+                    Value(TypeEnum.INT, i % 7),
+                    Value(TypeEnum.STRING, f"name{i % 5}"),
+                ],
+                schema,
+            )
+            for i in range(50)
+        ]
+        order_by = [
+            OrderBy(ColumnExpression(column2), SortDirection.DESC),
+            OrderBy(self.expr),
+        ]
+        config = ExecutionConfig(sort_workers=2, parallel_sort_min_rows=1)
+        self.child_executor.next.side_effect = [*tuples, None]
+        executor = SortExecutor(
+            SortPlan(order_by, schema, Mock()), self.child_executor, config
+        )
+
+        executor.init()
+        result: list[Tuple] = []
+        while (tup := executor.next()) is not None:
+            result.append(tup)
+
+        assert result == sorted(
+            tuples,
+            key=lambda t: (
+                [-ord(c) for c in str(t.get_value(1).get_value())],
+                t.get_value(0).get_value(),
+            ),
+        )
@@ -0,0 +1,79 @@
+from unittest.mock import Mock
+
+import pytest
+
+from engine.execution.aggregate import Aggregate, AggregationType
+from engine.execution.executors.executor import Executor
+from engine.execution.executors.streaming_aggregation_executor import (
+    StreamingAggregationExecutor,
+)
+from engine.execution.expressions.column_expression import ColumnExpression
+from engine.execution.plan.aggregation_plan import AggregationPlan
+from storage.schema import Column, Schema
+from storage.tuple import Tuple
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestStreamingAggregationExecutor:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.group = Column("group", TypeEnum.STRING)
+        self.price = Column("price", TypeEnum.INT)
+        self.schema = Schema([self.group, self.price])
+        self.tuples = [
+            Tuple(
+                [Value(TypeEnum.STRING, group), Value(TypeEnum.INT, price)],
+                self.schema,
+            )
+            for group, price in [("a", 1), ("a", 3), ("b", 5), ("c", 2)]
+        ]
+        self.child_executor = Mock(spec=Executor)
+        self.child_executor.next.side_effect = [*self.tuples, None]
+        price_expr = ColumnExpression(self.price)
+        self.plan = AggregationPlan(
+            [ColumnExpression(self.group)],
+            [
+                Aggregate(AggregationType.COUNT, price_expr, "count"),
+                Aggregate(AggregationType.MAX, price_expr, "max"),
+            ],
+            Schema(
+                [
+                    self.group,
+                    Column("count", TypeEnum.INT),
+                    Column("max", TypeEnum.INT),
+                ]
+            ),
+            Mock(),
+            is_input_sorted=True,
+        )
+        self.executor = StreamingAggregationExecutor(
+            self.plan, self.child_executor
+        )
+
+    def test_next_without_init_raises(self):
+        with pytest.raises(RuntimeError):
+            self.executor.next()
+
+    def test_next_emits_groups_on_key_change(self):
+        self.executor.init()
+
+        first = self.executor.next()
+        assert str(first) == "a,2,3"
+        # Only the rows of the first group and the next key were read
+        assert self.child_executor.next.call_count == 3
+
+        assert str(self.executor.next()) == "b,1,5"
+        assert str(self.executor.next()) == "c,1,2"
+        assert self.executor.next() is None
+        assert self.executor.next() is None
+
+    def test_next_empty_input(self):
+        self.child_executor.next.side_effect = [None]
+        self.executor.init()
+        assert self.executor.next() is None
+
+    def test_close_closes_child(self):
+        self.executor.init()
+        self.executor.close()
+        self.child_executor.close.assert_called_once()
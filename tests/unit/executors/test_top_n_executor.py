@@ -0,0 +1,75 @@
+from unittest.mock import Mock
+
+import pytest
+
+from engine.execution.executors.executor import Executor
+from engine.execution.executors.top_n_executor import TopNExecutor
+from engine.execution.expressions.column_expression import ColumnExpression
+from engine.execution.order_by import OrderBy
+from engine.execution.plan.top_n_plan import TopNPlan
+from storage.schema import Column, Schema
+from storage.tuple import Tuple
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestTopNExecutor:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.column1 = Column("col1", TypeEnum.INT)
+        self.column2 = Column("col2", TypeEnum.STRING)
+        self.schema = Schema([self.column1, self.column2])
+        self.expr = ColumnExpression(self.column1)
+        self.tuples = [
+            Tuple(
+                [Value(TypeEnum.INT, val), Value(TypeEnum.STRING, name)],
+                self.schema,
+            )
+            for val, name in [(3, "a"), (1, "b"), (2, "c"), (1, "d"), (5, "e")]
+        ]
+        self.child_executor = Mock(spec=Executor)
+        self.child_executor.next.side_effect = [*self.tuples, None]
+
+    def create_executor(self, n: int) -> TopNExecutor:
+        plan = TopNPlan([OrderBy(self.expr)], n, self.schema, Mock())
+        return TopNExecutor(plan, self.child_executor)
+
+    def collect(self, executor: TopNExecutor) -> list[Tuple]:
+        result: list[Tuple] = []
+        while (tup := executor.next()) is not None:
+            result.append(tup)
+        return result
+
+    def test_next_yields_first_n_sorted_tuples(self):
+        executor = self.create_executor(3)
+        executor.init()
+
+        # Ties keep their input order, like a full sort
+        assert [str(tup) for tup in self.collect(executor)] == [
+            "1,b",
+            "1,d",
+            "2,c",
+        ]
+
+    def test_next_n_larger_than_input(self):
+        executor = self.create_executor(10)
+        executor.init()
+        assert self.collect(executor) == sorted(
+            self.tuples, key=lambda t: t.get_value(0).get_value()
+        )
+
+    def test_zero_n_skips_child(self):
+        executor = self.create_executor(0)
+        executor.init()
+        assert executor.next() is None
+        self.child_executor.init.assert_not_called()
+
+    def test_next_without_init_raises(self):
+        with pytest.raises(RuntimeError):
+            self.create_executor(2).next()
+
+    def test_close_closes_child(self):
+        executor = self.create_executor(2)
+        executor.init()
+        executor.close()
+        self.child_executor.close.assert_called_once()
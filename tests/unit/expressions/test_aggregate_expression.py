@@ -0,0 +1,178 @@
+import pickle
+
+import pytest
+
+from engine.execution.expressions.aggregate_expression import (
+    AggregateExpression,
+    AvgExpression,
+    CountExpression,
+    MaxExpression,
+    MinExpression,
+    NativeAvgExpression,
+    NativeSumExpression,
+    SumExpression,
+)
+from storage.vector import ColumnVector
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestAggregateStateMerge:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.left = [Value(TypeEnum.INT, v) for v in (4, 1)]
+        self.right = [
+            Value(TypeEnum.INT, 7),
+            Value(TypeEnum.INT, None),
+            Value(TypeEnum.INT, 2),
+        ]
+
+    def aggregate(
+        self, expr: AggregateExpression, values: list[Value]
+    ) -> AggregateExpression:
+        for val in values:
+            expr.update(val)
+        return expr
+
+    @pytest.mark.parametrize(
+        "factory",
+        [
+            CountExpression,
+            SumExpression,
+            AvgExpression,
+            MinExpression,
+            MaxExpression,
+            NativeAvgExpression,
+            lambda: NativeSumExpression(TypeEnum.INT),
+        ],
+    )
+    def test_merge_matches_single_pass(self, factory):
+        single = self.aggregate(factory(), self.left + self.right)
+        merged = self.aggregate(factory(), self.left)
+        merged.merge(self.aggregate(factory(), self.right))
+
+        assert merged.finalize() == single.finalize()
+
+    @pytest.mark.parametrize(
+        "factory",
+        [
+            CountExpression,
+            SumExpression,
+            AvgExpression,
+            MinExpression,
+            MaxExpression,
+            NativeAvgExpression,
+            lambda: NativeSumExpression(TypeEnum.INT),
+        ],
+    )
+    def test_merge_empty_state(self, factory):
+        expr = self.aggregate(factory(), self.left)
+        expected = expr.finalize()
+        expr.merge_state(factory().get_state())
+        assert expr.finalize() == expected
+
+    def test_state_is_serializable(self):
+        expr = self.aggregate(AvgExpression(), self.left)
+        state = pickle.loads(pickle.dumps(expr.get_state()))
+
+        merged = AvgExpression()
+        merged.merge_state(state)
+
+        assert merged.finalize() == Value(TypeEnum.DECIMAL, 2.5)
+
+
+class TestNativeAggregateExpression:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.ints = [
+            Value(TypeEnum.INT, 4),
+            Value(TypeEnum.INT, None),
+            Value(TypeEnum.INT, 3),
+        ]
+        self.decimals = [
+            Value(TypeEnum.DECIMAL, 1.5),
+            Value(TypeEnum.DECIMAL, None),
+            Value(TypeEnum.DECIMAL, 2.25),
+        ]
+
+    def aggregate(
+        self, expr: AggregateExpression, values: list[Value]
+    ) -> AggregateExpression:
+        for val in values:
+            expr.update(val)
+        return expr
+
+    def test_int_sum_is_exact_int(self):
+        big = [Value(TypeEnum.INT, 2**62), Value(TypeEnum.INT, 2**62 + 1)]
+        result = self.aggregate(NativeSumExpression(TypeEnum.INT), big)
+
+        assert result.finalize() == Value(TypeEnum.INT, 2**63 + 1)
+
+    def test_decimal_sum(self):
+        result = self.aggregate(
+            NativeSumExpression(TypeEnum.DECIMAL), self.decimals
+        )
+        assert result.finalize() == Value(TypeEnum.DECIMAL, 3.75)
+
+    def test_sum_of_nulls_is_typed_null(self):
+        result = self.aggregate(
+            NativeSumExpression(TypeEnum.INT), [Value(TypeEnum.INT, None)]
+        ).finalize()
+
+        assert result.is_null()
+        assert result.get_type_id() == TypeEnum.INT
+
+    def test_sum_rejects_non_numeric(self):
+        with pytest.raises(AssertionError):
+            NativeSumExpression(TypeEnum.STRING)
+
+    @pytest.mark.parametrize("attr", ["ints", "decimals"])
+    def test_avg_matches_generic(self, attr):
+        values = getattr(self, attr)
+        native = self.aggregate(NativeAvgExpression(), values)
+        generic = self.aggregate(AvgExpression(), values)
+
+        assert native.finalize() == generic.finalize()
+
+    def test_avg_of_nulls_is_null(self):
+        result = self.aggregate(
+            NativeAvgExpression(), [Value(TypeEnum.INT, None)]
+        ).finalize()
+
+        assert result.is_null()
+        assert result.get_type_id() == TypeEnum.DECIMAL
+
+
+class TestAggregateUpdateVector:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.values = [Value(TypeEnum.INT, v) for v in (4, None, 1, 7)]
+        self.vector = ColumnVector.from_natives(
+            TypeEnum.INT, [val.get_value() for val in self.values]
+        )
+
+    @pytest.mark.parametrize(
+        "factory",
+        [
+            CountExpression,
+            SumExpression,
+            AvgExpression,
+            MinExpression,
+            MaxExpression,
+            NativeAvgExpression,
+            lambda: NativeSumExpression(TypeEnum.INT),
+        ],
+    )
+    def test_matches_row_updates(self, factory):
+        rows = factory()
+        for val in self.values:
+            rows.update(val)
+        vectors = factory()
+        vectors.update_vector(self.vector)
+
+        assert vectors.finalize() == rows.finalize()
+
+    def test_empty_vector_keeps_null(self):
+        expr = NativeSumExpression(TypeEnum.INT)
+        expr.update_vector(ColumnVector.from_natives(TypeEnum.INT, [None]))
+        assert expr.finalize().is_null()
@@ -0,0 +1,125 @@
+from unittest.mock import Mock
+
+import pytest
+
+from engine.execution.expressions.column_expression import ColumnExpression
+from engine.execution.expressions.comparison_expression import (
+    ComparisonExpression,
+)
+from engine.execution.expressions.compiler import (
+    compile_expression,
+    compile_predicate,
+)
+from engine.execution.expressions.constant_expression import ConstantExpression
+from engine.execution.expressions.expression import Expression
+from storage.schema import Column, Schema
+from storage.tuple import Tuple
+from type.enums import ComparisonOperandEnum
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestCompiler:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.name = Column("name", TypeEnum.STRING)
+        self.price = Column("price", TypeEnum.INT)
+        self.rating = Column("rating", TypeEnum.DECIMAL)
+        self.schema = Schema([self.name, self.price, self.rating])
+        self.tuples = [
+            Tuple(
+                [
+                    Value(TypeEnum.STRING, name),
+                    Value(TypeEnum.INT, price),
+                    Value(TypeEnum.DECIMAL, rating),
+                ],
+                self.schema,
+            )
+            for name, price, rating in [
+                ("a", 100, 4.5),
+                ("b", None, 3.0),
+                ("c", 300, None),
+                (None, 200, 4.9),
+            ]
+        ]
+
+    def column(self, column: Column) -> Expression:
+        return ColumnExpression(column).bind(self.schema)
+
+    def assert_matches_evaluate(self, expr: Expression) -> None:
+        compiled = compile_expression(expr)
+        for tup in self.tuples:
+            assert compiled(tup) == expr.evaluate(tup).get_value()
+
+    @pytest.mark.parametrize("op", list(ComparisonOperandEnum))
+    def test_column_vs_constant(self, op):
+        self.assert_matches_evaluate(
+            ComparisonExpression(
+                self.column(self.price),
+                ConstantExpression(Value(TypeEnum.DECIMAL, 200.0)),
+                op,
+            )
+        )
+        self.assert_matches_evaluate(
+            ComparisonExpression(
+                self.column(self.name),
+                ConstantExpression(Value(TypeEnum.STRING, "b")),
+                op,
+            )
+        )
+
+    @pytest.mark.parametrize("op", list(ComparisonOperandEnum))
+    def test_column_vs_column(self, op):
+        self.assert_matches_evaluate(
+            ComparisonExpression(
+                self.column(self.rating), self.column(self.price), op
+            )
+        )
+
+    def test_null_constant(self):
+        expr = ComparisonExpression(
+            self.column(self.price),
+            ConstantExpression(Value.create_null_from_type_id(TypeEnum.INT)),
+            ComparisonOperandEnum.EQ,
+        )
+        assert [compile_expression(expr)(t) for t in self.tuples] == [None] * 4
+
+    def test_unbound_column_falls_back_to_evaluate(self):
+        expr = ColumnExpression(self.price)
+        compiled = compile_expression(expr)
+        assert [compiled(t) for t in self.tuples] == [100, None, 300, 200]
+
+    def test_predicate_rejects_nulls(self):
+        predicate = compile_predicate(
+            ComparisonExpression(
+                self.column(self.rating),
+                ConstantExpression(Value(TypeEnum.INT, 4)),
+                ComparisonOperandEnum.GT,
+            )
+        )
+        assert [predicate(t) for t in self.tuples] == [
+            True,
+            False,
+            False,
+            True,
+        ]
+
+    def test_predicate_over_non_boolean_expression(self):
+        predicate = compile_predicate(self.column(self.price))
+        assert [predicate(t) for t in self.tuples] == [
+            True,
+            False,
+            True,
+            True,
+        ]
+
+    def test_predicate_falls_back_to_evaluate(self):
+        expr = Mock(spec=Expression)
+        expr.evaluate.side_effect = [
+            Value(TypeEnum.BOOLEAN, None),
+            Value(TypeEnum.BOOLEAN, True),
+        ]
+        predicate = compile_predicate(expr)
+
+        assert not predicate(self.tuples[0])
+        assert predicate(self.tuples[1])
@@ -8,7 +8,8 @@ from engine.execution.expressions.comparison_expression import (
 )
 from engine.execution.expressions.constant_expression import ConstantExpression
 from engine.execution.expressions.expression import Expression
-from storage.schema import Column
+from storage.batch import RecordBatchBuilder
+from storage.schema import Column, Schema
 from storage.tuple import Tuple
 from type.enums import ComparisonOperandEnum
 from type.type_enum import TypeEnum
@@ -64,6 +65,24 @@ class TestColumnExpression:
     def test_get_return_type(self):
         assert self.expression.get_return_type() == TypeEnum.STRING
 
+    def test_bind_resolves_index(self):
+        schema = Schema([Column("other", TypeEnum.INT), self.column])
+        tup = Tuple(
+            [Value(TypeEnum.INT, 1), Value(TypeEnum.STRING, "bound")], schema
+        )
+
+        bound = self.expression.bind(schema)
+
+        assert bound.is_bound()
+        assert bound.get_index() == 1
+        assert bound == self.expression
+        assert not self.expression.is_bound()
+        assert bound.evaluate(tup) == Value(TypeEnum.STRING, "bound")
+
+    def test_bind_unknown_column_raises(self):
+        with pytest.raises(ValueError):
+            self.expression.bind(Schema([Column("other", TypeEnum.INT)]))
+
 
 class TestComparisonExpression:
     @pytest.fixture(autouse=True)
@@ -99,6 +118,32 @@ class TestComparisonExpression:
     def test_get_return_type(self):
         assert self.expression.get_return_type() == TypeEnum.BOOLEAN
 
+    def test_bind_binds_children(self):
+        column = Column("col", TypeEnum.INT)
+        expression = ComparisonExpression(
+            ColumnExpression(column),
+            ConstantExpression(Value(TypeEnum.INT, 1)),
+            ComparisonOperandEnum.EQ,
+        )
+
+        bound = expression.bind(Schema([column]))
+
+        assert bound == expression
+        assert bound.get_left().is_bound()  # type: ignore
+        assert bound.get_right() is expression.get_right()
+
+    def test_bind_coerces_constant(self):
+        column = Column("col", TypeEnum.INT)
+        expression = ComparisonExpression(
+            ColumnExpression(column),
+            ConstantExpression(Value(TypeEnum.DECIMAL, 5.0)),
+            ComparisonOperandEnum.LT,
+        )
+
+        bound = expression.bind(Schema([column]))
+
+        assert bound.get_right().get_return_type() == TypeEnum.INT
+
 
 class TestConstantExpression:
     @pytest.fixture(autouse=True)
@@ -114,3 +159,64 @@ class TestConstantExpression:
 
     def test_get_return_type(self):
         assert self.expression.get_return_type() == TypeEnum.INT
+
+    @pytest.mark.parametrize(
+        ("source", "raw", "target", "expected"),
+        [
+            (TypeEnum.DECIMAL, 200.0, TypeEnum.INT, 200),
+            (TypeEnum.INT, 3, TypeEnum.DECIMAL, 3.0),
+            (TypeEnum.DECIMAL, 2.5, TypeEnum.INT, None),
+            (TypeEnum.DECIMAL, float("inf"), TypeEnum.INT, None),
+            (TypeEnum.INT, 2**60 + 1, TypeEnum.DECIMAL, None),
+            (TypeEnum.STRING, "1", TypeEnum.INT, None),
+        ],
+    )
+    def test_coerce(self, source, raw, target, expected):
+        expression = ConstantExpression(Value(source, raw))
+        coerced = expression.coerce(target)
+
+        if expected is None:
+            assert coerced is expression
+        else:
+            assert coerced.get_return_type() == target
+            assert coerced.get_value().get_value() == expected
+            assert type(coerced.get_value().get_value()) is type(expected)
+
+
+class TestVectorEvaluation:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.price = Column("price", TypeEnum.INT)
+        self.name = Column("name", TypeEnum.STRING)
+        builder = RecordBatchBuilder(Schema([self.name, self.price]))
+        for row in (["a", 5], ["b", None], ["c", 20]):
+            builder.append_row(row)
+        self.batch = builder.build()
+
+    def test_column_expression(self):
+        result = ColumnExpression(self.price).evaluate_vector(self.batch)
+        assert result.to_natives() == [5, None, 20]
+
+    def test_constant_expression(self):
+        expr = ConstantExpression(Value(TypeEnum.STRING, "x"))
+        assert expr.evaluate_vector(self.batch).to_natives() == ["x"] * 3
+
+    def test_comparison_matches_row_evaluation(self):
+        expr = ComparisonExpression(
+            ColumnExpression(self.price),
+            ConstantExpression(Value(TypeEnum.DECIMAL, 10.0)),
+            ComparisonOperandEnum.LT,
+        )
+
+        result = expr.evaluate_vector(self.batch)
+
+        assert result.to_natives() == [
+            expr.evaluate(tup).get_value() for tup in self.batch.to_tuples()
+        ]
+
+    def test_default_evaluates_rows(self):
+        expr = TestExpression.MockExpression([])
+        result = expr.evaluate_vector(self.batch)
+
+        assert result.get_type_id() == TypeEnum.BOOLEAN
+        assert result.to_natives() == [None] * 3
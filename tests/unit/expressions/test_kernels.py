@@ -0,0 +1,115 @@
+import math
+
+import pytest
+
+from engine.execution import kernels
+from storage import vector
+from storage.vector import ColumnVector
+from type.enums import ComparisonOperandEnum, ModificationOperandEnum
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestKernels:
+    @pytest.fixture(autouse=True, params=["python", "numpy"])
+    def setup(self, request, monkeypatch):
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(vector, "HAS_NUMPY", False)
+        self.ints = ColumnVector.from_natives(TypeEnum.INT, [3, None, 1, 4])
+        self.decimals = ColumnVector.from_natives(
+            TypeEnum.DECIMAL, [2.5, 1.0, None, 4.0]
+        )
+        self.strings = ColumnVector.from_natives(
+            TypeEnum.STRING, ["b", None, "a", "c"]
+        )
+
+    @pytest.mark.parametrize(
+        ("op", "expected"),
+        [
+            (ComparisonOperandEnum.EQ, [True, None, False, False]),
+            (ComparisonOperandEnum.NEQ, [False, None, True, True]),
+            (ComparisonOperandEnum.LT, [False, None, True, False]),
+            (ComparisonOperandEnum.LTE, [True, None, True, False]),
+            (ComparisonOperandEnum.GT, [False, None, False, True]),
+            (ComparisonOperandEnum.GTE, [True, None, False, True]),
+        ],
+    )
+    def test_compare_with_scalar(self, op, expected):
+        result = kernels.compare(self.ints, Value(TypeEnum.DECIMAL, 3.0), op)
+
+        assert result.get_type_id() == TypeEnum.BOOLEAN
+        assert result.to_natives() == expected
+
+    def test_compare_vectors(self):
+        result = kernels.compare(
+            self.ints, self.decimals, ComparisonOperandEnum.GT
+        )
+        assert result.to_natives() == [True, None, None, False]
+
+    def test_compare_strings(self):
+        result = kernels.compare(
+            self.strings,
+            Value(TypeEnum.STRING, "b"),
+            ComparisonOperandEnum.LTE,
+        )
+        assert result.to_natives() == [True, None, True, False]
+
+    def test_compare_null_scalar(self):
+        result = kernels.compare(
+            self.ints,
+            Value.create_null_from_type_id(TypeEnum.INT),
+            ComparisonOperandEnum.EQ,
+        )
+        assert result.to_natives() == [None] * 4
+
+    def test_compare_incomparable_raises(self):
+        with pytest.raises(TypeError):
+            kernels.compare(
+                self.strings,
+                Value(TypeEnum.INT, 1),
+                ComparisonOperandEnum.EQ,
+            )
+
+    def test_modify(self):
+        result = kernels.modify(
+            self.ints, self.decimals, ModificationOperandEnum.ADD
+        )
+
+        assert result.get_type_id() == TypeEnum.DECIMAL
+        assert result.to_natives() == [5.5, None, None, 8.0]
+
+    def test_divide_by_zero_is_nan(self):
+        result = kernels.modify(
+            self.ints, Value(TypeEnum.INT, 0), ModificationOperandEnum.DIV
+        )
+        natives = result.to_natives()
+
+        assert natives[1] is None
+        assert all(math.isnan(natives[i]) for i in (0, 2, 3))  # type: ignore
+
+    def test_aggregates(self):
+        assert kernels.count(self.ints) == 3
+        assert kernels.sum_values(self.ints) == 8
+        assert kernels.sum_values(self.decimals) == 7.5
+        assert kernels.min_value(self.strings) == "a"
+        assert kernels.max_value(self.ints) == 4
+
+    def test_aggregates_of_nulls(self):
+        nulls = ColumnVector.from_natives(TypeEnum.INT, [None, None])
+
+        assert kernels.count(nulls) == 0
+        assert kernels.sum_values(nulls) is None
+        assert kernels.min_value(nulls) is None
+        assert kernels.max_value(nulls) is None
+
+    def test_large_int_sum_is_exact(self):
+        large = ColumnVector.from_natives(TypeEnum.INT, [2**62, 2**62])
+        assert kernels.sum_values(large) == 2**63
+
+    def test_select(self):
+        mask = kernels.compare(
+            self.ints, Value(TypeEnum.INT, 2), ComparisonOperandEnum.GT
+        )
+        assert kernels.select(mask) == [0, 3]
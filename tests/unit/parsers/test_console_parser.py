@@ -7,6 +7,7 @@ from engine.execution.expressions.comparison_expression import (
 )
 from engine.execution.expressions.constant_expression import ConstantExpression
 from engine.execution.expressions.expression import Expression
+from engine.execution.order_by import NullOrder, OrderBy, SortDirection
 from engine.execution.parser import (
     ConsoleSelectParser,
     ExpressionResolver,
@@ -99,10 +100,26 @@ class TestConsoleSelectParser:
         assert statement.group_bys == []
         assert statement.aggregates == []
         assert statement.select_expressions == []
-        assert statement.order_by == [self.col_expr2]
+        assert statement.order_by == [OrderBy(self.col_expr2)]
         assert statement.limit == 10
         assert statement.offset == 5
 
+    def test_parse_sort_options(self):
+        args = [
+            "--table=table1",
+            "--sort=col2:desc",
+            "--sort=col1:asc:nulls_first",
+        ]
+        statement = self.parser.parse(args)
+        assert statement.order_by == [
+            OrderBy(self.col_expr2, SortDirection.DESC),
+            OrderBy(self.col_expr1, SortDirection.ASC, NullOrder.FIRST),
+        ]
+
+    def test_parse_invalid_sort_option(self):
+        with pytest.raises(ValueError, match="Invalid sort format"):
+            self.parser.parse(["--table=table1", "--sort=col2:down"])
+
     def test_parse_config_with_sort_limit_offset(self):
         args = ["--table=table1", "--sort=col2"]
         config1 = self.parser.parse_config(args)
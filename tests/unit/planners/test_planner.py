@@ -4,8 +4,12 @@ import pytest
 
 from engine.execution.aggregate import AggregationType
 from engine.execution.expressions.column_expression import ColumnExpression
+from engine.execution.expressions.comparison_expression import (
+    ComparisonExpression,
+)
 from engine.execution.expressions.constant_expression import ConstantExpression
 from engine.execution.expressions.expression import Expression
+from engine.execution.order_by import OrderBy
 from engine.execution.plan.aggregation_plan import AggregationPlan
 from engine.execution.plan.filter_plan import FilterPlan
 from engine.execution.plan.limit_plan import LimitPlan
@@ -13,13 +17,16 @@ from engine.execution.plan.offset_plan import OffsetPlan
 from engine.execution.plan.projection_plan import ProjectionPlan
 from engine.execution.plan.scan_plan import ScanPlan
 from engine.execution.plan.sort_plan import SortPlan
+from engine.execution.plan.top_n_plan import TopNPlan
 from engine.execution.planner import (
     AggregateDef,
     QueryPlanner,
     SelectStatement,
 )
+from storage.predicate import ColumnPredicate
 from storage.schema import Column, Schema
-from storage.table import Table
+from storage.table import CSVTable, ScanMode, ScanOptions, Table
+from type.enums import ComparisonOperandEnum
 from type.type_enum import TypeEnum
 from type.value import Value
 
@@ -43,8 +50,15 @@ class TestQueryPlanner:
         self.select_expr2.get_return_type.return_value = TypeEnum.INT
         self.where_clause = Mock(spec=Expression)
         self.group_by_expr = Mock(spec=Expression)
-        self.order_by_expr = Mock(spec=Expression)
+        self.order_by_expr = OrderBy(Mock(spec=Expression))
         self.aggregate_expr = Mock(spec=Expression)
+        for expr in (
+            self.where_clause,
+            self.group_by_expr,
+            self.order_by_expr.expr,
+            self.aggregate_expr,
+        ):
+            expr.bind.return_value = expr
         self.aggregate_def = AggregateDef(
             AggregationType.COUNT, self.aggregate_expr, "count"
         )
@@ -98,6 +112,151 @@ class TestQueryPlanner:
         schema = grandchild.get_output_schema()
         assert table == self.table
         assert schema == self.table_schema
+        assert grandchild.get_predicates() == []
+
+    def test_create_plan_pushes_comparison_to_scan(self):
+        column = self.table_schema.get_column(1)
+        where_clause = ComparisonExpression(
+            ColumnExpression(column),
+            ConstantExpression(Value.create_int(5)),
+            ComparisonOperandEnum.GT,
+        )
+        statement = SelectStatement(
+            select_expressions=[self.select_expr1],
+            from_table="table1",
+            group_bys=[],
+            aggregates=[],
+            where_clause=where_clause,
+        )
+        plan = self.planner.create_plan(statement)
+
+        filter_plan = plan.get_child()  # type: ignore
+        assert isinstance(filter_plan, FilterPlan)
+        scan = filter_plan.get_child()
+        assert isinstance(scan, ScanPlan)
+        assert scan.get_predicates() == [
+            ColumnPredicate(
+                column, ComparisonOperandEnum.GT, Value.create_int(5)
+            )
+        ]
+
+    def test_create_plan_scans_only_referenced_columns(self):
+        column1 = self.table_schema.get_column(0)
+        column2 = self.table_schema.get_column(1)
+        statement = SelectStatement(
+            select_expressions=[ColumnExpression(column2)],
+            from_table="table1",
+            group_bys=[],
+            aggregates=[],
+        )
+        plan = self.planner.create_plan(statement)
+
+        scan = plan.get_child()  # type: ignore
+        assert isinstance(scan, ScanPlan)
+        assert scan.get_output_schema() == Schema([column2])
+        assert column1 not in scan.get_output_schema().get_columns()
+
+    def test_create_plan_scans_columns_of_aggregation(self):
+        column2 = self.table_schema.get_column(1)
+        statement = SelectStatement(
+            select_expressions=[ColumnExpression(column2)],
+            from_table="table1",
+            group_bys=[],
+            aggregates=[
+                AggregateDef(
+                    AggregationType.SUM, ColumnExpression(column2), "sum"
+                )
+            ],
+        )
+        plan = self.planner.create_plan(statement)
+
+        aggregation = plan.get_child()  # type: ignore
+        assert isinstance(aggregation, AggregationPlan)
+        scan = aggregation.get_child()
+        assert isinstance(scan, ScanPlan)
+        assert scan.get_output_schema() == Schema([column2])
+
+    def test_create_plan_binds_columns_to_input_schema(self):
+        self.catalog["table1"] = CSVTable("table1.csv", self.table_schema)
+        column2 = self.table_schema.get_column(1)
+        statement = SelectStatement(
+            select_expressions=[ColumnExpression(column2)],
+            from_table="table1",
+            group_bys=[],
+            aggregates=[],
+            where_clause=ComparisonExpression(
+                ColumnExpression(column2),
+                ConstantExpression(Value(TypeEnum.INT, 1)),
+                ComparisonOperandEnum.GT,
+            ),
+        )
+        plan = self.planner.create_plan(statement)
+
+        assert isinstance(plan, ProjectionPlan)
+        projected = plan.get_expressions()[0]
+        assert projected.get_index() == 0  # type: ignore
+        filter_plan = plan.get_child()
+        assert isinstance(filter_plan, FilterPlan)
+        left = filter_plan.get_predicate().get_left()  # type: ignore
+        assert left.get_index() == 0
+
+    def test_create_plan_binds_aggregation_inputs(self):
+        self.catalog["table1"] = CSVTable("table1.csv", self.table_schema)
+        plan = self.planner.create_plan(self.create_grouped_statement())
+
+        aggregation = plan.get_child()  # type: ignore
+        assert isinstance(aggregation, AggregationPlan)
+        group_by = aggregation.get_group_bys()[0]
+        aggregate = aggregation.get_aggregates()[0]
+        assert group_by.get_index() == 0  # type: ignore
+        assert aggregate.expr.get_index() == 1  # type: ignore
+        assert [
+            expr.get_index()  # type: ignore
+            for expr in plan.get_expressions()  # type: ignore
+        ] == [0, 1]
+
+    def create_grouped_statement(self) -> SelectStatement:
+        column1 = self.table_schema.get_column(0)
+        column2 = self.table_schema.get_column(1)
+        return SelectStatement(
+            select_expressions=[
+                ColumnExpression(column1),
+                ColumnExpression(column2),
+            ],
+            from_table="table1",
+            group_bys=[ColumnExpression(column1)],
+            aggregates=[
+                AggregateDef(
+                    AggregationType.SUM, ColumnExpression(column2), "sum"
+                )
+            ],
+        )
+
+    def test_create_plan_streams_aggregation_over_sorted_table(self):
+        self.catalog["table1"] = CSVTable(
+            "table1.csv", self.table_schema, sorted_by=["col1", "col2"]
+        )
+        plan = self.planner.create_plan(self.create_grouped_statement())
+
+        aggregation = plan.get_child()  # type: ignore
+        assert isinstance(aggregation, AggregationPlan)
+        assert aggregation.is_input_sorted()
+
+    def test_create_plan_hashes_aggregation_over_unsorted_table(self):
+        self.catalog["table1"] = CSVTable(
+            "table1.csv", self.table_schema, sorted_by=["col2"]
+        )
+        plan = self.planner.create_plan(self.create_grouped_statement())
+        assert not plan.get_child().is_input_sorted()  # type: ignore
+
+        self.catalog["table1"] = CSVTable(
+            "table1.csv",
+            self.table_schema,
+            options=ScanOptions(ScanMode.PARALLEL, preserve_order=False),
+            sorted_by=["col1"],
+        )
+        plan = self.planner.create_plan(self.create_grouped_statement())
+        assert not plan.get_child().is_input_sorted()  # type: ignore
 
     def test_create_plan_with_aggregation(self):
         statement = SelectStatement(
@@ -211,6 +370,30 @@ class TestQueryPlanner:
         assert isinstance(grandchild, ScanPlan)
         assert grandchild.get_table() == self.table
 
+    def test_create_plan_fuses_sort_and_limit(self):
+        statement = SelectStatement(
+            select_expressions=[self.select_expr1],
+            from_table="table1",
+            group_bys=[],
+            aggregates=[],
+            order_by=[self.order_by_expr],
+            limit=10,
+            offset=5,
+        )
+        plan = self.planner.create_plan(statement)
+        assert isinstance(plan, LimitPlan)
+        assert plan.get_limit() == 10
+
+        offset = plan.get_child()
+        assert isinstance(offset, OffsetPlan)
+        assert offset.get_offset() == 5
+
+        top_n = offset.get_child()
+        assert isinstance(top_n, TopNPlan)
+        assert top_n.get_n() == 15
+        assert top_n.get_order_by() == [self.order_by_expr]
+        assert isinstance(top_n.get_child(), ProjectionPlan)
+
     def test_create_plan_with_offset(self):
         statement = SelectStatement(
             select_expressions=[self.select_expr1],
@@ -0,0 +1,54 @@
+import pytest
+
+from storage import vector
+from storage.batch import ColumnBatch
+from storage.vector import ColumnVector
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestColumnVector:
+    @pytest.fixture(autouse=True, params=["python", "numpy"])
+    def setup(self, request, monkeypatch):
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(vector, "HAS_NUMPY", False)
+        self.backend = request.param
+
+    def test_from_natives_tracks_validity(self):
+        column = ColumnVector.from_natives(TypeEnum.INT, [1, None, 3])
+
+        assert len(column) == 3
+        assert column.is_numpy() == (self.backend == "numpy")
+        assert column.is_valid(0)
+        assert not column.is_valid(1)
+        assert column.to_natives() == [1, None, 3]
+        assert column.get_value(1) == Value(TypeEnum.INT, None)
+
+    def test_natives_are_python_types(self):
+        column = ColumnVector.from_natives(TypeEnum.DECIMAL, [1.5])
+        flags = ColumnVector.from_natives(TypeEnum.BOOLEAN, [True])
+
+        assert type(column.get_native(0)) is float
+        assert flags.get_native(0) is True
+
+    def test_from_batch(self):
+        batch = ColumnBatch(TypeEnum.STRING)
+        batch.append("a")
+        batch.append(None)
+
+        column = ColumnVector.from_batch(batch)
+
+        assert column.get_type_id() == TypeEnum.STRING
+        assert column.to_natives() == ["a", None]
+
+    def test_from_constant(self):
+        column = ColumnVector.from_constant(Value(TypeEnum.INT, 7), 2)
+        assert column.to_values() == [Value(TypeEnum.INT, 7)] * 2
+
+    def test_wide_integers_stay_python_ints(self):
+        column = ColumnVector.from_natives(TypeEnum.INT, [2**70, 1])
+
+        assert not column.is_numpy()
+        assert column.get_native(0) == 2**70
@@ -3,10 +3,12 @@ from typing import Any
 
 import pytest
 
+from storage.predicate import ColumnPredicate
 from storage.reader import CSVTableReader
 from storage.schema import Column, Schema
-from storage.table import CSVTable
+from storage.table import CSVTable, ScanOptions
 from storage.tuple import Tuple
+from type.enums import ComparisonOperandEnum
 from type.type_enum import TypeEnum
 from type.value import Value
 
@@ -104,3 +106,116 @@ class TestCSVTableReader:
                 .compare_equals(Value(TypeEnum.STRING, "value1"))
             )
             assert tuples[0].values[1].compare_equals(Value(TypeEnum.INT, 123))
+
+    def test_read_batches_yields_columns(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w+", delete=False, suffix=".csv"
+        ) as temp_file:
+            self.write_file(temp_file, "value1,123\nvalue2,456\nvalue3,789\n")
+            table = CSVTable(temp_file.name, self.schema, skip_first=False)
+            reader = CSVTableReader(table)
+
+            batches = list(reader.read_batches(batch_size=2))
+            assert [b.get_row_count() for b in batches] == [2, 1]
+            assert list(batches[0].get_column(0).get_data()) == [
+                "value1",
+                "value2",
+            ]
+            assert list(batches[0].get_column(1).get_data()) == [123, 456]
+            assert batches[1].get_column(1).get_native(0) == 789
+            assert batches[0].get_schema() == self.schema
+
+    def test_read_batches_matches_read(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w+", delete=False, suffix=".csv"
+        ) as temp_file:
+            self.write_file(temp_file, "value,int\nvalue1,123\nvalue2,456\n")
+            table = CSVTable(temp_file.name, self.schema)
+            reader = CSVTableReader(table)
+
+            tuples = [
+                tup
+                for batch in reader.read_batches()
+                for tup in batch.to_tuples()
+            ]
+            assert tuples == list(reader.read())
+
+    def test_read_batches_invalid_row(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w+", delete=False, suffix=".csv"
+        ) as temp_file:
+            self.write_file(temp_file, "value1\n")
+            table = CSVTable(temp_file.name, self.schema, skip_first=False)
+            reader = CSVTableReader(table)
+            with pytest.raises(
+                AssertionError, match="Value count doesn't match schema"
+            ):
+                list(reader.read_batches())
+
+    def test_read_selected_columns(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w+", delete=False, suffix=".csv"
+        ) as temp_file:
+            self.write_file(temp_file, "value1,123\nvalue2,456\n")
+            table = CSVTable(temp_file.name, self.schema, skip_first=False)
+            reader = CSVTableReader(table, columns=[1])
+
+            tuples = list(reader.read())
+            batches = list(reader.read_batches())
+
+            assert reader.get_output_schema() == Schema([self.column2])
+            assert [str(tup) for tup in tuples] == ["123", "456"]
+            assert tuples[0].schema == Schema([self.column2])
+            assert batches[0].get_schema() == Schema([self.column2])
+            assert list(batches[0].get_column(0).get_data()) == [123, 456]
+
+    def test_read_no_columns_keeps_row_count(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w+", delete=False, suffix=".csv"
+        ) as temp_file:
+            self.write_file(temp_file, "value1,123\nvalue2,456\n")
+            table = CSVTable(temp_file.name, self.schema, skip_first=False)
+            reader = CSVTableReader(table, columns=[])
+
+            assert len(list(reader.read())) == 2
+            assert [b.get_row_count() for b in reader.read_batches()] == [2]
+
+    def test_read_with_predicates(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w+", delete=False, suffix=".csv"
+        ) as temp_file:
+            self.write_file(temp_file, "value1,123\nvalue2,456\nvalue3,x\n")
+            table = CSVTable(temp_file.name, self.schema, skip_first=False)
+            predicate = ColumnPredicate(
+                self.column1,
+                ComparisonOperandEnum.EQ,
+                Value(TypeEnum.STRING, "value2"),
+            )
+            reader = CSVTableReader(table, columns=[1], predicates=[predicate])
+
+            # Rejected rows are never converted, so "x" is not parsed
+            assert [str(tup) for tup in reader.read()] == ["456"]
+            batches = list(reader.read_batches())
+            assert list(batches[0].get_column(0).get_data()) == [456]
+
+    def test_read_lazy_decode(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w+", delete=False, suffix=".csv"
+        ) as temp_file:
+            self.write_file(temp_file, "value1,123\nvalue2,x\n")
+            table = CSVTable(
+                temp_file.name,
+                self.schema,
+                skip_first=False,
+                options=ScanOptions(lazy_decode=True),
+            )
+            tuples = list(CSVTableReader(table).read())
+
+            # The invalid cell is only parsed when it is read
+            assert tuples[1].get_value(0) == Value(TypeEnum.STRING, "value2")
+            assert tuples[0] == Tuple(
+                [Value(TypeEnum.STRING, "value1"), Value(TypeEnum.INT, 123)],
+                self.schema,
+            )
+            with pytest.raises(ValueError, match="Cannot convert string"):
+                tuples[1].get_value(1)
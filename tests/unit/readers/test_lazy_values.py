@@ -0,0 +1,52 @@
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from storage.lazy_values import LazyValues
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestLazyValues:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.decode_name = Mock(
+            side_effect=lambda raw: Value(TypeEnum.STRING, raw)
+        )
+        self.decode_price = Mock(
+            side_effect=lambda raw: Value(TypeEnum.INT, int(raw))
+        )
+        self.values = LazyValues(
+            ["phone", "999"], [self.decode_name, self.decode_price]
+        )
+
+    def test_decodes_on_first_access(self):
+        assert not self.values.is_decoded(1)
+        assert self.values[1] == Value(TypeEnum.INT, 999)
+        assert self.values[1] is self.values[1]
+        assert self.values.is_decoded(1)
+        self.decode_price.assert_called_once_with("999")
+        self.decode_name.assert_not_called()
+
+    def test_sequence_access(self):
+        expected = [Value(TypeEnum.STRING, "phone"), Value(TypeEnum.INT, 999)]
+        assert len(self.values) == 2
+        assert list(self.values) == expected
+        assert self.values[-1] == expected[1]
+        assert self.values[:1] == expected[:1]
+        assert self.values == expected
+        assert expected == self.values
+
+    def test_checks_width(self):
+        with pytest.raises(
+            AssertionError, match="Value count doesn't match schema"
+        ):
+            LazyValues(["phone"], [self.decode_name, self.decode_price])
+
+    def test_pickle_decodes_values(self):
+        restored = pickle.loads(pickle.dumps(self.values))
+        assert restored == [
+            Value(TypeEnum.STRING, "phone"),
+            Value(TypeEnum.INT, 999),
+        ]
@@ -0,0 +1,130 @@
+import tempfile
+
+import pytest
+
+from storage.predicate import ColumnPredicate
+from storage.reader import (
+    CSVTableReader,
+    MMapCSVTableReader,
+    TableReaderFactory,
+)
+from storage.schema import Column, Schema
+from storage.table import CSVTable, ScanMode, ScanOptions
+from type.enums import ComparisonOperandEnum
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestMMapCSVTableReader:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.schema = Schema(
+            [
+                Column("name", TypeEnum.STRING),
+                Column("brand", TypeEnum.STRING),
+                Column("price", TypeEnum.INT),
+            ]
+        )
+
+    def create_table(
+        self, data: str, skip_first: bool = False, lazy_decode: bool = False
+    ) -> CSVTable:
+        with tempfile.NamedTemporaryFile(
+            mode="w", delete=False, suffix=".csv", newline=""
+        ) as temp_file:
+            temp_file.write(data)
+        return CSVTable(
+            temp_file.name,
+            self.schema,
+            skip_first=skip_first,
+            options=ScanOptions(ScanMode.MMAP, lazy_decode=lazy_decode),
+        )
+
+    def test_read_matches_csv_reader(self):
+        table = self.create_table(
+            'name,brand,price\nphone,apple,999\n"tv, 55",lg,500\r\n',
+            skip_first=True,
+        )
+        tuples = list(MMapCSVTableReader(table).read())
+
+        assert len(tuples) == 2
+        assert tuples == list(CSVTableReader(table).read())
+        assert tuples[1].get_value(0).get_value() == "tv, 55"
+        assert tuples[1].get_value(2).get_value() == 500
+
+    def test_read_lazy_decode_matches_eager(self):
+        data = 'phone,apple,999\n"tv, 55",lg,500\n'
+        eager = list(MMapCSVTableReader(self.create_table(data)).read())
+        lazy = list(
+            MMapCSVTableReader(
+                self.create_table(data, lazy_decode=True)
+            ).read()
+        )
+        assert lazy == eager
+
+    def test_read_quoted_newlines(self):
+        table = self.create_table(
+            '"tv\n55",lg,500\r\n"say ""hi""\r\nthere",x,1\nphone,apple,999\n'
+        )
+        tuples = list(MMapCSVTableReader(table).read())
+
+        assert tuples == list(CSVTableReader(table).read())
+        assert [tup.get_value(0).get_value() for tup in tuples] == [
+            "tv\n55",
+            'say "hi"\r\nthere',
+            "phone",
+        ]
+
+    def test_read_unclosed_quote(self):
+        table = self.create_table('phone,apple,999\n"tv,lg,500\n')
+        with pytest.raises(
+            AssertionError, match="Value count doesn't match schema"
+        ):
+            list(MMapCSVTableReader(table).read())
+
+    def test_read_without_trailing_newline(self):
+        table = self.create_table("phone,apple,999")
+        tuples = list(MMapCSVTableReader(table).read())
+        assert len(tuples) == 1
+        assert tuples[0].get_value(2).compare_equals(Value(TypeEnum.INT, 999))
+
+    def test_read_selected_columns(self):
+        table = self.create_table("phone,apple,999\nlaptop,lenovo,1200\n")
+        reader = MMapCSVTableReader(table, columns=[2, 0])
+
+        tuples = list(reader.read())
+
+        assert reader.get_output_schema().get_columns() == [
+            self.schema.get_column(2),
+            self.schema.get_column(0),
+        ]
+        assert [str(tup) for tup in tuples] == ["999,phone", "1200,laptop"]
+
+    def test_read_empty_file(self):
+        table = self.create_table("")
+        assert list(MMapCSVTableReader(table).read()) == []
+
+    def test_read_invalid_row(self):
+        table = self.create_table("phone,apple\n")
+        with pytest.raises(
+            AssertionError, match="Value count doesn't match schema"
+        ):
+            list(MMapCSVTableReader(table).read())
+
+    def test_factory_creates_mmap_reader(self):
+        table = self.create_table("")
+        reader = TableReaderFactory.create_reader(table)
+        assert isinstance(reader, MMapCSVTableReader)
+
+    def test_read_with_predicates(self):
+        table = self.create_table(
+            'phone,apple,999\n"tv, 55",lg,500\nlaptop,lenovo,1200\n'
+        )
+        predicate = ColumnPredicate(
+            self.schema.get_column(2),
+            ComparisonOperandEnum.LTE,
+            Value(TypeEnum.INT, 999),
+        )
+        reader = MMapCSVTableReader(table, [0], [predicate])
+
+        assert [str(tup) for tup in reader.read()] == ["phone", "tv, 55"]
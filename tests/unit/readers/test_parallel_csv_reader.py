@@ -0,0 +1,118 @@
+import tempfile
+from itertools import pairwise
+
+import pytest
+
+from storage.byte_range import split_byte_ranges
+from storage.predicate import ColumnPredicate
+from storage.reader import (
+    CSVTableReader,
+    ParallelCSVTableReader,
+    TableReaderFactory,
+)
+from storage.schema import Column, Schema
+from storage.table import CSVTable, ScanMode, ScanOptions
+from type.enums import ComparisonOperandEnum
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestParallelCSVTableReader:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.schema = Schema(
+            [Column("name", TypeEnum.STRING), Column("price", TypeEnum.INT)]
+        )
+        rows = "".join(f"item{i},{i}\n" for i in range(200))
+        with tempfile.NamedTemporaryFile(
+            mode="w+", delete=False, suffix=".csv"
+        ) as temp_file:
+            temp_file.write("name,price\n" + rows)
+            temp_file.flush()
+        self.path = temp_file.name
+
+    def create_table(self, preserve_order: bool = True) -> CSVTable:
+        return CSVTable(
+            self.path,
+            self.schema,
+            options=ScanOptions(
+                ScanMode.PARALLEL, workers=2, preserve_order=preserve_order
+            ),
+        )
+
+    def test_split_byte_ranges_aligns_to_newlines(self):
+        ranges = split_byte_ranges(self.path, 100, skip_first=True)
+        with open(self.path, "rb") as file:
+            data = file.read()
+
+        assert len(ranges) > 1
+        assert ranges[0][0] == len(b"name,price\n")
+        assert ranges[-1][1] == len(data)
+        for (_, end), (start, _) in pairwise(ranges):
+            assert end == start
+            assert data[end - 1 : end] == b"\n"
+
+    def test_split_byte_ranges_keeps_quoted_newlines(self):
+        rows = "".join(f'"item\n{i}",{i}\n' for i in range(50))
+        with tempfile.NamedTemporaryFile(
+            mode="w+", delete=False, suffix=".csv"
+        ) as temp_file:
+            temp_file.write('"name\nfull",price\n' + rows)
+        table = CSVTable(
+            temp_file.name,
+            self.schema,
+            options=ScanOptions(ScanMode.PARALLEL, workers=2),
+        )
+
+        ranges = split_byte_ranges(temp_file.name, 7, skip_first=True)
+        tuples = list(ParallelCSVTableReader(table, chunk_size=7).read())
+
+        assert ranges[0][0] == len(b'"name\nfull",price\n')
+        assert len(ranges) == 50
+        assert tuples == list(CSVTableReader(table).read())
+        assert tuples[3].get_value(0).get_value() == "item\n3"
+
+    def test_read_preserves_order(self):
+        table = self.create_table()
+        reader = ParallelCSVTableReader(table, chunk_size=100)
+
+        tuples = list(reader.read())
+
+        assert tuples == list(CSVTableReader(table).read())
+
+    def test_read_unordered_returns_all_rows(self):
+        table = self.create_table(preserve_order=False)
+        reader = ParallelCSVTableReader(table, chunk_size=100)
+
+        prices = sorted(tup.get_value(1).get_value() for tup in reader.read())  # type: ignore
+
+        assert prices == list(range(200))
+
+    def test_read_empty_file(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w+", delete=False, suffix=".csv"
+        ) as empty_file:
+            table = CSVTable(
+                empty_file.name,
+                self.schema,
+                options=ScanOptions(ScanMode.PARALLEL),
+            )
+            assert list(ParallelCSVTableReader(table).read()) == []
+
+    def test_factory_creates_parallel_reader(self):
+        reader = TableReaderFactory.create_reader(self.create_table())
+        assert isinstance(reader, ParallelCSVTableReader)
+
+    def test_read_with_predicates(self):
+        predicate = ColumnPredicate(
+            self.schema.get_column(1),
+            ComparisonOperandEnum.GTE,
+            Value(TypeEnum.INT, 150),
+        )
+        reader = ParallelCSVTableReader(
+            self.create_table(), predicates=[predicate], chunk_size=100
+        )
+
+        prices = [tup.get_value(1).get_value() for tup in reader.read()]
+
+        assert prices == list(range(150, 200))
@@ -0,0 +1,79 @@
+import pytest
+
+from storage.batch import ColumnBatch, RecordBatch, RecordBatchBuilder
+from storage.schema import Column, Schema
+from storage.tuple import Tuple
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestColumnBatch:
+    def test_append_tracks_nulls(self):
+        column = ColumnBatch(TypeEnum.INT)
+        column.append(1)
+        column.append(None)
+        assert len(column) == 2
+        assert not column.is_null(0)
+        assert column.is_null(1)
+        assert column.get_native(0) == 1
+        assert column.get_native(1) is None
+        assert column.get_value(1).is_null()
+
+    def test_boolean_column_returns_bools(self):
+        column = ColumnBatch(TypeEnum.BOOLEAN)
+        column.append(True)
+        assert column.get_native(0) is True
+        assert column.get_value(0).get_type_id() == TypeEnum.BOOLEAN
+
+    def test_take_keeps_storage_and_nulls(self):
+        column = ColumnBatch(TypeEnum.INT)
+        for val in [1, None, 3]:
+            column.append(val)
+
+        taken = column.take([2, 1])
+
+        assert type(taken.get_data()) is type(column.get_data())
+        assert [taken.get_native(i) for i in range(len(taken))] == [3, None]
+
+    def test_wide_integers_fall_back_to_list(self):
+        column = ColumnBatch(TypeEnum.INT)
+        column.append(1)
+        column.append(2**70)
+        assert isinstance(column.get_data(), list)
+        assert column.get_native(1) == 2**70
+
+
+class TestRecordBatch:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.schema = Schema(
+            [
+                Column("name", TypeEnum.STRING),
+                Column("price", TypeEnum.DECIMAL),
+            ]
+        )
+        self.builder = RecordBatchBuilder(self.schema)
+
+    def test_build_batch(self):
+        self.builder.append_row(["a", 1.5])
+        self.builder.append_row(["b", None])
+        batch = self.builder.build()
+
+        assert batch.get_row_count() == 2
+        assert batch.get_column_by_name("price").is_null(1)
+        assert batch.get_tuple(0) == Tuple(
+            [Value(TypeEnum.STRING, "a"), Value(TypeEnum.DECIMAL, 1.5)],
+            self.schema,
+        )
+        assert len(batch.to_tuples()) == 2
+        assert self.builder.get_row_count() == 0
+
+    def test_append_row_invalid_width(self):
+        with pytest.raises(
+            AssertionError, match="Value count doesn't match schema"
+        ):
+            self.builder.append_row(["a"])
+
+    def test_batch_column_count_must_match_schema(self):
+        with pytest.raises(AssertionError):
+            RecordBatch([ColumnBatch(TypeEnum.STRING)], self.schema)
@@ -0,0 +1,67 @@
+import io
+
+import pytest
+
+from storage.row_codec import RowCodec
+from storage.schema import Column, Schema
+from storage.tuple import Tuple
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestRowCodec:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.schema = Schema(
+            [
+                Column("name", TypeEnum.STRING),
+                Column("price", TypeEnum.INT),
+                Column("rating", TypeEnum.DECIMAL),
+                Column("available", TypeEnum.BOOLEAN),
+            ]
+        )
+        self.codec = RowCodec(self.schema)
+
+    def create_tuple(self, *values: object) -> Tuple:
+        return Tuple(
+            [
+                Value(column.get_type_id(), val)
+                for column, val in zip(
+                    self.schema.get_columns(), values, strict=True
+                )
+            ],
+            self.schema,
+        )
+
+    def test_encode_decode_roundtrip(self):
+        tup = self.create_tuple("смартфон, 5g", 999, 4.5, True)
+        encoded = self.codec.encode(tup)
+        assert self.codec.decode(encoded[4:]) == tup
+
+    def test_roundtrip_nulls_and_wide_ints(self):
+        tup = self.create_tuple(None, 2**70, None, False)
+        decoded = self.codec.decode(self.codec.encode(tup)[4:])
+
+        assert decoded.get_value(0).is_null()
+        assert decoded.get_value(1).get_value() == 2**70
+        assert decoded.get_value(2).is_null()
+        assert decoded.get_value(3).get_value() is False
+
+    def test_write_read_stream(self):
+        tuples = [
+            self.create_tuple("phone", 1, 1.5, True),
+            self.create_tuple("", -(2**63), 0.0, None),
+        ]
+        stream = io.BytesIO()
+        for tup in tuples:
+            self.codec.write(stream, tup)
+        stream.seek(0)
+
+        assert list(self.codec.read(stream)) == tuples
+
+    def test_encode_invalid_width(self):
+        tup = Tuple([], Schema([]))
+        with pytest.raises(
+            AssertionError, match="Value count doesn't match schema"
+        ):
+            self.codec.encode(tup)
@@ -0,0 +1,147 @@
+import pytest
+
+from storage.decoder import RowDecoder
+from storage.predicate import ColumnPredicate
+from storage.schema import Column, Schema
+from storage.tuple import Tuple
+from type.enums import ComparisonOperandEnum
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestRowDecoder:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.schema = Schema(
+            [
+                Column("name", TypeEnum.STRING),
+                Column("price", TypeEnum.INT),
+                Column("rating", TypeEnum.DECIMAL),
+                Column("available", TypeEnum.BOOLEAN),
+            ]
+        )
+        self.decoder = RowDecoder(self.schema)
+
+    def test_parse_returns_native_values(self):
+        row = self.decoder.parse(["phone", "999", "4.5", "true"])
+        assert row == ["phone", 999, 4.5, True]
+        assert isinstance(row[1], int)
+        assert isinstance(row[2], float)
+
+    def test_decode_builds_tuple(self):
+        tup = self.decoder.decode(["phone", "999", "4.5", "0"])
+        assert tup == Tuple(
+            [
+                Value(TypeEnum.STRING, "phone"),
+                Value(TypeEnum.INT, 999),
+                Value(TypeEnum.DECIMAL, 4.5),
+                Value(TypeEnum.BOOLEAN, False),
+            ],
+            self.schema,
+        )
+
+    def test_decode_invalid_width(self):
+        with pytest.raises(
+            AssertionError, match="Value count doesn't match schema"
+        ):
+            self.decoder.decode(["phone", "999"])
+
+    def test_decode_invalid_cell_reports_type_error(self):
+        with pytest.raises(ValueError, match="Cannot convert string 'x'"):
+            self.decoder.decode(["phone", "x", "4.5", "true"])
+        with pytest.raises(ValueError, match="Boolean value format error"):
+            self.decoder.decode(["phone", "1", "4.5", "maybe"])
+
+    def create_predicate(
+        self, idx: int, op: ComparisonOperandEnum, value: Value
+    ) -> ColumnPredicate:
+        return ColumnPredicate(self.schema.get_column(idx), op, value)
+
+    def test_accepts_without_predicates(self):
+        assert self.decoder.accepts(["phone", "x", "4.5", "true"])
+
+    def test_accepts_evaluates_raw_cells(self):
+        decoder = RowDecoder(
+            self.schema,
+            predicates=[
+                self.create_predicate(
+                    1, ComparisonOperandEnum.GT, Value(TypeEnum.DECIMAL, 500.5)
+                ),
+                self.create_predicate(
+                    0, ComparisonOperandEnum.NEQ, Value(TypeEnum.STRING, "tv")
+                ),
+            ],
+        )
+
+        assert decoder.accepts(["phone", "999", "4.5", "true"])
+        assert not decoder.accepts(["phone", "500", "4.5", "true"])
+        assert not decoder.accepts(["tv", "999", "4.5", "true"])
+
+    def test_accepts_rejects_null_constant(self):
+        decoder = RowDecoder(
+            self.schema,
+            predicates=[
+                self.create_predicate(
+                    1, ComparisonOperandEnum.EQ, Value(TypeEnum.INT, None)
+                )
+            ],
+        )
+        assert not decoder.accepts(["phone", "999", "4.5", "true"])
+
+    def test_accepts_skips_incomparable_predicates(self):
+        decoder = RowDecoder(
+            self.schema,
+            predicates=[
+                self.create_predicate(
+                    0, ComparisonOperandEnum.EQ, Value(TypeEnum.INT, 1)
+                )
+            ],
+        )
+        assert decoder.accepts(["phone", "999", "4.5", "true"])
+
+    def test_accepts_invalid_cell(self):
+        decoder = RowDecoder(
+            self.schema,
+            predicates=[
+                self.create_predicate(
+                    1, ComparisonOperandEnum.GT, Value(TypeEnum.INT, 1)
+                )
+            ],
+        )
+        with pytest.raises(
+            ValueError, match="Cannot convert string 'x' to integer"
+        ):
+            decoder.accepts(["phone", "x", "4.5", "true"])
+
+    def test_accepts_checks_width(self):
+        decoder = RowDecoder(
+            self.schema,
+            predicates=[
+                self.create_predicate(
+                    1, ComparisonOperandEnum.GT, Value(TypeEnum.INT, 1)
+                )
+            ],
+        )
+        with pytest.raises(
+            AssertionError, match="Value count doesn't match schema"
+        ):
+            decoder.accepts(["phone", "999"])
+
+    def test_decode_interns_values(self):
+        first = self.decoder.decode(["phone", "1", "4.5", "true"])
+        second = self.decoder.decode(["phone", "1", "4.5", "true"])
+        assert first.values[0] is second.values[0]
+        assert first.values[1] is second.values[1]
+        assert first.values[3] is second.values[3]
+
+    def test_decode_lazy_matches_decode(self):
+        row = ["phone", "999", "4.5", "true"]
+        tup = self.decoder.decode_lazy(row)
+        assert not tup.values.is_decoded(1)
+        assert tup == self.decoder.decode(row)
+        assert tup.values.is_decoded(1)
+
+    def test_decode_lazy_selected_columns(self):
+        decoder = RowDecoder(self.schema, columns=[1])
+        tup = decoder.decode_lazy(["phone", "999", "4.5", "true"])
+        assert tup.get_value_by_name("price") == Value(TypeEnum.INT, 999)
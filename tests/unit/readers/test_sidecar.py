@@ -0,0 +1,201 @@
+import os
+import tempfile
+
+import pytest
+
+from storage.batch import RecordBatchBuilder
+from storage.predicate import ColumnPredicate
+from storage.reader import (
+    CachedCSVTableReader,
+    CSVTableReader,
+    TableReaderFactory,
+)
+from storage.schema import Column, Schema
+from storage.sidecar import (
+    Fingerprint,
+    SidecarReader,
+    SidecarWriter,
+    get_sidecar_path,
+)
+from storage.table import CSVTable, ScanOptions
+from type.enums import ComparisonOperandEnum
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestSidecar:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.schema = Schema(
+            [
+                Column("brand", TypeEnum.STRING),
+                Column("price", TypeEnum.INT),
+                Column("rating", TypeEnum.DECIMAL),
+                Column("available", TypeEnum.BOOLEAN),
+            ]
+        )
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "products.sidecar")
+        self.fingerprint = Fingerprint(10, 20)
+
+    def test_round_trip(self):
+        builder = RecordBatchBuilder(self.schema)
+        builder.append_row(["apple", 999, 4.5, True])
+        builder.append_row(["xiaomi", 199, None, False])
+        builder.append_row(["apple", None, 4.9, None])
+        builder.append_row([None, 5, 1.0, True])
+        writer = SidecarWriter(self.path, self.schema, self.fingerprint)
+        writer.write_batch(builder.build())
+        writer.commit()
+
+        reader = SidecarReader(self.path, self.schema)
+        batches = list(reader.read_batches())
+
+        assert reader.is_valid(self.fingerprint)
+        assert len(batches) == 1
+        rows = [
+            [batches[0].get_column(c).get_native(r) for c in range(4)]
+            for r in range(batches[0].get_row_count())
+        ]
+        assert rows == [
+            ["apple", 999, 4.5, True],
+            ["xiaomi", 199, None, False],
+            ["apple", None, 4.9, None],
+            [None, 5, 1.0, True],
+        ]
+
+    def test_read_batches_skips_chunks_by_zone_map(self):
+        writer = SidecarWriter(self.path, self.schema, self.fingerprint)
+        for prices in ([1, 2], [100, 200], [3, None]):
+            builder = RecordBatchBuilder(self.schema)
+            for price in prices:
+                builder.append_row(["brand", price, 1.0, True])
+            writer.write_batch(builder.build())
+        writer.commit()
+        reader = SidecarReader(self.path, self.schema)
+        predicate = ColumnPredicate(
+            self.schema.get_column(1),
+            ComparisonOperandEnum.GT,
+            Value.create_int(50),
+        )
+
+        batches = list(reader.read_batches([predicate]))
+
+        assert len(batches) == 1
+        assert list(batches[0].get_column(1).get_data()) == [100, 200]
+        zone_maps = reader.read_zone_maps()
+        assert [chunk[1].min for chunk in zone_maps] == [1, 100, 3]
+        assert [chunk[1].null_count for chunk in zone_maps] == [0, 0, 1]
+        assert zone_maps[0][0].max == "brand"
+
+    def test_is_valid_rejects_changed_fingerprint(self):
+        SidecarWriter(self.path, self.schema, self.fingerprint).commit()
+        reader = SidecarReader(self.path, self.schema)
+        assert not reader.is_valid(Fingerprint(11, 20))
+
+    def test_is_valid_rejects_changed_schema(self):
+        SidecarWriter(self.path, self.schema, self.fingerprint).commit()
+        schema = Schema([Column("brand", TypeEnum.STRING)])
+        assert not SidecarReader(self.path, schema).is_valid(self.fingerprint)
+
+    def test_is_valid_missing_file(self):
+        reader = SidecarReader(self.path, self.schema)
+        assert not reader.is_valid(self.fingerprint)
+
+    def test_abort_removes_partial_file(self):
+        writer = SidecarWriter(self.path, self.schema, self.fingerprint)
+        writer.abort()
+        assert os.listdir(self.directory) == []
+
+
+class TestCachedCSVTableReader:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.schema = Schema(
+            [Column("name", TypeEnum.STRING), Column("price", TypeEnum.INT)]
+        )
+        self.directory = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.directory, "products.csv")
+        with open(self.csv_path, "w") as file:
+            file.write("name,price\nphone,999\nlaptop,1200\n")
+        self.table = CSVTable(
+            self.csv_path, self.schema, options=ScanOptions(use_cache=True)
+        )
+
+    def test_first_scan_writes_sidecar(self):
+        reader = TableReaderFactory.create_reader(self.table)
+        assert isinstance(reader, CachedCSVTableReader)
+
+        tuples = list(reader.read())
+
+        assert tuples == list(CSVTableReader(self.table).read())
+        assert os.path.exists(get_sidecar_path(self.csv_path))
+
+    def test_later_scan_reads_sidecar(self):
+        list(TableReaderFactory.create_reader(self.table).read())
+        source = CSVTableReader(self.table)
+        source.read_batches = None  # type: ignore
+        reader = CachedCSVTableReader(self.table, source)
+
+        assert [str(tup) for tup in reader.read()] == [
+            "phone,999",
+            "laptop,1200",
+        ]
+
+    def test_read_selected_columns(self):
+        list(TableReaderFactory.create_reader(self.table, columns=[1]).read())
+        reader = TableReaderFactory.create_reader(self.table, columns=[1])
+
+        tuples = list(reader.read())
+
+        assert [str(tup) for tup in tuples] == ["999", "1200"]
+        assert tuples[0].schema == Schema([self.schema.get_column(1)])
+        sidecar = SidecarReader(get_sidecar_path(self.csv_path), self.schema)
+        assert sidecar.is_valid(Fingerprint.from_path(self.csv_path))
+
+    def test_stale_sidecar_is_rebuilt(self):
+        list(TableReaderFactory.create_reader(self.table).read())
+        with open(self.csv_path, "a") as file:
+            file.write("tablet,300\n")
+
+        tuples = list(TableReaderFactory.create_reader(self.table).read())
+
+        assert len(tuples) == 3
+        sidecar = SidecarReader(get_sidecar_path(self.csv_path), self.schema)
+        assert sidecar.is_valid(Fingerprint.from_path(self.csv_path))
+
+    def test_sidecar_is_rebuilt_when_skip_first_changes(self):
+        schema = Schema(
+            [Column("name", TypeEnum.STRING), Column("price", TypeEnum.STRING)]
+        )
+        table = CSVTable(
+            self.csv_path, schema, options=ScanOptions(use_cache=True)
+        )
+        list(TableReaderFactory.create_reader(table).read())
+        table = CSVTable(
+            self.csv_path,
+            schema,
+            skip_first=False,
+            options=ScanOptions(use_cache=True),
+        )
+
+        tuples = list(TableReaderFactory.create_reader(table).read())
+
+        assert [str(tup) for tup in tuples] == [
+            "name,price",
+            "phone,999",
+            "laptop,1200",
+        ]
+        sidecar = SidecarReader(get_sidecar_path(self.csv_path), schema)
+        assert sidecar.is_valid(
+            Fingerprint.from_path(self.csv_path, skip_first=False)
+        )
+        assert not sidecar.is_valid(Fingerprint.from_path(self.csv_path))
+
+    def test_interrupted_scan_leaves_no_sidecar(self):
+        reader = TableReaderFactory.create_reader(self.table)
+        iterator = reader.read()
+        next(iterator)
+        iterator.close()  # type: ignore
+
+        assert os.listdir(self.directory) == ["products.csv"]
@@ -1,9 +1,11 @@
 import pytest
 
+from storage.predicate import ColumnPredicate
 from storage.reader import StringTableReader
 from storage.schema import Column, Schema
 from storage.table import StringTable
 from storage.tuple import Tuple
+from type.enums import ComparisonOperandEnum
 from type.type_enum import TypeEnum
 from type.value import Value
 
@@ -64,3 +66,17 @@ class TestStringTableReader:
         self.table.set_data("value1\n")
         with pytest.raises(AssertionError):
             list(self.reader.read())
+
+    def test_read_batches_falls_back_to_rows(self):
+        batches = list(self.reader.read_batches(batch_size=1))
+        assert len(batches) == 2
+        assert batches[0].get_column(0).get_native(0) == "value1"
+        assert batches[1].get_column(1).get_native(0) == 456
+
+    def test_read_with_predicates(self):
+        predicate = ColumnPredicate(
+            self.column2, ComparisonOperandEnum.LT, Value(TypeEnum.INT, 200)
+        )
+        reader = StringTableReader(self.table, predicates=[predicate])
+
+        assert [str(tup) for tup in reader.read()] == ["value1,123"]
@@ -0,0 +1,56 @@
+import sys
+
+import pytest
+
+from storage.schema import Column, Schema
+from storage.tuple import Tuple
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestTuple:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.schema = Schema(
+            [Column("name", TypeEnum.STRING), Column("price", TypeEnum.INT)]
+        )
+        self.values = [
+            Value(TypeEnum.STRING, "phone"),
+            Value(TypeEnum.INT, 999),
+        ]
+
+    def test_checks_width(self):
+        with pytest.raises(
+            AssertionError, match="Value count doesn't match schema"
+        ):
+            Tuple(self.values[:1], self.schema)
+
+    def test_create_unchecked(self):
+        tup = Tuple.create_unchecked(self.values, self.schema)
+        assert tup == Tuple(self.values, self.schema)
+        assert tup.get_value_by_name("price") == Value(TypeEnum.INT, 999)
+
+    def test_has_no_instance_dict(self):
+        tup = Tuple(self.values, self.schema)
+        assert not hasattr(tup, "__dict__")
+        assert not hasattr(tup.values[0], "__dict__")
+
+    def test_get_footprint(self):
+        tup = Tuple(self.values, self.schema)
+        expected = (
+            sys.getsizeof(tup)
+            + sys.getsizeof(self.values)
+            + sum(
+                sys.getsizeof(value) + sys.getsizeof(value.get_value())
+                for value in self.values
+            )
+        )
+        assert tup.get_footprint() == expected
+
+    def test_footprint_grows_with_payload(self):
+        short = Tuple(self.values, self.schema)
+        long = Tuple(
+            [Value(TypeEnum.STRING, "phone" * 100), self.values[1]],
+            self.schema,
+        )
+        assert long.get_footprint() > short.get_footprint()
@@ -0,0 +1,89 @@
+import pytest
+
+from storage.batch import ColumnBatch
+from storage.predicate import ColumnPredicate
+from storage.schema import Column
+from storage.zone_map import ZoneMap
+from type.enums import ComparisonOperandEnum
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestZoneMap:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.column = Column("price", TypeEnum.INT)
+        self.zone_map = ZoneMap(row_count=3, null_count=0, min=10, max=20)
+
+    def predicate(
+        self, op: ComparisonOperandEnum, value: Value
+    ) -> ColumnPredicate:
+        return ColumnPredicate(self.column, op, value)
+
+    def test_from_column_skips_nulls(self):
+        column = ColumnBatch(TypeEnum.INT)
+        for val in (5, None, 3, 9):
+            column.append(val)
+
+        zone_map = ZoneMap.from_column(column)
+
+        assert zone_map == ZoneMap(4, 1, 3, 9)
+
+    def test_from_column_all_nulls(self):
+        column = ColumnBatch(TypeEnum.STRING)
+        column.append(None)
+        zone_map = ZoneMap.from_column(column)
+        assert not zone_map.has_values()
+        assert not zone_map.might_match(
+            self.predicate(ComparisonOperandEnum.EQ, Value.create_int(1))
+        )
+
+    @pytest.mark.parametrize(
+        "op, value, expected",
+        [
+            (ComparisonOperandEnum.EQ, 15, True),
+            (ComparisonOperandEnum.EQ, 25, False),
+            (ComparisonOperandEnum.LT, 10, False),
+            (ComparisonOperandEnum.LTE, 10, True),
+            (ComparisonOperandEnum.GT, 20, False),
+            (ComparisonOperandEnum.GTE, 20, True),
+            (ComparisonOperandEnum.NEQ, 15, True),
+        ],
+    )
+    def test_might_match(
+        self, op: ComparisonOperandEnum, value: int, expected: bool
+    ):
+        predicate = self.predicate(op, Value.create_int(value))
+        assert self.zone_map.might_match(predicate) is expected
+
+    def test_might_match_numeric_constant_of_other_type(self):
+        predicate = self.predicate(
+            ComparisonOperandEnum.GT, Value.create_decimal(19.5)
+        )
+        assert self.zone_map.might_match(predicate)
+
+    def test_might_match_incomparable_keeps_chunk(self):
+        predicate = self.predicate(
+            ComparisonOperandEnum.EQ, Value.create_string("x")
+        )
+        assert self.zone_map.might_match(predicate)
+
+    def test_neq_skips_constant_chunk(self):
+        zone_map = ZoneMap(row_count=2, null_count=0, min=7, max=7)
+        predicate = self.predicate(
+            ComparisonOperandEnum.NEQ, Value.create_int(7)
+        )
+        assert not zone_map.might_match(predicate)
+
+    @pytest.mark.parametrize("op", list(ComparisonOperandEnum))
+    def test_nan_bounds_keep_chunk(self, op: ComparisonOperandEnum):
+        column = ColumnBatch(TypeEnum.DECIMAL)
+        for val in (1.0, float("nan"), 7.0):
+            column.append(val)
+        zone_map = ZoneMap.from_column(column)
+        predicate = ColumnPredicate(
+            Column("rating", TypeEnum.DECIMAL), op, Value.create_decimal(7.0)
+        )
+
+        assert zone_map.has_nan()
+        assert zone_map.might_match(predicate)
@@ -83,6 +83,14 @@ class TestIntType:
         v3 = Value.create_decimal(5.1)
         assert v1.compare_less_than(v3) == ComparisonValue.TRUE
 
+    def test_compare_wide_ints_exactly(self):
+        v1 = Value.create_int(2**53 + 1)
+        v2 = Value.create_int(2**53)
+        assert v1.compare_greater_than(v2) == ComparisonValue.TRUE
+        assert v1.compare_equals(Value.create_decimal(2.0**53)) == (
+            ComparisonValue.FALSE
+        )
+
     def test_to_string(self):
         v = Value.create_int(42)
         assert v.to_string() == "42"
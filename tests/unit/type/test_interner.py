@@ -0,0 +1,41 @@
+import pickle
+
+from type.interner import ValueInterner
+from type.type_enum import TypeEnum
+from type.value import Value
+
+
+class TestValueInterner:
+    def test_deduplicates_strings(self):
+        intern = ValueInterner(TypeEnum.STRING)
+        first = intern("apple")
+        assert first == Value(TypeEnum.STRING, "apple")
+        assert intern("apple") is first
+        assert intern("samsung") is not first
+        assert intern.get_size() == 2
+
+    def test_null_string(self):
+        intern = ValueInterner(TypeEnum.STRING)
+        assert intern(None) is Value.intern(TypeEnum.STRING, None)
+        assert intern.get_size() == 0
+
+    def test_capacity_limits_cache(self):
+        intern = ValueInterner(TypeEnum.STRING, capacity=1)
+        first = intern("apple")
+        assert intern("samsung") is not intern("samsung")
+        assert intern("apple") is first
+        assert intern.get_size() == 1
+
+    def test_other_types_use_value_intern(self):
+        intern = ValueInterner(TypeEnum.INT)
+        assert intern(5) is Value.intern(TypeEnum.INT, 5)
+        assert intern(10_000) == Value(TypeEnum.INT, 10_000)
+        assert intern.get_size() == 0
+
+    def test_pickle_drops_cache(self):
+        intern = ValueInterner(TypeEnum.STRING, capacity=10)
+        intern("apple")
+        restored = pickle.loads(pickle.dumps(intern))
+        assert restored.get_size() == 0
+        assert restored.get_type_id() == TypeEnum.STRING
+        assert restored("apple") == Value(TypeEnum.STRING, "apple")
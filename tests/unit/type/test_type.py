@@ -2,7 +2,7 @@ import pytest
 
 from type.boolean_type import BooleanType
 from type.decimal_value import DecimalType
-from type.enums import ModificationOperandEnum
+from type.enums import ComparisonOperandEnum, ModificationOperandEnum
 from type.int_type import IntType
 from type.string_value import StringType
 from type.type import Type
@@ -20,6 +20,34 @@ class TestType:
         v2 = Value.create_string("5")
         assert not Type.check_comparable(v1, v2)
 
+    @pytest.mark.parametrize(
+        ("left", "right"),
+        [
+            (TypeEnum.INT, TypeEnum.INT),
+            (TypeEnum.INT, TypeEnum.DECIMAL),
+            (TypeEnum.DECIMAL, TypeEnum.INT),
+            (TypeEnum.STRING, TypeEnum.STRING),
+            (TypeEnum.BOOLEAN, TypeEnum.BOOLEAN),
+        ],
+    )
+    def test_get_comparator(self, left: TypeEnum, right: TypeEnum):
+        compare = Type.get_comparator(left, right, ComparisonOperandEnum.LT)
+        assert compare is Type.get_comparator(
+            left, right, ComparisonOperandEnum.LT
+        )
+        assert compare(1, 2)
+        assert not compare(2, 1)
+
+    def test_get_comparator_incomparable_types(self):
+        with pytest.raises(TypeError):
+            Type.get_comparator(
+                TypeEnum.INT, TypeEnum.STRING, ComparisonOperandEnum.EQ
+            )
+
+    def test_get_comparator_unsupported_operator(self):
+        with pytest.raises(ValueError):
+            Type.get_comparator(TypeEnum.INT, TypeEnum.INT, "<>")  # type: ignore
+
     def test_serialize(self):
         v = Value.create_int(42)
         assert IntType(TypeEnum.INT).serialize(v) == b"42"
@@ -49,3 +77,22 @@ class TestType:
         v2 = Value.create_string("5")
         with pytest.raises(TypeError, match="Values are not comparable"):
             IntType(TypeEnum.INT).max(v1, v2)
+
+    @pytest.mark.parametrize(
+        "type_id, raw, expected",
+        [
+            (TypeEnum.INT, "42", 42),
+            (TypeEnum.DECIMAL, "3.5", 3.5),
+            (TypeEnum.BOOLEAN, "TRUE", True),
+            (TypeEnum.BOOLEAN, "0", False),
+            (TypeEnum.STRING, "hello", "hello"),
+        ],
+    )
+    def test_parse(self, type_id: TypeEnum, raw: str, expected: object):
+        assert Type.get_instance(type_id).parse(raw) == expected
+
+    def test_parse_invalid(self):
+        with pytest.raises(ValueError, match="to integer"):
+            Type.get_instance(TypeEnum.INT).parse("abc")
+        with pytest.raises(ValueError, match="Boolean value format error"):
+            Type.get_instance(TypeEnum.BOOLEAN).parse("maybe")
@@ -111,3 +111,38 @@ class TestValue:
         v = Value.create_null_from_type_id(TypeEnum.INT)
         assert v.get_type_id() == TypeEnum.INT
         assert v.is_null()
+
+    def test_create_unchecked(self):
+        v = Value.create_unchecked(TypeEnum.STRING, "phone")
+        assert v == Value(TypeEnum.STRING, "phone")
+
+    @pytest.mark.parametrize(
+        "type_id, value",
+        [
+            (TypeEnum.INT, None),
+            (TypeEnum.STRING, None),
+            (TypeEnum.BOOLEAN, True),
+            (TypeEnum.BOOLEAN, False),
+            (TypeEnum.INT, -128),
+            (TypeEnum.INT, 0),
+            (TypeEnum.INT, 1024),
+        ],
+    )
+    def test_intern_shares_common_values(self, type_id, value):
+        v = Value.intern(type_id, value)
+        assert v is Value.intern(type_id, value)
+        assert v == Value(type_id, value)
+
+    @pytest.mark.parametrize(
+        "type_id, value",
+        [
+            (TypeEnum.INT, -129),
+            (TypeEnum.INT, 1025),
+            (TypeEnum.DECIMAL, 1.5),
+            (TypeEnum.STRING, "phone"),
+        ],
+    )
+    def test_intern_creates_other_values(self, type_id, value):
+        v = Value.intern(type_id, value)
+        assert v is not Value.intern(type_id, value)
+        assert v == Value(type_id, value)